@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Supersedes Relationship Detector - Python batch engine
+Same matching rules as supersedes-detector-bulk.js (same state and agency,
+earlier year within MAX_YEAR_DIFF, 33%+ of the title keywords found in the
+older title), run outside Airtable's script limits. Regulations are grouped
+by state and agency, and each group gets an inverted index from keyword to
+the titles containing it, so every regulation is scored against all of its
+candidates with one matrix product instead of re-extracting keywords pair by
+pair.
+
+Usage:
+    python supersedes_detector.py --csv ../../regulations-tracking/regulations_IMPORT_READY.csv
+    python supersedes_detector.py --airtable            # read, detect, write back
+    python supersedes_detector.py --airtable --dry-run  # report only
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Airtable field names, as in the JS CONFIG
+FIELDS = {
+    'REG_ID': 'Reg-ID',
+    'STATE': 'State',
+    'YEAR': 'Year',
+    'ISSUING_AGENCY': 'Issuing Agency Link',
+    'TITLE': 'Title',
+    'SUPERSEDES_DETECTION': 'Supersedes Detection',
+}
+# The CSV export names the agency instead of linking it
+CSV_AGENCY_FIELD = 'Agency Name (for linking)'
+
+MIN_KEYWORD_LENGTH = 4
+MATCH_PERCENTAGE = 0.33
+MAX_YEAR_DIFF = 5
+MAX_MATCHES_SHOWN = 10
+
+STOPWORDS = {
+    'the', 'and', 'or', 'of', 'to', 'for', 'in', 'on', 'at', 'by', 'with',
+    'from', 'into', 'through', 'during', 'including', 'until', 'against',
+    'among', 'throughout', 'despite', 'towards', 'upon', 'concerning',
+    'rule', 'rules', 'regulation', 'regulations', 'emergency', 'temporary',
+}
+WORD_PATTERN = re.compile(r"\b[a-z]+\b")
+
+# Airtable API: 10 records per update request, 5 requests per second per base
+AIRTABLE_BATCH_SIZE = 10
+AIRTABLE_REQUEST_INTERVAL = 0.2
+
+logger = logging.getLogger(__name__)
+
+
+def extract_keywords(title) -> List[str]:
+    """Meaningful title words (repeats kept, as the JS version counts them)"""
+    if not isinstance(title, str) or not title:
+        return []
+    return [word for word in WORD_PATTERN.findall(title.lower())
+            if len(word) >= MIN_KEYWORD_LENGTH and word not in STOPWORDS]
+
+
+def load_regulations_csv(path: Path) -> pd.DataFrame:
+    """Regulations from the import-ready CSV export, keyed by Reg-ID"""
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[''])
+    regulations = pd.DataFrame({
+        'record_id': df[FIELDS['REG_ID']],
+        'reg_id': df[FIELDS['REG_ID']],
+        'state': df[FIELDS['STATE']],
+        'agency': df[CSV_AGENCY_FIELD].str.strip().str.lower(),
+        'year': df[FIELDS['YEAR']],
+        'title': df[FIELDS['TITLE']],
+    })
+    return _normalize(regulations)
+
+
+def _airtable_session(api_key: str):
+    import requests
+
+    session = requests.Session()
+    session.headers['Authorization'] = f'Bearer {api_key}'
+    return session
+
+
+def load_regulations_airtable(api_key: str, base_id: str, table: str) -> pd.DataFrame:
+    """Regulations from the Airtable API (only the fields the detector reads)"""
+    session = _airtable_session(api_key)
+    url = f"https://api.airtable.com/v0/{base_id}/{table}"
+    fields = [FIELDS[key] for key in ('REG_ID', 'STATE', 'YEAR', 'ISSUING_AGENCY', 'TITLE')]
+
+    rows = []
+    offset = None
+    while True:
+        params = {'pageSize': 100, 'fields[]': fields}
+        if offset:
+            params['offset'] = offset
+        response = session.get(url, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(f"Airtable request failed: {response.text}")
+        data = response.json()
+        for record in data.get('records', []):
+            values = record['fields']
+            agency = values.get(FIELDS['ISSUING_AGENCY']) or []
+            rows.append({
+                'record_id': record['id'],
+                'reg_id': values.get(FIELDS['REG_ID']),
+                'state': values.get(FIELDS['STATE']),
+                # Linked record ids, compared like the JS version
+                'agency': agency[0] if agency else None,
+                'year': values.get(FIELDS['YEAR']),
+                'title': values.get(FIELDS['TITLE']),
+            })
+        offset = data.get('offset')
+        if not offset:
+            break
+        time.sleep(AIRTABLE_REQUEST_INTERVAL)
+
+    return _normalize(pd.DataFrame(rows, columns=['record_id', 'reg_id', 'state', 'agency', 'year', 'title']))
+
+
+def _normalize(regulations: pd.DataFrame) -> pd.DataFrame:
+    """Select values may arrive as {'name': ...}; years as text"""
+    for column in ('state', 'year'):
+        regulations[column] = regulations[column].map(
+            lambda value: value.get('name') if isinstance(value, dict) else value
+        )
+    # parseInt semantics: leading digits only
+    regulations['year'] = pd.to_numeric(
+        regulations['year'].astype(str).str.extract(r"^\s*(\d+)", expand=False), errors='coerce'
+    ).astype('Int64')
+    return regulations.reset_index(drop=True)
+
+
+def detect_group(group: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score every regulation of one state/agency against its older candidates
+
+    The group's inverted index maps each keyword to the titles containing it
+    (substring match, as calculateTitleMatch does). With keyword counts K
+    (regulation x keyword) and containment C (keyword x title), K @ C counts
+    matched keywords for every pair at once.
+
+    Returns:
+        One row per match: record_id, candidate_id, candidate_reg_id,
+        candidate_year, candidate_title, score
+    """
+    keyword_lists = [extract_keywords(title) for title in group['title']]
+    vocabulary = sorted({word for words in keyword_lists for word in words})
+    if not vocabulary:
+        return pd.DataFrame()
+
+    titles = group['title'].fillna('').str.lower()
+    # Inverted index: keyword -> titles containing it
+    containment = np.vstack([
+        titles.str.contains(word, regex=False).to_numpy() for word in vocabulary
+    ]).astype(np.float64)
+
+    position = {word: i for i, word in enumerate(vocabulary)}
+    counts = np.zeros((len(group), len(vocabulary)))
+    for row, words in enumerate(keyword_lists):
+        for word, count in Counter(words).items():
+            counts[row, position[word]] = count
+
+    totals = counts.sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = np.where(totals > 0, (counts @ containment) / totals, 0.0)
+
+    # Candidates: earlier year within range, with a title
+    years = group['year'].to_numpy(dtype=np.float64, na_value=np.nan)
+    current, candidate = years[:, None], years[None, :]
+    eligible = (candidate < current) & (candidate >= current - MAX_YEAR_DIFF)
+    eligible &= group['title'].notna().to_numpy()[None, :]
+
+    rows, cols = np.nonzero(eligible & (scores >= MATCH_PERCENTAGE))
+    return pd.DataFrame({
+        'record_id': group['record_id'].to_numpy()[rows],
+        'candidate_id': group['record_id'].to_numpy()[cols],
+        'candidate_reg_id': group['reg_id'].to_numpy()[cols],
+        'candidate_year': group['year'].to_numpy()[cols],
+        'candidate_title': group['title'].to_numpy()[cols],
+        'score': scores[rows, cols],
+    })
+
+
+def detect_supersedes(regulations: pd.DataFrame) -> pd.DataFrame:
+    """Potential supersedes matches across the whole corpus"""
+    complete = regulations.dropna(subset=['state', 'agency', 'year', 'title'])
+    skipped = len(regulations) - len(complete)
+    if skipped:
+        logger.info(f"⏭️ {skipped} regulations missing state, agency, year or title")
+
+    matches = [
+        detect_group(group)
+        for _, group in complete.groupby(['state', 'agency'], sort=False)
+        if group['year'].nunique() > 1
+    ]
+    matches = [match for match in matches if not match.empty]
+    if not matches:
+        return pd.DataFrame(columns=['record_id', 'candidate_id', 'candidate_reg_id',
+                                     'candidate_year', 'candidate_title', 'score'])
+    return pd.concat(matches, ignore_index=True)
+
+
+def detection_report(matches: pd.DataFrame, checked: Optional[date] = None) -> str:
+    """Supersedes Detection text for one regulation, as the JS version writes it"""
+    checked = checked or date.today()
+    matches = matches.sort_values(['score', 'candidate_year'], ascending=False)
+
+    report = f"Last checked: {checked.month}/{checked.day}/{checked.year}\n\n"
+    report += f"Found {len(matches)} potential supersedes relationship{'s' if len(matches) != 1 else ''}:\n\n"
+    for match in matches.head(MAX_MATCHES_SHOWN).itertuples(index=False):
+        confidence = 'HIGH' if match.score >= 0.75 else 'MEDIUM' if match.score >= 0.6 else 'LOW'
+        report += f"{confidence} CONFIDENCE:\n"
+        report += f"• {match.candidate_reg_id} (Year: {match.candidate_year})\n"
+        report += f"  Title: \"{match.candidate_title}\"\n"
+        report += f"  Match Score: {int(match.score * 100 + 0.5)}%\n\n"
+    if len(matches) > MAX_MATCHES_SHOWN:
+        report += f"... and {len(matches) - MAX_MATCHES_SHOWN} more potential matches\n\n"
+    report += ('Action: Review these suggestions and create manual links in the "Superseded By" '
+               'or "Supersedes" fields if confirmed.')
+    return report
+
+
+def detection_reports(matches: pd.DataFrame) -> Dict[str, str]:
+    """Report text per record with at least one match"""
+    checked = date.today()
+    return {record_id: detection_report(group, checked)
+            for record_id, group in matches.groupby('record_id', sort=False)}
+
+
+def write_airtable(reports: Dict[str, str], api_key: str, base_id: str, table: str):
+    """Write reports to the Supersedes Detection field, 10 records per request"""
+    session = _airtable_session(api_key)
+    url = f"https://api.airtable.com/v0/{base_id}/{table}"
+    items = list(reports.items())
+    for start in range(0, len(items), AIRTABLE_BATCH_SIZE):
+        batch = items[start:start + AIRTABLE_BATCH_SIZE]
+        response = session.patch(url, json={'records': [
+            {'id': record_id, 'fields': {FIELDS['SUPERSEDES_DETECTION']: text}}
+            for record_id, text in batch
+        ]})
+        if response.status_code != 200:
+            raise RuntimeError(f"Airtable update failed: {response.text}")
+        time.sleep(AIRTABLE_REQUEST_INTERVAL)
+    logger.info(f"📝 Updated {len(items)} records in {table}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect potential supersedes relationships between regulations")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", type=Path, help="Regulations export (regulations_IMPORT_READY.csv)")
+    source.add_argument("--airtable", action="store_true",
+                        help="Read from Airtable (AIRTABLE_API_KEY, AIRTABLE_BASE_ID) and write results back")
+    parser.add_argument("--table", default="Regulations", help="Airtable table (default: Regulations)")
+    parser.add_argument("--output", type=Path, help="Write matches to this CSV")
+    parser.add_argument("--dry-run", action="store_true", help="Don't write results back to Airtable")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    start = time.perf_counter()
+
+    if args.airtable:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(Path(__file__).resolve().parents[2] / "bigquery" / ".env")
+        except ImportError:
+            pass
+        api_key, base_id = os.getenv("AIRTABLE_API_KEY"), os.getenv("AIRTABLE_BASE_ID")
+        if not api_key or not base_id:
+            logger.error("❌ Set AIRTABLE_API_KEY and AIRTABLE_BASE_ID")
+            return 1
+        regulations = load_regulations_airtable(api_key, base_id, args.table)
+    else:
+        regulations = load_regulations_csv(args.csv)
+
+    logger.info(f"🔍 Checking {len(regulations)} regulations")
+    matches = detect_supersedes(regulations)
+    reports = detection_reports(matches)
+
+    by_id = regulations.set_index('record_id')['reg_id']
+    for record_id, group in matches.groupby('record_id', sort=False):
+        best = group['score'].max()
+        logger.info(f"✅ {by_id.get(record_id, record_id)}: {len(group)} matches (best {best * 100:.0f}%)")
+
+    if args.output:
+        matches.assign(reg_id=matches['record_id'].map(by_id)).to_csv(args.output, index=False)
+        logger.info(f"💾 Matches written to {args.output}")
+
+    if args.airtable and not args.dry_run and reports:
+        write_airtable(reports, api_key, base_id, args.table)
+
+    logger.info(f"📊 {len(reports)} of {len(regulations)} regulations have potential matches "
+                f"({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
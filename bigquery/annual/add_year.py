@@ -1,69 +1,245 @@
 #!/usr/bin/env python3
 """
-Annual Data Import Script - Add new year to BigQuery
+Annual Data Import Script - Add new year(s) to BigQuery
 Handles both raw archival and harmonized analytical import
+
+Usage:
+    python add_year.py --year 2025
+    python add_year.py --years 2019-2025      # or 2019,2021,2023-2025
+    python add_year.py --all                  # every yearly_configs/*.yaml
 """
 
 import argparse
 import logging
+import os
 import yaml
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent))
+
+from google.cloud import bigquery
 
+from shared.bq_clients import get_client
+from source_data import read_source_data, source_path
 from raw_archive import archive_year_raw
-from harmonized_import import import_year_harmonized
+from table_export import export_database_tables
+from harmonized_import import HARMONIZED_DATASET, import_year_harmonized, update_unified_views
+
+CONFIG_DIR = Path(__file__).parent.parent / "yearly_configs"
+
+
+def parse_years(spec: str) -> list:
+    """Parse '2019-2025', '2019,2021' or a mix of both into a sorted year list"""
+    years = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+            if start > end:
+                raise ValueError(f"Invalid year range: {part}")
+            years.update(range(start, end + 1))
+        elif part:
+            years.add(int(part))
+    return sorted(years)
+
+
+def configured_years() -> list:
+    """Years with a yearly_configs/YYYY.yaml file"""
+    return sorted(int(path.stem) for path in CONFIG_DIR.glob("*.yaml") if path.stem.isdigit())
+
+
+def load_config(year: int, config_file: str = None) -> tuple:
+    """Load the YAML config for a year, returning (path, config)"""
+    config_path = Path(__file__).parent / config_file if config_file else CONFIG_DIR / f"{year}.yaml"
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with open(config_path, 'r') as f:
+        return config_path, yaml.safe_load(f)
+
+
+def import_year(year: int, config: dict, args, client: bigquery.Client) -> bool:
+    """
+    Run the raw and harmonized imports for one year
+
+    The source is extracted once and the same frame is handed to both
+    branches, whose BigQuery loads run concurrently.
+
+    Returns:
+        True if the harmonized table was reloaded (views need refreshing)
+    """
+    logger = logging.getLogger(__name__)
+
+    run_raw = not args.harmonized_only and config.get('raw_import', {}).get('enabled', True)
+    run_harmonized = not args.raw_only and config.get('harmonized_import', {}).get('enabled', True)
+    if not (run_raw or run_harmonized):
+        return False
+
+    all_tables = config.get('raw_import', {}).get('all_tables') or {}
+    run_all_tables = run_raw and (args.all_tables or (
+        all_tables.get('enabled', False) if isinstance(all_tables, dict) else bool(all_tables)
+    ))
+    if run_all_tables and source_path(config).suffix.lower() not in ['.mdb', '.accdb']:
+        logger.info(f"⏭️ {year} source is not an Access database, skipping all-tables export")
+        run_all_tables = False
+
+    if run_all_tables and args.from_lake:
+        logger.info(f"⏭️ All-tables export needs the source database, skipped with --from-lake")
+        run_all_tables = False
+
+    df = read_source_data({**config, 'year': year}, from_lake=args.from_lake)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Raw import (archival)
+        raw_future = None
+        if run_raw:
+            logger.info(f"📦 Starting raw archival import for {year}...")
+            raw_future = executor.submit(archive_year_raw, year, config, client=client, df=df,
+                                         write_lake=not args.from_lake)
+
+        # Every other table of the database (lookups, topics)
+        tables_future = None
+        if run_all_tables:
+            logger.info(f"🗂️ Starting all-tables export for {year}...")
+            tables_future = executor.submit(
+                export_database_tables, year, config, client=client,
+                frames={config['metadata'].get('table_name'): df}
+            )
+
+        # Harmonized import (analytical)
+        harmonized_future = None
+        if run_harmonized:
+            logger.info(f"🔄 Starting harmonized import for {year}...")
+            # Views are refreshed once for all years after every import finishes
+            harmonized_future = executor.submit(
+                import_year_harmonized, year, config, force=args.force,
+                client=client, update_views=False, df=df
+            )
+
+        reloaded = False
+        if raw_future:
+            raw_future.result()
+            logger.info(f"✅ Raw import completed for {year}")
+        if tables_future:
+            tables_future.result()
+            logger.info(f"✅ All-tables export completed for {year}")
+        if harmonized_future:
+            reloaded = harmonized_future.result() is not None
+            logger.info(f"✅ Harmonized import completed for {year}")
+
+    return reloaded
+
 
 def main():
     parser = argparse.ArgumentParser(description="Import new year data to BigQuery")
-    parser.add_argument("--year", type=int, required=True, help="Year to import")
-    parser.add_argument("--config", help="Custom config file (optional)")
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--year", type=int, help="Year to import")
+    selection.add_argument("--years", help="Years to import, e.g. 2019-2025 or 2019,2021")
+    selection.add_argument("--all", action="store_true", help="Import every year in yearly_configs/")
+    parser.add_argument("--config", help="Custom config file (optional, single --year only)")
     parser.add_argument("--raw-only", action="store_true", help="Only raw import")
     parser.add_argument("--harmonized-only", action="store_true", help="Only harmonized import")
+    parser.add_argument("--all-tables", action="store_true",
+                        help="Also export every table of Access sources (see raw_import.all_tables)")
+    parser.add_argument("--from-lake", action="store_true",
+                        help="Read raw data from the local Parquet lake instead of the source file")
+    parser.add_argument("--force", action="store_true", help="Reload even if the harmonized data is unchanged")
+    parser.add_argument("--workers", type=int, default=4, help="Years imported in parallel (default: 4)")
     parser.add_argument("--verbose", action="store_true", help="Verbose logging")
-    
+
     args = parser.parse_args()
-    
+
     # Setup logging
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=level, format="%(asctime)s - %(levelname)s - %(message)s")
     logger = logging.getLogger(__name__)
-    
-    logger.info(f"🚀 Starting {args.year} data import...")
-    
-    # Load configuration
-    config_file = args.config or f"../yearly_configs/{args.year}.yaml"
-    config_path = Path(__file__).parent / config_file
-    
-    if not config_path.exists():
-        logger.error(f"❌ Configuration file not found: {config_path}")
-        return 1
-    
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
-    logger.info(f"📋 Loaded configuration: {config_path.name}")
-    
+
+    if args.config and not args.year:
+        parser.error("--config can only be used with --year")
+
     try:
-        # Raw import (archival)
-        if not args.harmonized_only and config.get('raw_import', {}).get('enabled', True):
-            logger.info(f"📦 Starting raw archival import for {args.year}...")
-            archive_year_raw(args.year, config)
-            logger.info(f"✅ Raw import completed")
-        
-        # Harmonized import (analytical)  
-        if not args.raw_only and config.get('harmonized_import', {}).get('enabled', True):
-            logger.info(f"🔄 Starting harmonized import for {args.year}...")
-            import_year_harmonized(args.year, config)
-            logger.info(f"✅ Harmonized import completed")
-            
-        logger.info(f"🎉 {args.year} import completed successfully!")
-        
-    except Exception as e:
-        logger.error(f"❌ Import failed: {e}")
+        if args.year:
+            years = [args.year]
+        elif args.years:
+            years = parse_years(args.years)
+        else:
+            years = configured_years()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not years:
+        logger.error("❌ No years to import")
         return 1
-    
+
+    logger.info(f"🚀 Starting import for {', '.join(str(year) for year in years)}...")
+
+    # Load every configuration before starting any work
+    configs = {}
+    for year in years:
+        try:
+            config_path, configs[year] = load_config(year, args.config)
+        except FileNotFoundError as e:
+            logger.error(f"❌ {e}")
+            return 1
+        logger.info(f"📋 Loaded configuration: {config_path.name}")
+
+    # One pooled client for every year's loads and the final view refresh
+    project_id = os.getenv("GCP_PROJECT_ID")
+    client = get_client(project_id)
+
+    start_time = datetime.now()
+    reloaded_years = []
+    failed_years = []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(years)))) as executor:
+        futures = {
+            year: executor.submit(import_year, year, configs[year], args, client)
+            for year in years
+        }
+        for year, future in futures.items():
+            try:
+                if future.result():
+                    reloaded_years.append(year)
+                logger.info(f"🎉 {year} import completed successfully!")
+            except Exception as e:
+                logger.error(f"❌ {year} import failed: {e}")
+                failed_years.append(year)
+
+    # Refresh views once per dataset for every reloaded year
+    datasets = {}
+    for year in reloaded_years:
+        dataset_id = configs[year].get('harmonized_import', {}).get('dataset', HARMONIZED_DATASET)
+        datasets.setdefault(dataset_id, []).append(year)
+
+    for dataset_id, dataset_years in datasets.items():
+        post_imports = [configs[year].get('post_import', {}) for year in dataset_years]
+        if not any(post_import.get('update_unified_view', True) for post_import in post_imports):
+            continue
+        try:
+            update_unified_views(
+                client, project_id, dataset_years, dataset_id=dataset_id,
+                refresh_materialized=any(
+                    post_import.get('refresh_materialized_table', True) for post_import in post_imports
+                ),
+                pack_flags=any(post_import.get('pack_policy_flags', False) for post_import in post_imports)
+            )
+        except Exception as e:
+            logger.error(f"❌ View refresh failed for {dataset_id}: {e}")
+            return 1
+
+    if not reloaded_years and not failed_years:
+        logger.info("⏭️ No harmonized tables changed, views left as they are")
+
+    duration = (datetime.now() - start_time).total_seconds()
+    logger.info(f"⏱️ Imported {len(years) - len(failed_years)}/{len(years)} years in {duration:.1f}s")
+
+    if failed_years:
+        logger.error(f"❌ Failed years: {failed_years}")
+        return 1
+
     return 0
 
 if __name__ == "__main__":
@@ -4,24 +4,58 @@ Harmonized Import - Apply field mapping and standardization
 Creates analytical dataset with consistent schema across years
 """
 
-import subprocess
 import pandas as pd
 import yaml
 from pathlib import Path
 from google.cloud import bigquery
 from dotenv import load_dotenv
 import os
+import sys
 import logging
 
+sys.path.append(str(Path(__file__).parent.parent))
+from etl.transformers.deduplicator import Deduplicator
+from shared.bigquery_utils import (
+    load_with_layout,
+    list_year_tables,
+    create_or_update_unified_view,
+    refresh_aggregate_cube,
+    refresh_materialized_table,
+    refresh_packed_flags,
+)
+from shared.bq_clients import get_client
+from shared.fingerprint import content_unchanged, save_digest, table_digest
+from source_data import read_source_data
+
 load_dotenv()
 
-def import_year_harmonized(year: int, config: dict):
-    """Import year's data with harmonization"""
+# Default for harmonized_import.dataset
+HARMONIZED_DATASET = "legislative_tracker_staging"
+
+def import_year_harmonized(year: int, config: dict, force: bool = False,
+                           client: bigquery.Client = None, update_views: bool = True,
+                           df: pd.DataFrame = None):
+    """Import year's data with harmonization
+
+    The load and view refresh are skipped when the harmonized content matches
+    the digest stored on the existing table, unless `force` is set.
+
+    Args:
+        year: Year being imported
+        config: Parsed yearly config
+        force: Reload even if the content is unchanged
+        client: BigQuery client to reuse (a new one is created if omitted)
+        update_views: Refresh views per the config's post_import settings;
+            batch imports turn this off and refresh once at the end
+        df: Source data already read by read_source_data (read here if omitted)
+
+    Returns:
+        Harmonized table id, or None if the content was unchanged and
+        nothing was loaded
+    """
     logger = logging.getLogger(__name__)
     
     # Get configuration
-    source_file = config['metadata']['source_file']
-    table_name = config['metadata'].get('table_name', 'Legislative Monitoring')
     harmonized_config = config.get('harmonized_import', {})
     
     # Load field mappings
@@ -36,54 +70,52 @@ def import_year_harmonized(year: int, config: dict):
     with open(mappings_path, 'r') as f:
         field_mappings = yaml.safe_load(f)
     
-    # Paths
-    data_path = base_path / "data" / source_file
-    
-    if not data_path.exists():
-        raise FileNotFoundError(f"Source file not found: {data_path}")
-    
-    logger.info(f"📁 Processing {data_path.name} with {mapping_name} mapping")
-    
-    # Export from mdb
-    csv_path = base_path / f"temp_harmonized_{year}.csv"
-    cmd = f'mdb-export "{data_path}" "{table_name}" > "{csv_path}"'
-    
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(f"mdb-export failed: {result.stderr}")
-    
-    # Load and harmonize
-    df = pd.read_csv(csv_path)
-    logger.info(f"📊 Loaded {len(df)} rows")
+    if df is None:
+        df = read_source_data(config)
+    logger.info(f"🔄 Harmonizing {len(df)} rows with {mapping_name} mapping")
     
     # Apply field mappings
     df_harmonized = harmonize_fields(df, field_mappings, year)
     logger.info(f"🔄 Harmonized to {len(df_harmonized.columns)} standard columns")
     
+    # Repeated bills would inflate every downstream count
+    df_harmonized, _ = Deduplicator(keep=harmonized_config.get('duplicates', 'latest')).deduplicate(df_harmonized)
+    
     # Upload to BigQuery (harmonized table)
     project_id = os.getenv("GCP_PROJECT_ID")
-    dataset_id = "legislative_tracker_staging" 
+    dataset_id = harmonized_config.get('dataset', HARMONIZED_DATASET)
     table_id = harmonized_config.get('table_name', f'historical_bills_{year}')
     
-    client = bigquery.Client(project=project_id)
+    client = client or get_client(project_id)
     full_table_id = f"{project_id}.{dataset_id}.{table_id}"
     
+    if not force and content_unchanged(client, full_table_id, df_harmonized):
+        logger.info(f"⏭️ {year} harmonized data unchanged, skipping load and view refresh")
+        return None
+    
     job_config = bigquery.LoadJobConfig(
         write_disposition="WRITE_TRUNCATE",
         autodetect=True
     )
     
-    job = client.load_table_from_dataframe(df_harmonized, full_table_id, job_config=job_config)
-    job.result()
+    # Optional partitioning/clustering from the year config
+    layout = {
+        key: harmonized_config[key] for key in ('partitioning', 'clustering_fields')
+        if harmonized_config.get(key)
+    }
+    load_with_layout(client, df_harmonized, full_table_id, job_config, layout)
+    save_digest(client, full_table_id, table_digest(df_harmonized))
     
     logger.info(f"🔄 Harmonized data imported to {full_table_id}")
     
     # Update views if requested
-    if config.get('post_import', {}).get('update_unified_view', True):
-        update_unified_views(client, project_id)
-    
-    # Cleanup
-    csv_path.unlink()
+    post_import = config.get('post_import', {})
+    if update_views and post_import.get('update_unified_view', True):
+        update_unified_views(
+            client, project_id, [year], dataset_id=dataset_id,
+            refresh_materialized=post_import.get('refresh_materialized_table', True),
+            pack_flags=post_import.get('pack_policy_flags', False)
+        )
     
     return full_table_id
 
@@ -91,8 +123,9 @@ def harmonize_fields(df: pd.DataFrame, mappings: dict, year: int) -> pd.DataFram
     """Apply field mappings to standardize column names and values"""
     df_harmonized = df.copy()
     
-    # Add year column
+    # Add year columns (data_year is the partitioning key downstream)
     df_harmonized['year'] = year
+    df_harmonized['data_year'] = year
     
     # Create reverse mapping
     reverse_map = {}
@@ -117,21 +150,38 @@ def apply_transformations(df: pd.DataFrame) -> pd.DataFrame:
     # Convert boolean flags (Access uses -1 for True, 0 for False)
     boolean_columns = ['positive_flag', 'negative_flag', 'neutral_flag', 'enacted_flag']
     for col in boolean_columns:
-        if col in df.columns:
+        if col in df.columns and not pd.api.types.is_bool_dtype(df[col]):
             df[col] = df[col].apply(lambda x: True if x == -1 else (False if x == 0 else None))
     
     # Convert dates
     date_columns = ['introduced_date', 'last_action_date', 'effective_date']
     for col in date_columns:
-        if col in df.columns:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
             df[col] = pd.to_datetime(df[col], errors='coerce')
     
     return df
 
-def update_unified_views(client: bigquery.Client, project_id: str):
-    """Update unified views to include new year"""
+def update_unified_views(client: bigquery.Client, project_id: str, years: list,
+                         refresh_materialized: bool = True, pack_flags: bool = False,
+                         dataset_id: str = HARMONIZED_DATASET):
+    """Update unified views to include new years
+
+    The view in `dataset_id` is redefined over every year table of that
+    dataset (the one the harmonized tables were loaded into); the
+    materialized table and the aggregate cube built from it only have the
+    partitions for `years` replaced. With `pack_flags` the bitmask-encoded
+    flag table is refreshed the same way.
+    """
     logger = logging.getLogger(__name__)
     
-    # This would update the unified view to include the new year
-    # Implementation depends on your view structure
+    all_years = list_year_tables(client, project_id, dataset_id)
+    create_or_update_unified_view(client, project_id, all_years, dataset_id=dataset_id)
+    
+    if refresh_materialized:
+        refresh_materialized_table(client, project_id, years=years,
+                                   dataset_id=dataset_id, source_dataset_id=dataset_id)
+        refresh_aggregate_cube(client, project_id, years=years, dataset_id=dataset_id)
+        if pack_flags:
+            refresh_packed_flags(client, project_id, years=years, dataset_id=dataset_id)
+    
     logger.info("🔄 Updated unified views")
@@ -2,59 +2,55 @@
 """
 Raw Archive Import - Preserve original database structure
 No field mapping, no harmonization, pure historical preservation
+Also written to the local Parquet lake (raw_lake/year=YYYY/)
 """
 
-import subprocess
 import pandas as pd
-from pathlib import Path
 from google.cloud import bigquery
 from dotenv import load_dotenv
 import os
+import sys
 import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.bq_clients import get_client
+from shared.job_manager import get_job_manager
+from shared.raw_lake import write_year
+from source_data import read_source_data
 
 load_dotenv()
 
-def archive_year_raw(year: int, config: dict):
-    """Archive year's data in original form"""
+def archive_year_raw(year: int, config: dict, client: bigquery.Client = None,
+                     df: pd.DataFrame = None, write_lake: bool = True):
+    """Archive year's data in original form
+
+    Args:
+        year: Year being imported
+        config: Parsed yearly config
+        client: BigQuery client to reuse (a new one is created if omitted)
+        df: Source data already read by read_source_data (read here if omitted)
+        write_lake: Also write the Parquet lake partition (off when df was
+            read from the lake)
+    """
     logger = logging.getLogger(__name__)
     
     # Get configuration
     source_file = config['metadata']['source_file']
-    table_name = config['metadata'].get('table_name', 'Legislative Monitoring')
     raw_config = config.get('raw_import', {})
     
-    # Paths
-    base_path = Path(__file__).parent.parent
-    data_path = base_path / "data" / source_file
-    
-    if not data_path.exists():
-        raise FileNotFoundError(f"Source file not found: {data_path}")
-    
-    logger.info(f"📁 Processing {data_path.name}")
-    
-    # Handle different file formats
-    if data_path.suffix.lower() in ['.mdb', '.accdb']:
-        # Export from Access database
-        csv_path = base_path / f"temp_raw_{year}.csv"
-        cmd = f'mdb-export "{data_path}" "{table_name}" > "{csv_path}"'
-        
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"mdb-export failed: {result.stderr}")
-        
-        df = pd.read_csv(csv_path)
-        # Cleanup temp file
-        csv_path.unlink()
-        
-    elif data_path.suffix.lower() == '.csv':
-        # Direct CSV import (Airtable exports, etc.)
-        df = pd.read_csv(data_path)
-        logger.info("📊 Direct CSV import (no mdb-export needed)")
-        
-    else:
-        raise ValueError(f"Unsupported file format: {data_path.suffix}")
-    
-    logger.info(f"📊 Loaded {len(df)} rows with {len(df.columns)} original columns")
+    if df is None:
+        df = read_source_data(config)
+
+    if write_lake and raw_config.get('parquet_lake', True):
+        lake_path = write_year(df, year, {
+            'source_file': source_file,
+            'source_table': config['metadata'].get('table_name'),
+        })
+        logger.info(f"🗄️ Raw data written to {lake_path}")
+
+    # The same frame may be feeding the harmonized import
+    df = df.copy()
     
     # Add metadata columns
     df['import_year'] = year
@@ -66,7 +62,7 @@ def archive_year_raw(year: int, config: dict):
     dataset_id = "legislative_tracker_staging"  # Raw data goes to staging
     table_id = raw_config.get('table_name', f'raw_historical_{year}')
     
-    client = bigquery.Client(project=project_id)
+    client = client or get_client(project_id)
     full_table_id = f"{project_id}.{dataset_id}.{table_id}"
     
     job_config = bigquery.LoadJobConfig(
@@ -74,12 +70,8 @@ def archive_year_raw(year: int, config: dict):
         autodetect=True
     )
     
-    job = client.load_table_from_dataframe(df, full_table_id, job_config=job_config)
-    job.result()  # Wait for completion
+    get_job_manager(client).run_load(df, full_table_id, job_config=job_config)
     
     logger.info(f"📦 Raw data archived to {full_table_id}")
     
-    # Cleanup
-    csv_path.unlink()
-    
     return full_table_id
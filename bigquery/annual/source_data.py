@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Source extraction shared by the raw and harmonized imports
+The year's source file is read once and the same frame feeds both branches
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+import logging
+
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.access_reader import open_database
+from shared import raw_lake
+
+
+def source_path(config: dict) -> Path:
+    """Location of the year's source file under bigquery/data/"""
+    return Path(__file__).parent.parent / "data" / config['metadata']['source_file']
+
+
+def read_source_data(config: dict, from_lake: bool = False) -> pd.DataFrame:
+    """
+    Read the year's source table (Access database or CSV export) into a DataFrame
+
+    Args:
+        config: Parsed yearly config
+        from_lake: Read the raw Parquet lake partition instead of the source
+            file (no mdbtools, no BigQuery)
+    """
+    logger = logging.getLogger(__name__)
+    
+    if from_lake:
+        df = raw_lake.read_year(config['year'])
+        logger.info(f"🗄️ Loaded {len(df)} rows with {len(df.columns)} original columns from the raw lake")
+        return df
+    
+    data_path = source_path(config)
+    table_name = config['metadata'].get('table_name', 'Legislative Monitoring')
+    
+    if not data_path.exists():
+        raise FileNotFoundError(f"Source file not found: {data_path}")
+    
+    logger.info(f"📁 Processing {data_path.name}")
+    
+    # Handle different file formats
+    if data_path.suffix.lower() in ['.mdb', '.accdb']:
+        # Read the Access table in-process (typed columns, no CSV round-trip)
+        df = open_database(data_path).read_table(table_name)
+        
+    elif data_path.suffix.lower() == '.csv':
+        # Direct CSV import (Airtable exports, etc.)
+        df = pd.read_csv(data_path)
+        logger.info("📊 Direct CSV import (no mdb-export needed)")
+        
+    else:
+        raise ValueError(f"Unsupported file format: {data_path.suffix}")
+    
+    logger.info(f"📊 Loaded {len(df)} rows with {len(df.columns)} original columns")
+    return df
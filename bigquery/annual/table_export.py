@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+All-Tables Export - Archive every table of a year's Access database
+The primary bills table is archived by raw_archive; this exports the lookup
+and topic tables alongside it. The file is opened once, tables are read and
+loaded in parallel into a per-year staging dataset, and each table is cached
+locally as Parquet with one manifest per database.
+
+Usage:
+    python table_export.py --year 2019
+    python table_export.py --year 2019 --pattern "topic|lookup" --no-load
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import yaml
+from dotenv import load_dotenv
+from google.cloud import bigquery
+
+sys.path.append(str(Path(__file__).parent.parent))
+from shared.access_reader import open_database
+from shared.bq_clients import get_client
+from shared.fingerprint import content_unchanged, save_digest, table_digest
+from shared.job_manager import get_job_manager
+from source_data import source_path
+
+load_dotenv()
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".table_cache"
+MANIFEST_FILE = "manifest.json"
+
+
+def bigquery_name(name: str) -> str:
+    """Table name usable in BigQuery ('Topic Lookup' -> 'topic_lookup')"""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name).strip("_").lower()
+
+
+def file_key(path: Path) -> str:
+    """Identifies one version of a database file (name, size and mtime)"""
+    stat = path.stat()
+    return hashlib.sha256(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def export_database_tables(year: int, config: dict, client: bigquery.Client = None,
+                           pattern: str = None, workers: int = 4, load: bool = True,
+                           frames: dict = None) -> dict:
+    """
+    Export all (or pattern-selected) tables of a year's database
+
+    Args:
+        year: Year being imported
+        config: Parsed yearly config (raw_import.all_tables holds the
+            pattern and dataset defaults)
+        client: BigQuery client to reuse
+        pattern: Regex selecting tables (overrides the config)
+        workers: Tables exported at once
+        load: Load tables to BigQuery (False only fills the local cache)
+        frames: Tables already read by the caller, e.g. the primary table
+
+    Returns:
+        The manifest, also written to the cache directory
+    """
+    logger = logging.getLogger(__name__)
+
+    settings = config.get('raw_import', {}).get('all_tables') or {}
+    if not isinstance(settings, dict):
+        settings = {}
+    pattern = pattern or settings.get('pattern')
+    frames = frames or {}
+
+    data_path = source_path(config)
+    if data_path.suffix.lower() not in ['.mdb', '.accdb']:
+        raise ValueError(f"All-tables export needs an Access database, got {data_path.name}")
+
+    database = open_database(data_path)
+    tables = database.select_tables(pattern)
+    logger.info(f"🗂️ Exporting {len(tables)} tables from {data_path.name}")
+
+    cache_root = Path(os.getenv("MDB_TABLE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+    cache_dir = cache_root / str(year) / file_key(data_path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    project_id = os.getenv("GCP_PROJECT_ID")
+    dataset_id = settings.get('dataset', f"legislative_tracker_staging_{year}")
+    if load:
+        client = client or get_client(project_id)
+        client.create_dataset(f"{project_id}.{dataset_id}", exists_ok=True)
+        jobs = get_job_manager(client)
+
+    def export_table(table: str) -> dict:
+        cache_path = cache_dir / f"{bigquery_name(table)}.parquet"
+        cached = cache_path.exists()
+        if table in frames:
+            df = frames[table]
+        elif cached:
+            df = pd.read_parquet(cache_path)
+        else:
+            df = database.read_table(table)
+        if not cached:
+            try:
+                df.to_parquet(cache_path, index=False)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not cache {table}: {e}")
+
+        entry = {
+            'rows': len(df),
+            'columns': database.schema(table),
+            'digest': table_digest(df),
+            'cache_file': cache_path.name,
+            'cached': cached,
+            'loaded': False,
+        }
+
+        if load:
+            full_table_id = f"{project_id}.{dataset_id}.raw_{bigquery_name(table)}"
+            entry['table_id'] = full_table_id
+            if not content_unchanged(client, full_table_id, df):
+                job_config = bigquery.LoadJobConfig(write_disposition="WRITE_TRUNCATE", autodetect=True)
+                jobs.run_load(df, full_table_id, job_config=job_config)
+                save_digest(client, full_table_id, entry['digest'])
+                entry['loaded'] = True
+
+        logger.info(f"  📄 {table}: {len(df):,} rows{' (cached)' if cached else ''}"
+                    f"{' → loaded' if entry['loaded'] else ''}")
+        return entry
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tables) or 1))) as executor:
+        entries = dict(zip(tables, executor.map(export_table, tables)))
+
+    manifest = {
+        'year': year,
+        'source_file': data_path.name,
+        'file_key': cache_dir.name,
+        'reader': database.backend,
+        'pattern': pattern,
+        'dataset': dataset_id if load else None,
+        'exported_at': datetime.now().isoformat(timespec='seconds'),
+        'tables': entries,
+    }
+    with open(cache_dir / MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    loaded = sum(entry['loaded'] for entry in entries.values())
+    logger.info(f"🗂️ {len(tables)} tables exported ({loaded} loaded), manifest: {cache_dir / MANIFEST_FILE}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every table of a year's Access database")
+    parser.add_argument("--year", type=int, required=True, help="Year to export")
+    parser.add_argument("--pattern", help="Regex selecting tables (default: all)")
+    parser.add_argument("--workers", type=int, default=4, help="Tables exported in parallel (default: 4)")
+    parser.add_argument("--no-load", action="store_true", help="Only extract to the local cache")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    config_path = Path(__file__).parent.parent / "yearly_configs" / f"{args.year}.yaml"
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    export_database_tables(args.year, config, pattern=args.pattern,
+                           workers=args.workers, load=not args.no_load)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
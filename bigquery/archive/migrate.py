@@ -13,7 +13,7 @@ Usage:
     python migrate.py --looker-only      # Create just Looker table
 
 Prerequisites:
-    1. brew install mdbtools
+    1. pip install access_parser (or brew install mdbtools)
     2. pip install -r requirements.txt  
     3. gcloud auth application-default login
     4. Configure .env file with GCP_PROJECT_ID
@@ -24,7 +24,6 @@ import argparse
 import logging
 import os
 import re
-import subprocess
 import sys
 from datetime import datetime, date
 from pathlib import Path
@@ -36,13 +35,43 @@ from dotenv import load_dotenv
 from google.cloud import bigquery
 from google.cloud import exceptions as google_exceptions
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from etl.transformers.deduplicator import KEEP_OPTIONS, Deduplicator
+from shared.bigquery_utils import (
+    YEAR_TABLE_LAYOUT,
+    YEAR_TABLE_PATTERN,
+    load_with_layout,
+    refresh_aggregate_cube,
+    refresh_materialized_table,
+)
+from shared.access_reader import mdbtools_available, native_reader_available, open_database
+from shared.ddl_graph import run_statements
+from shared.bq_clients import get_client
+from shared.job_manager import get_job_manager
+from shared.fingerprint import VOLATILE_COLUMNS, content_unchanged, save_digest, table_digest
+from shared.query_runner import QueryRunner, QueryBudgetExceeded, format_bytes
+from shared.view_sql import (
+    analytics_statements,
+    comprehensive_view_sql,
+    raw_data_tracking_view_sql,
+    unified_view_sql,
+)
+
 
 class GuttmacherMigration:
     """Complete historical data migration pipeline."""
 
-    def __init__(self):
-        """Initialize the migration."""
+    def __init__(self, force: bool = False, duplicates: str = "latest"):
+        """Initialize the migration.
+
+        Args:
+            force: Reload year tables even when their content is unchanged
+            duplicates: How repeated state/bill_number/year rows are resolved
+                ('latest', 'first' or 'error' to fail the year)
+        """
         self.base_path = Path(__file__).parent
+        self.force = force
+        self.deduplicator = Deduplicator(keep=duplicates)
 
         # Search for .env file in multiple locations
         env_found = False
@@ -67,7 +96,11 @@ class GuttmacherMigration:
                 "Please set correct value in bigquery/.env file"
             )
 
-        self.bq_client = bigquery.Client(project=self.project_id)
+        self.bq_client = get_client(self.project_id)
+        # Bounded, retrying submission for every load and query job
+        self.jobs = get_job_manager(self.bq_client)
+        # Dry-runs each DDL statement and tracks bytes billed
+        self.query_runner = QueryRunner(self.bq_client)
 
         # Search for data directory in multiple locations
         data_found = False
@@ -92,6 +125,8 @@ class GuttmacherMigration:
             "files_processed": 0,
             "total_bills": 0,
             "years_processed": [],
+            "years_unchanged": [],
+            "duplicates_removed": 0,
             "errors": [],
             "field_mappings_applied": 0
         }
@@ -140,15 +175,13 @@ class GuttmacherMigration:
         """Validate migration prerequisites."""
         self.logger.info("🔍 Validating migration setup...")
         
-        # Check mdbtools
-        try:
-            result = subprocess.run(["mdb-tables", "--help"], capture_output=True, text=True, check=False)
-            if result.returncode != 0:
-                self.logger.error("❌ mdbtools not working. Install: brew install mdbtools")
-                return False
+        # Check for an Access reader
+        if native_reader_available():
+            self.logger.info("✅ Native Access reader available (access_parser)")
+        elif mdbtools_available():
             self.logger.info("✅ mdbtools available")
-        except FileNotFoundError:
-            self.logger.error("❌ mdbtools not found. Install: brew install mdbtools")
+        else:
+            self.logger.error("❌ No Access reader found. Install: pip install access_parser (or brew install mdbtools)")
             return False
 
         # Check BigQuery access
@@ -210,12 +243,9 @@ class GuttmacherMigration:
     def get_tables_from_db(self, db_path: Path) -> List[str]:
         """Get list of tables from database file."""
         try:
-            result = subprocess.run(["mdb-tables", "-1", str(db_path)], 
-                                  capture_output=True, text=True, timeout=30, check=False)
-            if result.returncode != 0:
-                return []
-            return [t.strip() for t in result.stdout.strip().split("\n") if t.strip()]
-        except subprocess.TimeoutExpired:
+            return open_database(db_path).tables()
+        except Exception as e:
+            self.logger.error("❌ Could not list tables in %s: %s", db_path.name, e)
             return []
 
     def find_primary_table(self, tables: List[str]) -> Optional[str]:
@@ -230,13 +260,9 @@ class GuttmacherMigration:
     def export_table_to_dataframe(self, db_path: Path, table: str) -> Optional[pd.DataFrame]:
         """Export table to DataFrame."""
         try:
-            result = subprocess.run(["mdb-export", str(db_path), table],
-                                  capture_output=True, text=True, timeout=120, check=False)
-            if result.returncode == 0 and result.stdout.strip():
-                from io import StringIO
-                df = pd.read_csv(StringIO(result.stdout), low_memory=False)
-                return None if df.empty else df
-            return None
+            # Reuses the database opened by get_tables_from_db
+            df = open_database(db_path).read_table(table)
+            return None if df.empty else df
         except Exception:
             return None
 
@@ -320,15 +346,15 @@ class GuttmacherMigration:
         df_clean.columns = [re.sub(r"[^a-zA-Z0-9_]", "_", str(col)).strip("_").lower() 
                            for col in df_clean.columns]
         
-        # Handle date fields
+        # Handle date fields (already typed when read with the table schema)
         date_fields = ['last_action_date', 'introduced_date', 'enacted_date', 'vetoed_date']
         for col in date_fields:
-            if col in df_clean.columns:
+            if col in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean[col]):
                 df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
 
         datetime_fields = ['date_last_updated']
         for col in datetime_fields:
-            if col in df_clean.columns:
+            if col in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean[col]):
                 df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
 
         # Clean string fields (force bill_number to string regardless of input type)
@@ -341,19 +367,26 @@ class GuttmacherMigration:
         
         for col in string_fields:
             if col in df_clean.columns:
-                # Always convert to string, handling float64 NaN properly
-                df_clean[col] = df_clean[col].astype(str).str.strip()
-                df_clean[col] = df_clean[col].replace(['nan', 'None', ''], None)
+                # Convert to string unless read as text, handling float64 NaN properly
+                if not pd.api.types.is_string_dtype(df_clean[col]):
+                    df_clean[col] = df_clean[col].astype(str)
+                df_clean[col] = df_clean[col].str.strip()
+                df_clean[col] = df_clean[col].replace(['nan', 'None', '<NA>', ''], None)
 
         # Ensure boolean fields
         boolean_fields = [k for k, v in self.field_mappings.get('bigquery_types', {}).items() 
                          if v == 'BOOLEAN']
         for col in boolean_fields:
-            if col in df_clean.columns:
+            if col in df_clean.columns and not pd.api.types.is_bool_dtype(df_clean[col]):
                 df_clean[col] = df_clean[col].astype(bool)
 
         return df_clean
 
+    def _bigquery_schema(self, df: pd.DataFrame) -> List[bigquery.SchemaField]:
+        """Schema for a harmonized DataFrame from the configured column types."""
+        bigquery_types = self.field_mappings.get('bigquery_types', {})
+        return [bigquery.SchemaField(col, bigquery_types.get(col, 'STRING')) for col in df.columns]
+
     def load_to_bigquery(self, df: pd.DataFrame, table_name: str) -> bool:
         """Load DataFrame to BigQuery."""
         if df.empty:
@@ -361,27 +394,175 @@ class GuttmacherMigration:
 
         table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
         
-        # Create schema
-        schema = []
-        for col in df.columns:
-            bq_type = self.field_mappings.get('bigquery_types', {}).get(col, 'STRING')
-            schema.append(bigquery.SchemaField(col, bq_type))
-
         job_config = bigquery.LoadJobConfig(
             write_disposition="WRITE_TRUNCATE",
-            schema=schema,
+            schema=self._bigquery_schema(df),
             create_disposition="CREATE_IF_NEEDED"
         )
 
         try:
-            job = self.bq_client.load_table_from_dataframe(df, table_id, job_config=job_config)
-            job.result(timeout=300)
+            # Partition by data_year and cluster by state for Looker filters
+            load_with_layout(self.bq_client, df, table_id, job_config, YEAR_TABLE_LAYOUT, timeout=300)
+            # Fingerprint lets the next run skip an identical reload
+            save_digest(self.bq_client, table_id, table_digest(df))
             self.logger.info("✅ Loaded %d rows to %s", len(df), table_name)
             return True
         except google_exceptions.GoogleCloudError as e:
             self.logger.error("❌ Failed to load %s: %s", table_name, e)
             return False
 
+    @staticmethod
+    def _bill_key_sql(alias: str) -> str:
+        """unique_bill_key expression, matching the Looker view definition."""
+        return f"CONCAT({alias}.state, '-', {alias}.bill_number, '-', CAST({alias}.data_year AS STRING))"
+
+    @staticmethod
+    def _row_hash_sql(alias: str, columns: List[str]) -> str:
+        """FARM_FINGERPRINT over a row's content columns."""
+        fields = ", ".join(f"{alias}.{col}" for col in columns)
+        return f"FARM_FINGERPRINT(TO_JSON_STRING(STRUCT({fields})))"
+
+    def delta_load_to_bigquery(self, df: pd.DataFrame, table_name: str) -> Optional[Dict[str, Any]]:
+        """Apply only inserted, updated and deleted bills to an existing year table.
+
+        The new data is loaded to a temporary staging table and compared with
+        the current table by unique_bill_key (state-bill_number-year) and a
+        hash of the content columns. Only changed rows are written, via MERGE.
+
+        Returns:
+            Change report with inserted/updated/deleted/unchanged counts and
+            the affected keys, or None when a delta can't be applied safely
+            (missing table, schema change, missing or duplicate keys) and the
+            caller should replace the table instead
+        """
+        table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
+        staging_id = f"{table_id}__delta"
+
+        try:
+            target = self.bq_client.get_table(table_id)
+        except google_exceptions.NotFound:
+            return None
+
+        if [field.name for field in target.schema] != list(df.columns):
+            self.logger.warning("Schema of %s changed, delta load not possible", table_name)
+            return None
+
+        keys = df['state'].astype('string') + '-' + df['bill_number'].astype('string') + '-' + df['data_year'].astype('string')
+        if keys.isna().any() or keys.duplicated().any():
+            self.logger.warning(
+                "%d missing and %d duplicate bill keys in new data, delta load not possible",
+                keys.isna().sum(), keys.duplicated().sum()
+            )
+            return None
+
+        columns = list(df.columns)
+        content_columns = [col for col in columns if col not in VOLATILE_COLUMNS]
+
+        job_config = bigquery.LoadJobConfig(
+            write_disposition="WRITE_TRUNCATE",
+            schema=self._bigquery_schema(df),
+            create_disposition="CREATE_IF_NEEDED"
+        )
+
+        try:
+            self.jobs.run_load(df, staging_id, job_config=job_config, timeout=300)
+
+            changes_sql = f"""
+            WITH new_rows AS (
+              SELECT {self._bill_key_sql('s')} AS bill_key, {self._row_hash_sql('s', content_columns)} AS row_hash
+              FROM `{staging_id}` s
+            ),
+            current_rows AS (
+              SELECT {self._bill_key_sql('t')} AS bill_key, {self._row_hash_sql('t', content_columns)} AS row_hash
+              FROM `{table_id}` t
+            )
+            SELECT
+              COALESCE(n.bill_key, c.bill_key) AS bill_key,
+              CASE
+                WHEN c.bill_key IS NULL THEN 'inserted'
+                WHEN n.bill_key IS NULL THEN 'deleted'
+                ELSE 'updated'
+              END AS change
+            FROM new_rows n
+            FULL OUTER JOIN current_rows c ON n.bill_key = c.bill_key
+            WHERE n.bill_key IS NULL OR c.bill_key IS NULL OR n.row_hash != c.row_hash
+            """
+            changes = self.query_runner.run(changes_sql, label=f"{table_name} change report").to_dataframe()
+
+            if changes['bill_key'].isna().any():
+                self.logger.warning("Current %s has rows without a bill key, delta load not possible", table_name)
+                return None
+
+            report = {
+                change: sorted(changes.loc[changes['change'] == change, 'bill_key'])
+                for change in ('inserted', 'updated', 'deleted')
+            }
+            summary = {change: len(bill_keys) for change, bill_keys in report.items()}
+            summary['unchanged'] = len(df) - summary['inserted'] - summary['updated']
+            summary['keys'] = report
+
+            if summary['inserted'] or summary['updated'] or summary['deleted']:
+                assignments = ", ".join(f"{col} = S.{col}" for col in columns)
+                column_list = ", ".join(columns)
+                merge_sql = f"""
+                MERGE `{table_id}` T
+                USING (
+                  SELECT s.*, {self._bill_key_sql('s')} AS bill_key
+                  FROM `{staging_id}` s
+                  WHERE {self._bill_key_sql('s')} IN UNNEST(@changed_keys)
+                ) S
+                ON {self._bill_key_sql('T')} = S.bill_key
+                WHEN MATCHED THEN
+                  UPDATE SET {assignments}
+                WHEN NOT MATCHED BY TARGET THEN
+                  INSERT ({column_list}) VALUES ({", ".join(f"S.{col}" for col in columns)})
+                WHEN NOT MATCHED BY SOURCE AND {self._bill_key_sql('T')} IN UNNEST(@deleted_keys) THEN
+                  DELETE
+                """
+                merge_config = bigquery.QueryJobConfig(query_parameters=[
+                    bigquery.ArrayQueryParameter("changed_keys", "STRING", report['inserted'] + report['updated']),
+                    bigquery.ArrayQueryParameter("deleted_keys", "STRING", report['deleted']),
+                ])
+                self.query_runner.run(merge_sql, job_config=merge_config, timeout=300,
+                                      label=f"{table_name} delta merge")
+                save_digest(self.bq_client, table_id, table_digest(df))
+
+        except (google_exceptions.GoogleCloudError, QueryBudgetExceeded) as e:
+            self.logger.error("❌ Delta load of %s failed: %s", table_name, e)
+            return None
+        finally:
+            # Also after a failed MERGE; a cleanup error must not hide the original one
+            try:
+                self.bq_client.delete_table(staging_id, not_found_ok=True)
+            except google_exceptions.GoogleCloudError as e:
+                self.logger.warning("Could not drop %s: %s", staging_id, e)
+
+        self.log_change_report(table_name, summary)
+        return summary
+
+    def log_change_report(self, table_name: str, summary: Dict[str, Any], sample: int = 10):
+        """Log delta counts and a sample of the affected bill keys."""
+        self.logger.info(
+            "📝 %s: %d inserted, %d updated, %d deleted, %d unchanged",
+            table_name, summary['inserted'], summary['updated'],
+            summary['deleted'], summary['unchanged']
+        )
+        for change, keys in summary['keys'].items():
+            if keys:
+                more = f" (+{len(keys) - sample} more)" if len(keys) > sample else ""
+                self.logger.info("   %s: %s%s", change, ", ".join(keys[:sample]), more)
+
+    def is_unchanged(self, df: pd.DataFrame, table_name: str) -> bool:
+        """Check whether a year table already holds this harmonized content."""
+        if self.force:
+            return False
+        table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
+        try:
+            return content_unchanged(self.bq_client, table_id, df)
+        except google_exceptions.GoogleCloudError as e:
+            self.logger.warning("Could not read fingerprint for %s: %s", table_name, e)
+            return False
+
     def process_db_file(self, db_path: Path) -> bool:
         """Process a single database file."""
         year = self.extract_year_from_filename(db_path)
@@ -408,8 +589,14 @@ class GuttmacherMigration:
         try:
             df_harmonized = self.harmonize_schema(df, year)
             df_clean = self.clean_dataframe_for_bigquery(df_harmonized)
+            df_clean, duplicates = self.deduplicator.deduplicate(df_clean)
+            self.stats["duplicates_removed"] += duplicates['removed']
             
             table_name = f"historical_bills_{year}"
+            if self.is_unchanged(df_clean, table_name):
+                self.stats["years_unchanged"].append(year)
+                return True
+
             if self.load_to_bigquery(df_clean, table_name):
                 self.stats["files_processed"] += 1
                 self.stats["years_processed"].append(year)
@@ -421,17 +608,25 @@ class GuttmacherMigration:
 
         return False
 
-    def create_unified_view(self):
-        """Create unified view and table of all historical data."""
+    def create_unified_view(self, years: Optional[List[int]] = None):
+        """Create unified view and table of all historical data.
+
+        Args:
+            years: Years whose partitions changed; the materialized table is
+                rebuilt in full when omitted
+        """
         self.logger.info("🔗 Creating unified historical view and table...")
         
+        # Only year tables: __layout_migration copies left by a failed load
+        # or __delta staging tables of an interrupted delta run would
+        # otherwise be unioned in and double every bill
         query = f"""
         SELECT table_name FROM `{self.project_id}.{self.dataset_id}.INFORMATION_SCHEMA.TABLES`
-        WHERE table_name LIKE 'historical_bills_%' ORDER BY table_name
+        WHERE REGEXP_CONTAINS(table_name, r'{YEAR_TABLE_PATTERN.pattern}') ORDER BY table_name
         """
         
         try:
-            results = self.bq_client.query(query).result()
+            results = self.jobs.run_query(query, label="list year tables").result()
             tables = [row.table_name for row in results]
         except google_exceptions.GoogleCloudError as e:
             self.logger.error("Failed to list tables: %s", e)
@@ -440,356 +635,126 @@ class GuttmacherMigration:
         if not tables:
             return
 
-        union_parts = [f"SELECT * FROM `{self.project_id}.{self.dataset_id}.{table}`" for table in tables]
-        
         # Create view first (for compatibility)
-        create_view_sql = f"""
-        CREATE OR REPLACE VIEW `{self.project_id}.{self.dataset_id}.all_historical_bills_unified` AS
-        {' UNION ALL '.join(union_parts)}
-        """
+        create_view_sql = unified_view_sql(self.project_id, self.dataset_id, tables)
 
         try:
-            job = self.bq_client.query(create_view_sql)
-            job.result()
+            self.query_runner.run(create_view_sql, label="all_historical_bills_unified")
             self.logger.info("✅ Created unified view: all_historical_bills_unified")
-        except google_exceptions.GoogleCloudError as e:
+        except (google_exceptions.GoogleCloudError, QueryBudgetExceeded) as e:
             self.logger.error("Failed to create unified view: %s", e)
             return
             
-        # Create materialized table for better Looker performance
-        create_table_sql = f"""
-        CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.all_historical_bills_materialized` 
-        CLUSTER BY (state, data_year) AS
-        {' UNION ALL '.join(union_parts)}
-        """
-
+        # Materialized table for better Looker performance, partitioned by
+        # data_year so only changed years are rewritten
         try:
-            job = self.bq_client.query(create_table_sql)
-            job.result(timeout=600)  # Longer timeout for large table creation
+            refresh_materialized_table(
+                self.bq_client, self.project_id, years=years,
+                dataset_id=self.dataset_id, source_dataset_id=self.dataset_id
+            )
             self.logger.info("✅ Created materialized table: all_historical_bills_materialized")
         except google_exceptions.GoogleCloudError as e:
             self.logger.error("Failed to create materialized table: %s", e)
+            return
+
+        # Dashboard rollups, read from the materialized table
+        try:
+            refresh_aggregate_cube(self.bq_client, self.project_id, years=years, dataset_id=self.dataset_id)
+            self.logger.info("✅ Created aggregate cube: bill_aggregate_cube")
+        except google_exceptions.GoogleCloudError as e:
+            self.logger.error("Failed to create aggregate cube: %s", e)
+
+    def looker_view_sql(self) -> str:
+        """DDL for the authentic comprehensive view."""
+        return comprehensive_view_sql(self.project_id, self.dataset_id)
 
     def create_looker_table(self):
         """Create authentic comprehensive view that preserves NULL patterns."""
         self.logger.info("🔄 Creating authentic comprehensive view...")
         
-        create_table_sql = f"""
-        CREATE OR REPLACE VIEW `{self.project_id}.{self.dataset_id}.comprehensive_bills_authentic` AS
-        WITH enhanced_bills AS (
-          SELECT 
-            id,
-            CONCAT(state, '-', bill_number, '-', data_year) as unique_bill_key,
-            data_year,
-            CAST(data_year AS STRING) as data_year_str,
-            state as state_code,
-            CASE state
-              WHEN 'AL' THEN 'Alabama' WHEN 'AK' THEN 'Alaska' WHEN 'AZ' THEN 'Arizona'
-              WHEN 'AR' THEN 'Arkansas' WHEN 'CA' THEN 'California' WHEN 'CO' THEN 'Colorado'
-              WHEN 'CT' THEN 'Connecticut' WHEN 'DE' THEN 'Delaware' WHEN 'FL' THEN 'Florida'
-              WHEN 'GA' THEN 'Georgia' WHEN 'HI' THEN 'Hawaii' WHEN 'ID' THEN 'Idaho'
-              WHEN 'IL' THEN 'Illinois' WHEN 'IN' THEN 'Indiana' WHEN 'IA' THEN 'Iowa'
-              WHEN 'KS' THEN 'Kansas' WHEN 'KY' THEN 'Kentucky' WHEN 'LA' THEN 'Louisiana'
-              WHEN 'ME' THEN 'Maine' WHEN 'MD' THEN 'Maryland' WHEN 'MA' THEN 'Massachusetts'
-              WHEN 'MI' THEN 'Michigan' WHEN 'MN' THEN 'Minnesota' WHEN 'MS' THEN 'Mississippi'
-              WHEN 'MO' THEN 'Missouri' WHEN 'MT' THEN 'Montana' WHEN 'NE' THEN 'Nebraska'
-              WHEN 'NV' THEN 'Nevada' WHEN 'NH' THEN 'New Hampshire' WHEN 'NJ' THEN 'New Jersey'
-              WHEN 'NM' THEN 'New Mexico' WHEN 'NY' THEN 'New York' WHEN 'NC' THEN 'North Carolina'
-              WHEN 'ND' THEN 'North Dakota' WHEN 'OH' THEN 'Ohio' WHEN 'OK' THEN 'Oklahoma'
-              WHEN 'OR' THEN 'Oregon' WHEN 'PA' THEN 'Pennsylvania' WHEN 'RI' THEN 'Rhode Island'
-              WHEN 'SC' THEN 'South Carolina' WHEN 'SD' THEN 'South Dakota' WHEN 'TN' THEN 'Tennessee'
-              WHEN 'TX' THEN 'Texas' WHEN 'UT' THEN 'Utah' WHEN 'VT' THEN 'Vermont'
-              WHEN 'VA' THEN 'Virginia' WHEN 'WA' THEN 'Washington' WHEN 'WV' THEN 'West Virginia'
-              WHEN 'WI' THEN 'Wisconsin' WHEN 'WY' THEN 'Wyoming'
-              ELSE state
-            END as state_name,
-            
-            CASE state
-              WHEN 'CT' THEN 'Northeast' WHEN 'ME' THEN 'Northeast' WHEN 'MA' THEN 'Northeast'
-              WHEN 'NH' THEN 'Northeast' WHEN 'NJ' THEN 'Northeast' WHEN 'NY' THEN 'Northeast'
-              WHEN 'PA' THEN 'Northeast' WHEN 'RI' THEN 'Northeast' WHEN 'VT' THEN 'Northeast'
-              WHEN 'IL' THEN 'Midwest' WHEN 'IN' THEN 'Midwest' WHEN 'IA' THEN 'Midwest'
-              WHEN 'KS' THEN 'Midwest' WHEN 'MI' THEN 'Midwest' WHEN 'MN' THEN 'Midwest'
-              WHEN 'MO' THEN 'Midwest' WHEN 'NE' THEN 'Midwest' WHEN 'ND' THEN 'Midwest'
-              WHEN 'OH' THEN 'Midwest' WHEN 'SD' THEN 'Midwest' WHEN 'WI' THEN 'Midwest'
-              WHEN 'AL' THEN 'South' WHEN 'AR' THEN 'South' WHEN 'DE' THEN 'South'
-              WHEN 'FL' THEN 'South' WHEN 'GA' THEN 'South' WHEN 'KY' THEN 'South'
-              WHEN 'LA' THEN 'South' WHEN 'MD' THEN 'South' WHEN 'MS' THEN 'South'
-              WHEN 'NC' THEN 'South' WHEN 'OK' THEN 'South' WHEN 'SC' THEN 'South'
-              WHEN 'TN' THEN 'South' WHEN 'TX' THEN 'South' WHEN 'VA' THEN 'South'
-              WHEN 'WV' THEN 'South'
-              ELSE 'West'
-            END as region,
-            
-            CASE 
-              WHEN data_year BETWEEN 2005 AND 2009 THEN '2005-2009'
-              WHEN data_year BETWEEN 2010 AND 2014 THEN '2010-2014'
-              WHEN data_year BETWEEN 2015 AND 2019 THEN '2015-2019'
-              WHEN data_year BETWEEN 2020 AND 2024 THEN '2020-2024'
-              ELSE 'Other'
-            END as time_period,
-            
-            bill_type, bill_number, description, history, notes, website_blurb, internal_summary,
-            last_action_date, introduced_date, enacted_date, vetoed_date, date_last_updated, effective_date,
-            
-            DATE_DIFF(enacted_date, introduced_date, DAY) as days_to_enactment,
-            DATE_DIFF(last_action_date, introduced_date, DAY) as days_since_introduction,
-            
-            introduced, seriously_considered, passed_first_chamber, passed_second_chamber,
-            enacted, vetoed, dead, pending, positive, neutral, restrictive,
-            
-            CASE 
-              WHEN enacted = TRUE THEN 'Enacted'
-              WHEN vetoed = TRUE THEN 'Vetoed'
-              WHEN dead = TRUE THEN 'Dead'
-              WHEN pending = TRUE THEN 'Pending'
-              WHEN passed_second_chamber = TRUE THEN 'Passed Both Chambers'
-              WHEN passed_first_chamber = TRUE THEN 'Passed One Chamber'
-              WHEN seriously_considered = TRUE THEN 'Seriously Considered'
-              WHEN introduced = TRUE THEN 'Introduced'
-              ELSE 'Unknown'
-            END AS status_category,
-            
-            CASE
-              WHEN positive = TRUE THEN 'Positive'
-              WHEN neutral = TRUE THEN 'Neutral'
-              WHEN restrictive = TRUE THEN 'Restrictive'
-              ELSE 'Unclassified'
-            END AS intent,
-
-            -- intent_consolidated handles bills with multiple intent flags
-            CASE
-              WHEN (CAST(positive AS INT64) + CAST(neutral AS INT64) + CAST(restrictive AS INT64)) > 1 THEN 'Mixed'
-              WHEN positive = TRUE THEN 'Positive'
-              WHEN neutral = TRUE THEN 'Neutral'
-              WHEN restrictive = TRUE THEN 'Restrictive'
-              ELSE 'Unclassified'
-            END AS intent_consolidated,
-
-            abortion, contraception, emergency_contraception, minors, pregnancy, refusal, sex_education,
-            insurance, appropriations, fetal_issues, fetal_tissue, incarceration, period_products, stis,
-            legislation, resolution, ballot_initiative, constitutional_amendment, court_case,
-            
-            (CAST(abortion AS INT64) + CAST(contraception AS INT64) + CAST(emergency_contraception AS INT64) +
-             CAST(minors AS INT64) + CAST(pregnancy AS INT64) + CAST(refusal AS INT64) + CAST(sex_education AS INT64) +
-             CAST(insurance AS INT64) + CAST(appropriations AS INT64) + CAST(fetal_issues AS INT64) +
-             CAST(fetal_tissue AS INT64) + CAST(incarceration AS INT64) + CAST(period_products AS INT64) +
-             CAST(stis AS INT64)) as policy_area_count,
-             
-            CASE 
-              WHEN abortion = TRUE THEN 'Abortion'
-              WHEN contraception = TRUE THEN 'Contraception'
-              WHEN minors = TRUE THEN 'Minors'
-              WHEN sex_education = TRUE THEN 'Sex Education'
-              WHEN insurance = TRUE THEN 'Insurance'
-              WHEN pregnancy = TRUE THEN 'Pregnancy'
-              WHEN refusal = TRUE THEN 'Refusal'
-              WHEN appropriations = TRUE THEN 'Appropriations'
-              WHEN emergency_contraception = TRUE THEN 'Emergency Contraception'
-              WHEN fetal_issues = TRUE THEN 'Fetal Issues'
-              WHEN fetal_tissue = TRUE THEN 'Fetal Tissue'
-              WHEN incarceration = TRUE THEN 'Incarceration'
-              WHEN period_products = TRUE THEN 'Period Products'
-              WHEN stis = TRUE THEN 'STIs'
-              ELSE 'Other/Multiple'
-            END as primary_policy_area,
-            
-            topic_1, topic_2, topic_3, topic_4, topic_5, topic_6, topic_7, topic_8, topic_9, topic_10,
-            COALESCE(topic_1, topic_2, topic_3, topic_4, topic_5, topic_6, topic_7, topic_8, topic_9, topic_10, 'No Topic') as primary_topic,
-            
-            (CASE WHEN topic_1 IS NOT NULL AND topic_1 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_2 IS NOT NULL AND topic_2 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_3 IS NOT NULL AND topic_3 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_4 IS NOT NULL AND topic_4 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_5 IS NOT NULL AND topic_5 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_6 IS NOT NULL AND topic_6 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_7 IS NOT NULL AND topic_7 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_8 IS NOT NULL AND topic_8 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_9 IS NOT NULL AND topic_9 != '' THEN 1 ELSE 0 END +
-             CASE WHEN topic_10 IS NOT NULL AND topic_10 != '' THEN 1 ELSE 0 END) as topic_count,
-            
-            migration_date, data_source,
-            
-            CASE WHEN enacted = TRUE THEN TRUE ELSE FALSE END as is_successful,
-            CASE WHEN (dead = TRUE OR vetoed = TRUE) THEN TRUE ELSE FALSE END as is_failed,
-            CASE WHEN data_year >= 2020 THEN TRUE ELSE FALSE END as is_recent
-
-          FROM `{self.project_id}.{self.dataset_id}.all_historical_bills_unified`
-          WHERE state IS NOT NULL AND bill_number IS NOT NULL
-        )
-        SELECT 
-          *,
-          CASE 
-            WHEN policy_area_count >= 4 THEN 'Complex (4+ areas)'
-            WHEN policy_area_count = 3 THEN 'Medium (3 areas)'
-            WHEN policy_area_count = 2 THEN 'Simple (2 areas)'
-            WHEN policy_area_count = 1 THEN 'Single Focus'
-            ELSE 'No Focus Areas'
-          END as policy_complexity,
-          
-          CASE WHEN (policy_area_count >= 3 AND topic_count >= 2) THEN TRUE ELSE FALSE END as is_high_activity_bill
-          
-        FROM enhanced_bills
-        """
+        create_table_sql = self.looker_view_sql()
         
         try:
-            job = self.bq_client.query(create_table_sql)
-            job.result(timeout=600)
+            self.query_runner.run(create_table_sql, timeout=600, label="comprehensive_bills_authentic")
             self.logger.info("✅ Created authentic comprehensive view: comprehensive_bills_authentic")
             self.logger.info("    🔍 Preserves NULL patterns showing data evolution")
             return True
-        except google_exceptions.GoogleCloudError as e:
+        except (google_exceptions.GoogleCloudError, QueryBudgetExceeded) as e:
             self.logger.error("❌ Failed to create Looker table: %s", e)
             return False
 
+    def raw_data_tracking_view_sql(self) -> str:
+        """DDL for the view showing what fields were tracked each year."""
+        return raw_data_tracking_view_sql(self.project_id, self.dataset_id)
+
     def create_raw_data_tracking_view(self):
         """Create view showing what fields were actually tracked each year."""
         self.logger.info("🔄 Creating raw data tracking view...")
         
-        tracking_view_sql = f"""
-        CREATE OR REPLACE VIEW `{self.project_id}.{self.dataset_id}.raw_data_tracking_by_year` AS
-        SELECT 
-          data_year,
-          COUNT(*) as total_bills,
-          
-          -- Basic data collection (should always be tracked)
-          SUM(CASE WHEN state IS NOT NULL THEN 1 ELSE 0 END) as has_state_data,
-          SUM(CASE WHEN bill_number IS NOT NULL THEN 1 ELSE 0 END) as has_bill_number_data,
-          SUM(CASE WHEN description IS NOT NULL THEN 1 ELSE 0 END) as has_description_data,
-          SUM(CASE WHEN history IS NOT NULL THEN 1 ELSE 0 END) as has_history_data,
-          
-          -- Bill classification evolution
-          SUM(CASE WHEN bill_type IS NOT NULL THEN 1 ELSE 0 END) as has_bill_type_data,
-          SUM(CASE WHEN internal_summary IS NOT NULL THEN 1 ELSE 0 END) as has_internal_summary_data,
-          SUM(CASE WHEN notes IS NOT NULL THEN 1 ELSE 0 END) as has_notes_data,
-          SUM(CASE WHEN website_blurb IS NOT NULL THEN 1 ELSE 0 END) as has_website_blurb_data,
-          
-          -- Date tracking evolution  
-          SUM(CASE WHEN introduced_date IS NOT NULL THEN 1 ELSE 0 END) as has_introduced_date_data,
-          SUM(CASE WHEN last_action_date IS NOT NULL THEN 1 ELSE 0 END) as has_last_action_date_data,
-          SUM(CASE WHEN effective_date IS NOT NULL THEN 1 ELSE 0 END) as has_effective_date_data,
-          SUM(CASE WHEN enacted_date IS NOT NULL THEN 1 ELSE 0 END) as has_enacted_date_data,
-          
-          -- Policy category tracking (NULL = not tracked, TRUE/FALSE = tracked)
-          COUNTIF(abortion IS NOT NULL) as tracked_abortion_bills,
-          COUNTIF(abortion = TRUE) as marked_abortion_true,
-          COUNTIF(contraception IS NOT NULL) as tracked_contraception_bills,
-          COUNTIF(contraception = TRUE) as marked_contraception_true,
-          COUNTIF(minors IS NOT NULL) as tracked_minors_bills,
-          COUNTIF(minors = TRUE) as marked_minors_true,
-          COUNTIF(sex_education IS NOT NULL) as tracked_sex_education_bills,
-          COUNTIF(sex_education = TRUE) as marked_sex_education_true,
-          COUNTIF(insurance IS NOT NULL) as tracked_insurance_bills,
-          COUNTIF(insurance = TRUE) as marked_insurance_true,
-          COUNTIF(pregnancy IS NOT NULL) as tracked_pregnancy_bills,
-          COUNTIF(pregnancy = TRUE) as marked_pregnancy_true,
-          COUNTIF(emergency_contraception IS NOT NULL) as tracked_emergency_contraception_bills,
-          COUNTIF(emergency_contraception = TRUE) as marked_emergency_contraception_true,
-          COUNTIF(period_products IS NOT NULL) as tracked_period_products_bills,
-          COUNTIF(period_products = TRUE) as marked_period_products_true,
-          COUNTIF(incarceration IS NOT NULL) as tracked_incarceration_bills,
-          COUNTIF(incarceration = TRUE) as marked_incarceration_true,
-          
-          -- Status field tracking (modern methodology post-2006)
-          COUNTIF(introduced IS NOT NULL) as tracked_introduced_status,
-          COUNTIF(introduced = TRUE) as marked_introduced_true,
-          COUNTIF(enacted IS NOT NULL) as tracked_enacted_status,
-          COUNTIF(enacted = TRUE) as marked_enacted_true,
-          COUNTIF(vetoed IS NOT NULL) as tracked_vetoed_status,
-          COUNTIF(vetoed = TRUE) as marked_vetoed_true,
-          COUNTIF(dead IS NOT NULL) as tracked_dead_status,
-          COUNTIF(dead = TRUE) as marked_dead_true,
-          COUNTIF(pending IS NOT NULL) as tracked_pending_status,
-          COUNTIF(pending = TRUE) as marked_pending_true,
-          
-          -- Intent classification tracking
-          COUNTIF(positive IS NOT NULL) as tracked_positive_intent,
-          COUNTIF(positive = TRUE) as marked_positive_true,
-          COUNTIF(neutral IS NOT NULL) as tracked_neutral_intent,
-          COUNTIF(neutral = TRUE) as marked_neutral_true,
-          COUNTIF(restrictive IS NOT NULL) as tracked_restrictive_intent,
-          COUNTIF(restrictive = TRUE) as marked_restrictive_true,
-          
-          -- Calculate tracking percentages for key fields
-          ROUND(SUM(CASE WHEN bill_type IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*) * 100, 1) as bill_type_tracking_pct,
-          ROUND(SUM(CASE WHEN introduced_date IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*) * 100, 1) as introduced_date_tracking_pct,
-          ROUND(COUNTIF(abortion IS NOT NULL) / COUNT(*) * 100, 1) as abortion_tracking_pct,
-          ROUND(COUNTIF(contraception IS NOT NULL) / COUNT(*) * 100, 1) as contraception_tracking_pct,
-          ROUND(COUNTIF(positive IS NOT NULL) / COUNT(*) * 100, 1) as intent_tracking_pct,
-          
-          -- Calculate marking percentages (when tracked, what % was marked TRUE)
-          CASE 
-            WHEN COUNTIF(abortion IS NOT NULL) > 0 
-            THEN ROUND(COUNTIF(abortion = TRUE) / COUNTIF(abortion IS NOT NULL) * 100, 1)
-            ELSE NULL 
-          END as abortion_true_rate_when_tracked,
-          
-          CASE 
-            WHEN COUNTIF(contraception IS NOT NULL) > 0 
-            THEN ROUND(COUNTIF(contraception = TRUE) / COUNTIF(contraception IS NOT NULL) * 100, 1)
-            ELSE NULL 
-          END as contraception_true_rate_when_tracked,
-          
-          CASE 
-            WHEN COUNTIF(introduced IS NOT NULL) > 0 
-            THEN ROUND(COUNTIF(introduced = TRUE) / COUNTIF(introduced IS NOT NULL) * 100, 1)
-            ELSE NULL 
-          END as introduced_true_rate_when_tracked,
-          
-          CASE 
-            WHEN COUNTIF(enacted IS NOT NULL) > 0 
-            THEN ROUND(COUNTIF(enacted = TRUE) / COUNTIF(enacted IS NOT NULL) * 100, 1)
-            ELSE NULL 
-          END as enacted_true_rate_when_tracked
-
-        FROM `{self.project_id}.{self.dataset_id}.all_historical_bills_unified`
-        GROUP BY data_year
-        ORDER BY data_year
-        """
+        tracking_view_sql = self.raw_data_tracking_view_sql()
         
         try:
-            job = self.bq_client.query(tracking_view_sql)
-            job.result(timeout=300)
+            self.query_runner.run(tracking_view_sql, timeout=300, label="raw_data_tracking_by_year")
             self.logger.info("✅ Created raw data tracking view: raw_data_tracking_by_year")
             return True
-        except google_exceptions.GoogleCloudError as e:
+        except (google_exceptions.GoogleCloudError, QueryBudgetExceeded) as e:
             self.logger.error("❌ Failed to create raw data tracking view: %s", e)
             return False
 
+    def analytics_statements(self) -> Optional[List[str]]:
+        """Statements from sql/state_year_analytics.sql, or None if missing."""
+        analytics_sql_path = self.base_path / "sql" / "state_year_analytics.sql"
+        
+        statements = analytics_statements(self.project_id, self.dataset_id, analytics_sql_path)
+        if statements is None:
+            self.logger.warning("Analytics SQL file not found: %s", analytics_sql_path)
+        return statements
+
     def create_analytics_views(self):
         """Create comprehensive analytics views for state/year analysis."""
         self.logger.info("🔄 Creating analytics views...")
         
-        analytics_sql_path = self.base_path / "sql" / "state_year_analytics.sql"
-        
-        if not analytics_sql_path.exists():
-            self.logger.warning("Analytics SQL file not found: %s", analytics_sql_path)
+        statements = self.analytics_statements()
+        if statements is None:
             return False
-            
-        # Read and execute analytics SQL
-        with open(analytics_sql_path) as f:
-            analytics_sql = f.read()
-            
-        # Replace placeholders
-        analytics_sql = analytics_sql.replace("{{ project_id }}", self.project_id)
-        analytics_sql = analytics_sql.replace("{{ dataset_id }}", self.dataset_id)
         
-        # Execute each statement separately
-        statements = [stmt.strip() for stmt in analytics_sql.split(';') if stmt.strip()]
+        # Independent statements run concurrently; dependents wait on the
+        # statements that create the objects they reference
+        labels = [f"analytics statement {i + 1}/{len(statements)}" for i in range(len(statements))]
+        results = run_statements(self.query_runner, statements, labels=labels, timeout=300)
         
-        for i, statement in enumerate(statements):
-            try:
-                self.logger.info("Executing analytics statement %d/%d", i+1, len(statements))
-                job = self.bq_client.query(statement)
-                job.result(timeout=300)
-                self.logger.info("✓ Analytics statement %d completed", i+1)
-            except Exception as e:
-                self.logger.error("✗ Analytics statement %d failed: %s", i+1, e)
-                return False
+        if any(error is not None for error in results.values()):
+            return False
                 
         self.logger.info("✅ Created all analytics views successfully")
         return True
 
+    def create_post_migration_views(self) -> bool:
+        """Create the Looker, tracking and analytics views as one dependency graph.
+
+        Expects the unified view to exist already. Statements that only read
+        from it run in parallel, so the total time is the critical path
+        rather than the sum of every statement.
+        """
+        self.logger.info("🔄 Creating post-migration views...")
+        
+        statements = [self.looker_view_sql(), self.raw_data_tracking_view_sql()]
+        labels = ["comprehensive_bills_authentic", "raw_data_tracking_by_year"]
+        
+        analytics = self.analytics_statements() or []
+        statements.extend(analytics)
+        labels.extend(f"analytics statement {i + 1}/{len(analytics)}" for i in range(len(analytics)))
+        
+        results = run_statements(self.query_runner, statements, labels=labels, timeout=600)
+        failed = [labels[i] for i, error in results.items() if error is not None]
+        
+        if failed:
+            self.logger.error("❌ Failed to create: %s", ", ".join(failed))
+            return False
+        
+        self.logger.info("✅ Created %d post-migration views", len(statements))
+        return True
+
     def run_migration(self) -> bool:
         """Run the complete migration."""
         self.logger.info("🚀 Starting Guttmacher historical data migration...")
@@ -811,10 +776,15 @@ class GuttmacherMigration:
         
         # Create views and tables if successful
         if self.stats["files_processed"] > 0:
-            self.create_unified_view()
-            self.create_looker_table()
-            self.create_raw_data_tracking_view()
-            self.create_analytics_views()
+            # Only partitions for reloaded years need rewriting
+            changed_years = self.stats["years_processed"] if self.stats["years_unchanged"] else None
+            self.create_unified_view(years=changed_years)
+            self.create_post_migration_views()
+            self.generate_final_report()
+            return True
+        elif self.stats["years_unchanged"]:
+            self.logger.info("⏭️ All %d years unchanged, views left as they are",
+                             len(self.stats["years_unchanged"]))
             self.generate_final_report()
             return True
         else:
@@ -920,9 +890,20 @@ class GuttmacherMigration:
         print(f"⏱️  Total Time: {duration.total_seconds():.1f} seconds")
         print(f"📁 Files Processed: {self.stats['files_processed']}")
         print(f"📅 Years: {sorted(self.stats['years_processed'])}")
+        if self.stats["years_unchanged"]:
+            print(f"⏭️  Unchanged (skipped): {sorted(self.stats['years_unchanged'])}")
         print(f"📋 Total Bills: {self.stats['total_bills']:,}")
+        if self.stats["duplicates_removed"]:
+            print(f"🧹 Duplicate Bills Removed: {self.stats['duplicates_removed']:,}")
         print(f"📊 Field Mappings Applied: {self.stats['field_mappings_applied']}")
         
+        query_usage = self.query_runner.summary()
+        if query_usage['statements']:
+            print(f"💰 Query Usage: {query_usage['statements']} statements, "
+                  f"{format_bytes(query_usage['bytes_billed'])} billed "
+                  f"(~${query_usage['estimated_cost']:.4f}), "
+                  f"{query_usage['slot_millis']:,} slot-ms")
+        
         if self.stats["errors"]:
             print(f"\n⚠️  Errors ({len(self.stats['errors'])}):")
             for error in self.stats["errors"][:3]:
@@ -943,11 +924,14 @@ def main():
     parser.add_argument("--test", action="store_true", help="Test migration results")
     parser.add_argument("--cleanup", action="store_true", help="Clean up old objects")
     parser.add_argument("--looker-only", action="store_true", help="Create just Looker table")
+    parser.add_argument("--force", action="store_true", help="Reload years even if unchanged")
+    parser.add_argument("--duplicates", choices=KEEP_OPTIONS, default="latest",
+                        help="Resolve repeated bills by keeping the latest or first row, or fail (default: latest)")
     
     args = parser.parse_args()
     
     try:
-        migration = GuttmacherMigration()
+        migration = GuttmacherMigration(force=args.force, duplicates=args.duplicates)
         
         if args.test:
             success = migration.test_migration()
@@ -1,32 +1,45 @@
 """
 ETL Pipeline for Guttmacher Legislative Tracker
 Modular, extensible pipeline for processing data from various sources
-"""
-
-# Import only what exists
-try:
-    from .extractors import ExtractorFactory
-except ImportError:
-    ExtractorFactory = None
 
-try:
-    from .transformers import SchemaHarmonizer
-except ImportError:
-    SchemaHarmonizer = None
+Components are imported on first access, so `import etl` stays cheap and a
+source or destination's dependencies (requests, google-cloud-bigquery) are
+only loaded when that component is actually used.
+"""
 
-try:
-    from .loaders import BigQueryLoader
-except ImportError:
-    BigQueryLoader = None
+import importlib
 
-try:
-    from .pipeline import Pipeline
-except ImportError:
-    Pipeline = None
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    'Pipeline': '.pipeline',
+    'ExtractorFactory': '.extractors.factory',
+    'SchemaHarmonizer': '.transformers.schema_harmonizer',
+    'BigQueryLoader': '.loaders.bigquery_loader',
+    'LoaderFactory': '.loaders.factory',
+}
 
 __all__ = [
     'Pipeline',
     'ExtractorFactory',
     'SchemaHarmonizer',
-    'BigQueryLoader'
-]
\ No newline at end of file
+    'BigQueryLoader',
+    'LoaderFactory'
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import only what exists
+    try:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    except ImportError:
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,18 @@
 Data extractors for various sources
 """
 
+import importlib
+
 from .base import DataSourceAdapter
-from .factory import ExtractorFactory
-from .mdb_extractor import MDBExtractor
-from .csv_extractor import CSVExtractor
-from .airtable_extractor import AirtableExtractor
+
+# Extractor modules are imported on first access so that selecting one
+# source doesn't pull in every other source's dependencies
+_LAZY_IMPORTS = {
+    'ExtractorFactory': '.factory',
+    'MDBExtractor': '.mdb_extractor',
+    'CSVExtractor': '.csv_extractor',
+    'AirtableExtractor': '.airtable_extractor',
+}
 
 __all__ = [
     'DataSourceAdapter',
@@ -14,4 +21,16 @@ __all__ = [
     'MDBExtractor',
     'CSVExtractor',
     'AirtableExtractor'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,23 +2,37 @@
 Factory for creating data source extractors
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
+import importlib
+import logging
+
 from .base import DataSourceAdapter
-from .csv_extractor import CSVExtractor
-from .airtable_extractor import AirtableExtractor
+
+# Installed packages can provide extractors under this entry point group, e.g.
+#   [project.entry-points."guttmacher_etl.extractors"]
+#   legiscan = "legiscan_etl:LegiScanExtractor"
+ENTRY_POINT_GROUP = 'guttmacher_etl.extractors'
 
 
 class ExtractorFactory:
     """Factory for creating appropriate data extractors"""
     
+    # Source type -> "module:Class" (relative to this package when it starts
+    # with a dot). Modules are imported only when their source is selected,
+    # so e.g. CSV runs never import requests.
     _extractors = {
-        'csv': CSVExtractor,
-        'airtable': AirtableExtractor,
-        'airtable_api': AirtableExtractor,
-        'airtable_webhook': AirtableExtractor,
-        'airtable_export': AirtableExtractor,
+        'csv': '.csv_extractor:CSVExtractor',
+        'mdb': '.mdb_extractor:MDBExtractor',
+        'access': '.mdb_extractor:MDBExtractor',
+        'airtable': '.airtable_extractor:AirtableExtractor',
+        'airtable_api': '.airtable_extractor:AirtableExtractor',
+        'airtable_webhook': '.airtable_extractor:AirtableExtractor',
+        'airtable_export': '.airtable_extractor:AirtableExtractor',
     }
     
+    # Entry points are only scanned when a type isn't built in
+    _discovered = False
+    
     @classmethod
     def create(cls, source_type: str, config: Dict[str, Any]) -> DataSourceAdapter:
         """
@@ -31,10 +45,12 @@ class ExtractorFactory:
         Returns:
             Configured data source adapter
         """
+        if source_type not in cls._extractors:
+            cls.discover()
         if source_type not in cls._extractors:
             raise ValueError(f"Unknown source type: {source_type}")
         
-        extractor_class = cls._extractors[source_type]
+        extractor_class = cls.get_class(source_type)
         
         # Special handling for Airtable modes
         if source_type.startswith('airtable_'):
@@ -44,11 +60,48 @@ class ExtractorFactory:
         return extractor_class(config)
     
     @classmethod
-    def register(cls, source_type: str, extractor_class: type):
-        """Register a new extractor type"""
+    def get_class(cls, source_type: str) -> type:
+        """Resolve (importing if needed) the extractor class for a source type"""
+        extractor = cls._extractors[source_type]
+        if isinstance(extractor, str):
+            module_name, class_name = extractor.split(':')
+            extractor = getattr(importlib.import_module(module_name, __package__), class_name)
+        elif not isinstance(extractor, type):
+            # Entry point
+            extractor = extractor.load()
+        cls._extractors[source_type] = extractor
+        return extractor
+    
+    @classmethod
+    def discover(cls):
+        """Register extractors advertised by installed packages (without importing them)"""
+        if cls._discovered:
+            return
+        cls._discovered = True
+        
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+        
+        for entry_point in found:
+            if entry_point.name in cls._extractors:
+                logging.getLogger(cls.__name__).warning(
+                    f"Ignoring entry point {entry_point.value}: "
+                    f"source type '{entry_point.name}' is already registered"
+                )
+                continue
+            cls._extractors[entry_point.name] = entry_point
+    
+    @classmethod
+    def register(cls, source_type: str, extractor_class: Union[type, str]):
+        """Register a new extractor type (a class or a "module:Class" path)"""
         cls._extractors[source_type] = extractor_class
     
     @classmethod
     def list_available(cls) -> list:
         """List all available extractor types"""
-        return list(cls._extractors.keys())
\ No newline at end of file
+        cls.discover()
+        return list(cls._extractors.keys())
@@ -3,16 +3,16 @@ MDB data extractor for historical Access databases
 Wrapper around existing migration logic
 """
 
-import subprocess
 import pandas as pd
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from .base import DataSourceAdapter
+from shared.access_reader import open_database, reader_available
 
 
 class MDBExtractor(DataSourceAdapter):
-    """Extract data from MDB/Access files using mdbtools"""
+    """Extract data from MDB/Access files (in-process reader, or mdbtools)"""
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -27,16 +27,14 @@ class MDBExtractor(DataSourceAdapter):
         self.table_name = config.get('table_name')
     
     def validate_connection(self) -> bool:
-        """Check if MDB file exists and mdbtools is installed"""
+        """Check if MDB file exists and an Access reader is available"""
         if not self.file_path.exists():
             return False
         
-        try:
-            result = subprocess.run(['mdb-ver'], capture_output=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            self.logger.error("mdbtools not installed")
+        if not reader_available():
+            self.logger.error("No Access reader: pip install access_parser, or install mdbtools")
             return False
+        return True
     
     def extract(self, since: Optional[datetime] = None) -> pd.DataFrame:
         """Extract data from MDB file"""
@@ -48,29 +46,22 @@ class MDBExtractor(DataSourceAdapter):
             tables = self._get_tables()
             self.table_name = self._find_primary_table(tables)
         
-        # Export to CSV using mdb-export
-        cmd = ['mdb-export', str(self.file_path), self.table_name]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            raise Exception(f"mdb-export failed: {result.stderr}")
-        
-        # Parse CSV output
-        import io
-        df = pd.read_csv(io.StringIO(result.stdout))
+        # Typed rows, read in-process when access_parser is installed
+        database = open_database(self.file_path)
+        df = database.read_table(self.table_name)
         
         self._metadata['record_count'] = len(df)
         self._metadata['extraction_time'] = datetime.now()
         self._metadata['source_file'] = str(self.file_path)
         self._metadata['table'] = self.table_name
+        self._metadata['reader'] = database.backend
+        self._metadata['column_types'] = database.schema(self.table_name)
         
         return df
     
     def _get_tables(self) -> list:
         """Get list of tables in MDB file"""
-        cmd = ['mdb-tables', '-1', str(self.file_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.stdout.strip().split('\n')
+        return open_database(self.file_path).tables()
     
     def _find_primary_table(self, tables: list) -> str:
         """Find the main data table"""
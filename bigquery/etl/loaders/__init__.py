@@ -2,6 +2,25 @@
 Data loaders for BigQuery
 """
 
-from .bigquery_loader import BigQueryLoader
+import importlib
 
-__all__ = ['BigQueryLoader']
\ No newline at end of file
+# BigQueryLoader pulls in google-cloud-bigquery, so it is imported on first
+# access rather than with the package
+_LAZY_IMPORTS = {
+    'BigQueryLoader': '.bigquery_loader',
+    'LoaderFactory': '.factory',
+}
+
+__all__ = ['BigQueryLoader', 'LoaderFactory']
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
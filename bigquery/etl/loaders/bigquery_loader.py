@@ -3,15 +3,18 @@ BigQuery data loader
 """
 
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from google.cloud import bigquery
 import logging
 
+from shared.bigquery_utils import load_with_layout
+from shared.bq_clients import get_client
+
 
 class BigQueryLoader:
     """Load data to BigQuery"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], client: Optional[bigquery.Client] = None):
         """
         Initialize BigQuery loader
         
@@ -19,12 +22,24 @@ class BigQueryLoader:
             - project_id: GCP project ID
             - dataset_id: BigQuery dataset ID
             - table_id: BigQuery table ID
+            - partitioning: Optional time or integer-range partitioning, e.g.
+              {"type": "range", "field": "data_year", "start": 2000, "end": 2051}
+              or {"type": "time", "field": "created", "granularity": "MONTH"}
+            - clustering_fields: Optional list of clustering columns
+        
+        Args:
+            config: Destination configuration (see above)
+            client: Existing client to share between loaders (optional)
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        self.client = bigquery.Client(project=config['project_id'])
+        self.client = client or get_client(config['project_id'])
         self.table_ref = f"{config['project_id']}.{config['dataset_id']}.{config['table_id']}"
+        self.layout = {
+            key: config[key] for key in ('partitioning', 'clustering_fields')
+            if config.get(key)
+        }
     
     def load(self, df: pd.DataFrame, mode: str = 'replace') -> int:
         """
@@ -48,13 +63,9 @@ class BigQueryLoader:
             autodetect=True
         )
         
-        job = self.client.load_table_from_dataframe(
-            df, 
-            self.table_ref,
-            job_config=job_config
-        )
-        
-        job.result()  # Wait for job to complete
+        # Existing tables without the configured layout are migrated; the
+        # load is polled with backoff and retried on transient errors
+        load_with_layout(self.client, df, self.table_ref, job_config, self.layout)
         
         self.logger.info(f"Loaded {len(df)} rows to {self.table_ref}")
         return len(df)
@@ -72,5 +83,6 @@ class BigQueryLoader:
         """Get destination information"""
         return {
             'type': 'BigQuery',
-            'table': self.table_ref
+            'table': self.table_ref,
+            'layout': self.layout
         }
\ No newline at end of file
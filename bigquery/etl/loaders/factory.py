@@ -0,0 +1,54 @@
+"""
+Factory for creating data loaders
+"""
+
+from typing import Dict, Any, Union
+import importlib
+
+
+class LoaderFactory:
+    """Factory for creating appropriate data loaders"""
+    
+    # Destination type -> "module:Class" (relative to this package when it
+    # starts with a dot); the module is only imported when selected
+    _loaders = {
+        'bigquery': '.bigquery_loader:BigQueryLoader',
+    }
+    
+    @classmethod
+    def create(cls, destination_type: str, config: Dict[str, Any], **kwargs):
+        """
+        Create a loader based on destination type
+        
+        Args:
+            destination_type: Type of destination (bigquery)
+            config: Configuration for the loader
+            **kwargs: Passed through to the loader (e.g. a shared client)
+            
+        Returns:
+            Configured loader
+        """
+        if destination_type not in cls._loaders:
+            raise ValueError(f"Unknown destination type: {destination_type}")
+        
+        return cls.get_class(destination_type)(config, **kwargs)
+    
+    @classmethod
+    def get_class(cls, destination_type: str) -> type:
+        """Resolve (importing if needed) the loader class for a destination type"""
+        loader = cls._loaders[destination_type]
+        if isinstance(loader, str):
+            module_name, class_name = loader.split(':')
+            loader = getattr(importlib.import_module(module_name, __package__), class_name)
+            cls._loaders[destination_type] = loader
+        return loader
+    
+    @classmethod
+    def register(cls, destination_type: str, loader_class: Union[type, str]):
+        """Register a new loader type (a class or a "module:Class" path)"""
+        cls._loaders[destination_type] = loader_class
+    
+    @classmethod
+    def list_available(cls) -> list:
+        """List all available loader types"""
+        return list(cls._loaders.keys())
@@ -3,14 +3,17 @@ Main ETL pipeline orchestrator
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import json
 
+import pandas as pd
+
 from .extractors import ExtractorFactory
-from .transformers import SchemaHarmonizer
-from .loaders import BigQueryLoader
+from .transformers import Deduplicator, SchemaHarmonizer
+from .loaders import LoaderFactory
 
 
 class Pipeline:
@@ -35,6 +38,8 @@ class Pipeline:
         # Initialize components
         self.extractor = None
         self.harmonizer = SchemaHarmonizer()
+        # 'latest', 'first' or 'error' for repeated state/bill_number/year keys
+        self.deduplicator = Deduplicator(keep=self.config.get('duplicates', 'latest'))
         self.loader = None
         
         # Pipeline state
@@ -58,7 +63,8 @@ class Pipeline:
             'incremental': {
                 'enabled': False,
                 'key': 'modified_time'
-            }
+            },
+            'duplicates': 'latest'
         }
     
     def setup_source(self, source_type: str, source_config: Dict[str, Any]):
@@ -81,10 +87,12 @@ class Pipeline:
         Configure the destination
         
         Args:
-            destination_config: BigQuery configuration
+            destination_config: Destination configuration; 'type' selects the
+                loader (default: bigquery)
         """
-        self.loader = BigQueryLoader(destination_config)
-        self.logger.info("Destination configured: BigQuery")
+        destination_type = destination_config.get('type', 'bigquery')
+        self.loader = LoaderFactory.create(destination_type, destination_config)
+        self.logger.info(f"Destination configured: {destination_type}")
     
     def run(self, incremental: bool = None) -> Dict[str, Any]:
         """
@@ -114,15 +122,7 @@ class Pipeline:
             self.stats['records_extracted'] = len(df)
             
             # Transform
-            df_harmonized = self.harmonizer.harmonize(
-                df, 
-                source_type=self.config['source']['type']
-            )
-            
-            # Clean for BigQuery
-            from .transformers import DataCleaner
-            cleaner = DataCleaner()
-            df_harmonized = cleaner.clean_for_bigquery(df_harmonized)
+            df_harmonized = self._transform(df, self.harmonizer, self.config['source']['type'], self.stats)
             
             self.stats['records_transformed'] = len(df_harmonized)
             
@@ -148,6 +148,157 @@ class Pipeline:
         
         return self.stats
     
+    def _transform(self, df: pd.DataFrame, harmonizer: SchemaHarmonizer,
+                   source_type: str, stats: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Harmonize, clean and deduplicate extracted data for BigQuery"""
+        df_harmonized = harmonizer.harmonize(df, source_type=source_type)
+        
+        # Clean for BigQuery
+        from .transformers import DataCleaner
+        cleaner = DataCleaner()
+        df_clean = cleaner.clean_for_bigquery(df_harmonized)
+        
+        # Repeated bills would inflate every downstream count
+        df_clean, report = self.deduplicator.deduplicate(df_clean)
+        if stats is not None:
+            stats['duplicates_removed'] = report['removed']
+        return df_clean
+    
+    def run_sources(self, config: Dict[str, Any], incremental: bool = None) -> Dict[str, Any]:
+        """
+        Run several sources in one coordinated pipeline run
+        
+        Each source is extracted and harmonized (with its own mapping file)
+        in its own worker. Sources with a 'destination' override are loaded
+        to their own table; the rest are unioned into the shared destination
+        table with a data_source column naming their origin. Loads run
+        concurrently and share one client per destination type.
+        
+        Args:
+            config: Pipeline config with a 'sources' list, each entry having
+                name, type, config and optionally mapping_file and destination
+            incremental: Whether to run incrementally (overrides config)
+            
+        Returns:
+            Aggregated statistics with a per-source breakdown
+        """
+        start_time = datetime.now()
+        
+        if incremental is None:
+            incremental = config.get('incremental', {}).get('enabled', False)
+        since = self.last_run if incremental else None
+        
+        sources = config['sources']
+        names = [source.get('name', source['type']) for source in sources]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Source names must be unique: {names}")
+        
+        self.logger.info(f"Starting multi-source run: {names} (incremental={incremental})")
+        
+        # Harmonizers are shared between sources using the same mapping
+        harmonizers = {}
+        for source in sources:
+            mapping_file = source.get('mapping_file')
+            if mapping_file not in harmonizers:
+                harmonizers[mapping_file] = SchemaHarmonizer(Path(mapping_file)) if mapping_file else self.harmonizer
+        
+        def extract_source(source: Dict[str, Any]) -> pd.DataFrame:
+            extractor = ExtractorFactory.create(source['type'], dict(source.get('config', {})))
+            if not extractor.validate_connection():
+                raise ConnectionError(f"Cannot connect to {source['type']} source")
+            df = extractor.extract(since=since)
+            source_stats = self.stats['sources'][source.get('name', source['type'])]
+            source_stats['records_extracted'] = len(df)
+            df = self._transform(df, harmonizers[source.get('mapping_file')], source['type'], source_stats)
+            source_stats['records_transformed'] = len(df)
+            return df
+        
+        self.stats = {'sources': {name: {'type': source['type']} for name, source in zip(names, sources)}}
+        max_workers = config.get('max_workers', 4)
+        
+        # Extract + transform every source concurrently
+        frames = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(extract_source, source) for name, source in zip(names, sources)}
+            for name, future in futures.items():
+                try:
+                    frames[name] = future.result()
+                except Exception as e:
+                    self.stats['sources'][name].update(status='failed', error=str(e))
+                    self.logger.error(f"Source {name} failed: {e}")
+        
+        # Route frames to destination tables
+        shared_destination = config.get('destination', {})
+        targets = {}
+        for name, source in zip(names, sources):
+            destination = {**shared_destination, **source.get('destination', {})}
+            key = (destination.get('type', 'bigquery'), destination.get('project_id'),
+                   destination.get('dataset_id'), destination.get('table_id'))
+            targets.setdefault(key, {'destination': destination, 'sources': []})['sources'].append(name)
+        
+        clients = {}
+        loads = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for target in targets.values():
+                destination = target['destination']
+                table = destination.get('table_id')
+                failed = [name for name in target['sources'] if name not in frames]
+                if failed:
+                    # A replace load without these sources would drop their rows
+                    self.logger.error(f"Skipping load to {table}: {failed} failed")
+                    for name in target['sources']:
+                        self.stats['sources'][name].setdefault('status', 'skipped')
+                    continue
+                
+                parts = []
+                for name in target['sources']:
+                    df = frames[name]
+                    if len(target['sources']) > 1 and 'data_source' not in df.columns:
+                        df = df.assign(data_source=name)
+                    parts.append(df)
+                df = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True, sort=False)
+                
+                destination_type = destination.get('type', 'bigquery')
+                shared = {'client': clients[destination_type]} if destination_type in clients else {}
+                loader = LoaderFactory.create(destination_type, destination, **shared)
+                if getattr(loader, 'client', None) is not None:
+                    clients.setdefault(destination_type, loader.client)
+                
+                future = executor.submit(loader.load, df, mode='append' if incremental else 'replace')
+                loads[future] = target
+            
+            for future, target in loads.items():
+                try:
+                    rows_loaded = future.result()
+                except Exception as e:
+                    rows_loaded = None
+                    self.logger.error(f"Load to {target['destination'].get('table_id')} failed: {e}")
+                    for name in target['sources']:
+                        self.stats['sources'][name].update(status='failed', error=str(e))
+                for name in target['sources']:
+                    source_stats = self.stats['sources'][name]
+                    source_stats['table'] = target['destination'].get('table_id')
+                    if rows_loaded is not None:
+                        source_stats['records_loaded'] = source_stats['records_transformed']
+                        source_stats['status'] = 'success'
+        
+        # Aggregate
+        per_source = self.stats['sources'].values()
+        for key in ('records_extracted', 'records_transformed', 'duplicates_removed', 'records_loaded'):
+            self.stats[key] = sum(source_stats.get(key, 0) for source_stats in per_source)
+        not_loaded = [name for name, source_stats in self.stats['sources'].items()
+                      if source_stats.get('status') != 'success']
+        self.stats['duration'] = (datetime.now() - start_time).total_seconds()
+        self.stats['status'] = 'failed' if not_loaded else 'success'
+        
+        if not_loaded:
+            self.logger.error(f"Multi-source run finished with sources not loaded: {not_loaded}")
+            raise RuntimeError(f"Sources not loaded (failed or skipped): {not_loaded}")
+        
+        self.last_run = datetime.now()
+        self.logger.info(f"Multi-source run completed: {self.stats}")
+        return self.stats
+    
     def run_from_config(self, config_path: Path) -> Dict[str, Any]:
         """
         Run pipeline from a configuration file
@@ -161,6 +312,12 @@ class Pipeline:
         with open(config_path, 'r') as f:
             config = json.load(f)
         
+        if 'duplicates' in config:
+            self.deduplicator = Deduplicator(keep=config['duplicates'])
+        
+        if 'sources' in config:
+            return self.run_sources(config)
+        
         # Setup components
         self.setup_source(
             config['source']['type'],
@@ -4,5 +4,6 @@ Data transformers for schema harmonization and cleaning
 
 from .schema_harmonizer import SchemaHarmonizer
 from .data_cleaner import DataCleaner
+from .deduplicator import Deduplicator, DuplicateBillError
 
-__all__ = ['SchemaHarmonizer', 'DataCleaner']
\ No newline at end of file
+__all__ = ['SchemaHarmonizer', 'DataCleaner', 'Deduplicator', 'DuplicateBillError']
\ No newline at end of file
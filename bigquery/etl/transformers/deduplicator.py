@@ -0,0 +1,142 @@
+"""
+Duplicate bill detection before loading
+Rows are keyed on the normalized (state, bill_number, year), hashed in one
+vectorized pass, so repeated bills are reported and resolved before they
+reach BigQuery and inflate downstream counts
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from shared.bill_index import normalize_bill_number
+
+KEEP_OPTIONS = ('latest', 'first', 'error')
+
+# Checked in order for "most recently modified"
+MODIFIED_COLUMNS = ('date_last_updated', 'modified_time', 'modified', 'last_modified', 'last_action_date')
+
+
+class DuplicateBillError(ValueError):
+    """Raised when duplicates are found and keep='error'"""
+
+
+class Deduplicator:
+    """Find and drop rows repeating a (state, bill_number, year) key"""
+
+    def __init__(self, keep: str = 'latest', modified_column: Optional[str] = None):
+        """
+        Initialize deduplicator
+
+        Args:
+            keep: 'latest' keeps the most recently modified row of each key
+                (the last one when no modified column exists), 'first' the
+                first row, 'error' raises DuplicateBillError instead
+            modified_column: Column ordering duplicates for 'latest'
+                (default: first of MODIFIED_COLUMNS present)
+        """
+        if keep not in KEEP_OPTIONS:
+            raise ValueError(f"Unknown keep option '{keep}', expected one of {KEEP_OPTIONS}")
+        self.keep = keep
+        self.modified_column = modified_column
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def key_columns(df: pd.DataFrame) -> Optional[Tuple[str, str, str]]:
+        """State, bill number and year columns, or None if the frame lacks them"""
+        year_column = next((col for col in ('data_year', 'year') if col in df.columns), None)
+        if 'state' not in df.columns or 'bill_number' not in df.columns or year_column is None:
+            return None
+        return 'state', 'bill_number', year_column
+
+    def key_hashes(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        64-bit hash of every row's normalized bill key
+
+        Returns:
+            (hashes, complete) where complete is False for rows missing a
+            key part (never treated as duplicates)
+        """
+        state, bill_number, year = self.key_columns(df)
+        normalized = pd.DataFrame({
+            'state': df[state].astype('string').str.strip().str.upper(),
+            'bill_number': normalize_bill_number(df[bill_number]),
+            'year': pd.to_numeric(df[year], errors='coerce').astype('Int64'),
+        })
+        complete = normalized.notna().all(axis=1).to_numpy()
+        hashes = pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+        return hashes, complete
+
+    def find_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rows sharing a bill key with another row
+
+        Returns:
+            The colliding rows with a duplicate_group column (one id per key)
+        """
+        if self.key_columns(df) is None:
+            return df.iloc[0:0]
+        hashes, complete = self.key_hashes(df)
+        colliding = complete & pd.Series(hashes).duplicated(keep=False).to_numpy()
+        return df[colliding].assign(duplicate_group=pd.factorize(hashes[colliding])[0])
+
+    def deduplicate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Drop repeated bills, keeping one row per key
+
+        Args:
+            df: Harmonized frame
+
+        Returns:
+            (deduplicated frame in the original row order, report with
+            rows, duplicate_keys, duplicate_rows, removed and a sample of
+            the colliding keys)
+        """
+        report = {'rows': len(df), 'duplicate_keys': 0, 'duplicate_rows': 0, 'removed': 0, 'sample': []}
+        columns = self.key_columns(df)
+        if columns is None:
+            self.logger.warning("No state/bill_number/year columns, skipping duplicate check")
+            return df, report
+
+        hashes, complete = self.key_hashes(df)
+        keys = pd.Series(hashes, index=df.index)
+        colliding = complete & keys.duplicated(keep=False).to_numpy()
+        if not colliding.any():
+            return df, report
+
+        report['duplicate_rows'] = int(colliding.sum())
+        report['duplicate_keys'] = int(keys[colliding].nunique())
+        # One example row per colliding key
+        sample = df.loc[colliding, list(columns)][~keys[colliding].duplicated()].head(10)
+        report['sample'] = ['-'.join(str(value) for value in row) for row in sample.itertuples(index=False)]
+
+        if self.keep == 'error':
+            raise DuplicateBillError(
+                f"{report['duplicate_keys']} bill keys appear more than once "
+                f"({report['duplicate_rows']} rows), e.g. {report['sample'][:3]}"
+            )
+
+        positions = np.arange(len(df))
+        if self.keep == 'latest':
+            modified = self.modified_column or next((col for col in MODIFIED_COLUMNS if col in df.columns), None)
+            if modified is not None:
+                # Stable sort: ties and missing dates (NaT sorts first) keep file order
+                stamps = pd.to_datetime(df[modified], errors='coerce', utc=True).array.asi8
+                positions = positions[stamps.argsort(kind='stable')]
+            drop = pd.Series(hashes[positions]).duplicated(keep='last').to_numpy()
+        else:
+            drop = pd.Series(hashes).duplicated(keep='first').to_numpy()
+        # Rows with an incomplete key are never dropped
+        dropped = positions[drop & complete[positions]]
+
+        keep_mask = np.ones(len(df), dtype=bool)
+        keep_mask[dropped] = False
+        report['removed'] = int((~keep_mask).sum())
+
+        self.logger.warning(
+            f"Removed {report['removed']} duplicate rows for {report['duplicate_keys']} bill keys "
+            f"(kept {self.keep}), e.g. {report['sample'][:3]}"
+        )
+        return df[keep_mask], report
@@ -24,6 +24,14 @@ from dotenv import load_dotenv
 from google.cloud import bigquery
 from google.cloud import exceptions as google_exceptions
 
+from shared.bigquery_utils import (
+    YEAR_TABLE_LAYOUT,
+    load_with_layout,
+    refresh_aggregate_cube,
+    refresh_materialized_table,
+)
+from shared.bq_clients import get_client
+
 
 class CSV2024Migration:
     """Migrate 2024 CSV data to BigQuery."""
@@ -40,7 +48,7 @@ class CSV2024Migration:
         if not self.project_id or self.project_id == "your-actual-project-id":
             raise ValueError("Please set GCP_PROJECT_ID in .env file")
 
-        self.bq_client = bigquery.Client(project=self.project_id)
+        self.bq_client = get_client(self.project_id)
         self.base_path = Path(__file__).parent
 
         # Load field mappings
@@ -287,8 +295,7 @@ class CSV2024Migration:
                     if df[col].isna().any():
                         self.logger.warning(f"Column {col} has NaN values but is type {df[col].dtype}")
 
-            job = self.bq_client.load_table_from_dataframe(df, table_id, job_config=job_config)
-            job.result(timeout=300)
+            load_with_layout(self.bq_client, df, table_id, job_config, YEAR_TABLE_LAYOUT, timeout=300)
             self.logger.info(f"✅ Successfully loaded {len(df)} rows to {table_name}")
             return True
         except google_exceptions.GoogleCloudError as e:
@@ -314,16 +321,14 @@ class CSV2024Migration:
         try:
             self.bq_client.get_table(f"{self.project_id}.{self.dataset_id}.all_historical_bills_materialized")
 
-            # Recreate the materialized table to include 2024
-            recreate_sql = f"""
-            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.all_historical_bills_materialized`
-            AS
-            SELECT * FROM `{self.project_id}.{self.dataset_id}.all_historical_bills_unified`
-            """
-
-            job = self.bq_client.query(recreate_sql)
-            job.result(timeout=600)
+            # Replace only the 2024 partition of the materialized table
+            refresh_materialized_table(
+                self.bq_client, self.project_id, years=[2024],
+                dataset_id=self.dataset_id, source_dataset_id=self.dataset_id
+            )
             self.logger.info("✅ Updated materialized table with 2024 data")
+            refresh_aggregate_cube(self.bq_client, self.project_id, years=[2024], dataset_id=self.dataset_id)
+            self.logger.info("✅ Updated aggregate cube with 2024 data")
 
         except google_exceptions.NotFound:
             self.logger.warning("⚠️  Materialized table not found, skipping update")
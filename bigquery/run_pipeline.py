@@ -6,7 +6,9 @@ Usage:
     python run_pipeline.py                           # Run with default config
     python run_pipeline.py --config airtable_export  # Run with specific config
     python run_pipeline.py --source csv --file data/export.csv
+    python run_pipeline.py --source mdb --file "data/2019 legislation.accdb"
     python run_pipeline.py --incremental             # Run incremental update
+    python run_pipeline.py --config multi_source     # Several sources in one run
 """
 
 import argparse
@@ -19,15 +21,14 @@ import os
 # Add etl module to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from etl import Pipeline
-
 
 def main():
     # Parse arguments
     parser = argparse.ArgumentParser(description='Run ETL pipeline')
     parser.add_argument('--config', help='Config file name (without .json)')
-    parser.add_argument('--source', choices=['csv', 'airtable'], help='Source type')
+    parser.add_argument('--source', help='Source type (csv, mdb, airtable, or an installed plugin)')
     parser.add_argument('--file', help='Source file path')
+    parser.add_argument('--table', help='Table to extract from an MDB/Access file (auto-detected if omitted)')
     parser.add_argument('--incremental', action='store_true', help='Run incremental')
     parser.add_argument('--verbose', action='store_true', help='Verbose logging')
     
@@ -43,6 +44,9 @@ def main():
     # Load environment variables
     load_dotenv()
     
+    # Imported after argument parsing so --help doesn't load pandas/BigQuery
+    from etl import Pipeline
+    
     # Initialize pipeline
     pipeline = Pipeline()
     
@@ -69,6 +73,16 @@ def main():
                     'mode': 'export',
                     'export_path': args.file or 'data/airtable_export.csv'
                 }
+            elif source_type in ('mdb', 'access'):
+                if not args.file:
+                    print("--file is required for MDB sources")
+                    return 1
+                source_config = {
+                    'file_path': args.file,
+                    'table_name': args.table
+                }
+            else:
+                source_config = {'file_path': args.file} if args.file else {}
             
             pipeline.setup_source(source_type, source_config)
             
@@ -88,6 +102,8 @@ def main():
         print(f"Records extracted: {stats.get('records_extracted', 0)}")
         print(f"Records loaded: {stats.get('records_loaded', 0)}")
         print(f"Duration: {stats.get('duration', 0):.2f} seconds")
+        for name, source_stats in stats.get('sources', {}).items():
+            print(f"  {name}: {source_stats.get('records_loaded', 0)} rows -> {source_stats.get('table')}")
         
         return 0
         
@@ -0,0 +1 @@
+"""Shared BigQuery utilities for Guttmacher Legislative Tracker"""
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+In-process reader for Access databases (.mdb/.accdb)
+Tables are parsed straight from the Jet/ACE pages by the pure-Python
+access_parser package, returning integer, boolean and date columns instead
+of mdb-export's CSV text. mdbtools is used when access_parser isn't
+installed or can't parse a file; its CSV is then parsed with the column
+types from mdb-schema, so either way columns come out typed at read time.
+
+Backend selection (env: MDB_READER): auto (default), native or mdbtools
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import io
+import logging
+import os
+import re
+import shutil
+import subprocess
+
+import pandas as pd
+
+# access_parser column type codes (Jet data types)
+TYPE_BOOLEAN = 1
+TYPE_INT8 = 2
+TYPE_INT16 = 3
+TYPE_INT32 = 4
+TYPE_MONEY = 5
+TYPE_FLOAT32 = 6
+TYPE_FLOAT64 = 7
+TYPE_DATETIME = 8
+TYPE_NUMERIC = 16
+TYPE_COMPLEX = 18
+
+# Column dtypes, by Jet type code and by mdb-schema type name; anything
+# else (text, memo, binary, GUID) is read as object
+NATIVE_DTYPES = {
+    TYPE_BOOLEAN: 'bool',
+    TYPE_INT8: 'Int64',
+    TYPE_INT16: 'Int64',
+    TYPE_INT32: 'Int64',
+    TYPE_COMPLEX: 'Int64',
+    TYPE_MONEY: 'float64',
+    TYPE_FLOAT32: 'float64',
+    TYPE_FLOAT64: 'float64',
+    TYPE_NUMERIC: 'float64',
+    TYPE_DATETIME: 'datetime64[ns]',
+}
+SCHEMA_DTYPES = {
+    'boolean': 'bool',
+    'byte': 'Int64',
+    'integer': 'Int64',
+    'long integer': 'Int64',
+    'complex': 'Int64',
+    'currency': 'float64',
+    'single': 'float64',
+    'double': 'float64',
+    'numeric': 'float64',
+    'datetime': 'datetime64[ns]',
+}
+
+# mdb-schema's default (access) output
+CREATE_TABLE_PATTERN = re.compile(r"CREATE TABLE \[(.+?)\]\s*\((.*?)\);", re.DOTALL)
+COLUMN_PATTERN = re.compile(r"^\s*\[(.+?)\]\s+([A-Za-z/ ]+?)\s*(?:\(\d+\))?\s*(?:NOT NULL)?\s*,?\s*$")
+
+BACKENDS = ('native', 'mdbtools')
+
+
+def native_reader_available() -> bool:
+    """Whether access_parser is installed"""
+    try:
+        import access_parser  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def mdbtools_available() -> bool:
+    """Whether the mdbtools binaries are on PATH (no subprocess spawned)"""
+    return all(shutil.which(tool) for tool in ('mdb-tables', 'mdb-export', 'mdb-schema'))
+
+
+def reader_available() -> bool:
+    """Whether any Access backend can be used"""
+    return native_reader_available() or mdbtools_available()
+
+
+def parse_mdb_schema(ddl: str) -> Dict[str, Dict[str, str]]:
+    """
+    Column dtypes for every table in mdb-schema output
+
+    Returns:
+        {table: {column: dtype}}
+    """
+    schemas = {}
+    for table, body in CREATE_TABLE_PATTERN.findall(ddl):
+        columns = {}
+        for line in body.splitlines():
+            match = COLUMN_PATTERN.match(line)
+            if match:
+                name, type_name = match.groups()
+                columns[name] = SCHEMA_DTYPES.get(type_name.strip().lower(), 'object')
+        schemas[table] = columns
+    return schemas
+
+
+def _typed_column(values: list, dtype: str) -> pd.Series:
+    """Build a column of the declared dtype from access_parser's parsed values"""
+    series = pd.Series(values, dtype=object)
+    if dtype == 'bool':
+        # Nulls only appear with a damaged null table; keep them as None
+        return series.astype(bool) if series.notna().all() else series
+    if dtype == 'Int64':
+        return pd.to_numeric(series, errors='coerce').astype('Int64')
+    if dtype == 'float64':
+        return pd.to_numeric(series, errors='coerce')
+    if dtype == 'datetime64[ns]':
+        # access_parser renders dates as ISO text, with "(Empty Date)" for nulls
+        return pd.to_datetime(series, format='ISO8601', errors='coerce')
+    return series
+
+
+class AccessDatabase:
+    """Read tables from one Access database file"""
+
+    def __init__(self, path, backend: Optional[str] = None):
+        """
+        Open a database
+
+        Args:
+            path: .mdb/.accdb file
+            backend: 'native', 'mdbtools' or None to choose automatically
+                (env: MDB_READER)
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if not self.path.exists():
+            raise FileNotFoundError(f"Database file not found: {self.path}")
+
+        backend = backend or os.getenv("MDB_READER", "auto")
+        if backend == "auto":
+            backend = "native" if native_reader_available() else "mdbtools"
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown MDB reader '{backend}', expected one of {BACKENDS}")
+        if backend == "mdbtools" and not mdbtools_available():
+            raise RuntimeError("mdbtools not found. Install: brew install mdbtools (or pip install access_parser)")
+
+        self.backend = backend
+        self._parser = None
+        self._tables = None
+        self._schemas = {}
+        self._mdb_schemas = None
+
+    def _native_parser(self):
+        """Parse the file header and catalog once; None if the file can't be parsed"""
+        if self._parser is None:
+            from access_parser import AccessParser
+            try:
+                self._parser = AccessParser(str(self.path))
+            except Exception as e:
+                if not mdbtools_available():
+                    raise
+                self.logger.warning(f"⚠️ Native reader can't parse {self.path.name} ({e}), using mdbtools")
+                self.backend = "mdbtools"
+        return self._parser
+
+    def _use_native(self) -> bool:
+        return self.backend == "native" and self._native_parser() is not None
+
+    def tables(self) -> List[str]:
+        """User tables in the database (system tables excluded)"""
+        if self._tables is None:
+            if self._use_native():
+                self._tables = [name for name in self._parser.catalog if not name.startswith("MSys")]
+            else:
+                result = subprocess.run(["mdb-tables", "-1", str(self.path)],
+                                        capture_output=True, text=True, timeout=30, check=False)
+                if result.returncode != 0:
+                    raise RuntimeError(f"mdb-tables failed: {result.stderr}")
+                self._tables = [t.strip() for t in result.stdout.split("\n") if t.strip()]
+        return self._tables
+
+    def schema(self, table: str) -> Dict[str, str]:
+        """
+        Declared column dtypes of a table, in column order
+
+        Read from the native catalog, or from a single mdb-schema call
+        covering every table in the file.
+
+        Returns:
+            {column: dtype} with dtypes 'bool', 'Int64', 'float64',
+            'datetime64[ns]' or 'object'
+        """
+        if table not in self._schemas:
+            if self._use_native():
+                self._schemas[table] = {
+                    column.col_name_str: NATIVE_DTYPES.get(column.type, 'object')
+                    for _, column in sorted(self._native_table(table).columns.items())
+                }
+            else:
+                if self._mdb_schemas is None:
+                    result = subprocess.run(["mdb-schema", str(self.path), "access"],
+                                            capture_output=True, text=True, timeout=30, check=False)
+                    if result.returncode != 0:
+                        raise RuntimeError(f"mdb-schema failed: {result.stderr}")
+                    self._mdb_schemas = parse_mdb_schema(result.stdout)
+                self._schemas[table] = self._mdb_schemas.get(table, {})
+        return self._schemas[table]
+
+    def read_table(self, table: str) -> pd.DataFrame:
+        """
+        Read a whole table
+
+        Returns:
+            DataFrame with the table's declared column types (Int64, bool,
+            float64, datetime64; text as object)
+        """
+        if self._use_native():
+            return self._read_native(table)
+        return self._read_mdbtools(table)
+
+    def select_tables(self, pattern: Optional[str] = None) -> List[str]:
+        """User tables whose name matches a regex (all tables if no pattern)"""
+        if not pattern:
+            return list(self.tables())
+        regex = re.compile(pattern, re.IGNORECASE)
+        return [table for table in self.tables() if regex.search(table)]
+
+    def read_tables(self, tables: Optional[List[str]] = None, pattern: Optional[str] = None,
+                    max_workers: int = 4) -> Dict[str, pd.DataFrame]:
+        """
+        Read several tables in parallel from the already opened file
+
+        Args:
+            tables: Table names (default: every table matching pattern)
+            pattern: Regex selecting tables when no names are given
+            max_workers: Tables read at once
+
+        Returns:
+            {table: DataFrame} in table order
+        """
+        tables = tables if tables is not None else self.select_tables(pattern)
+        # Parse the catalog / schema once before the workers share them
+        for table in tables:
+            self.schema(table)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tables) or 1))) as executor:
+            frames = dict(zip(tables, executor.map(self.read_table, tables)))
+        return frames
+
+    def iter_rows(self, table: str) -> Iterator[Dict]:
+        """Typed rows of a table as dicts"""
+        df = self.read_table(table)
+        columns = list(df.columns)
+        for values in df.itertuples(index=False, name=None):
+            yield dict(zip(columns, values))
+
+    def _native_table(self, table: str):
+        if table not in self._parser.catalog:
+            raise KeyError(f"Table '{table}' not found in {self.path.name}")
+        return self._parser.get_table(table)
+
+    def _read_native(self, table: str) -> pd.DataFrame:
+        parsed = self._native_table(table).parse()
+        rows = max((len(values) for values in parsed.values() if isinstance(values, list)), default=0)
+
+        data = {}
+        padded = []
+        for name, dtype in self.schema(table).items():
+            values = parsed.get(name)
+            values = values if isinstance(values, list) else []
+            # Columns the parser skipped or cut short are filled with nulls
+            # so one damaged column doesn't fail the whole table
+            if len(values) < rows:
+                padded.append(name)
+                values = values + [None] * (rows - len(values))
+            data[name] = _typed_column(values, dtype)
+        if padded:
+            self.logger.warning(f"⚠️ '{table}': no parsed values for some rows of {padded}, filled with nulls")
+        return pd.DataFrame(data)
+
+    def _read_mdbtools(self, table: str) -> pd.DataFrame:
+        result = subprocess.run(["mdb-export", str(self.path), table],
+                                capture_output=True, text=True, timeout=120, check=False)
+        if result.returncode != 0:
+            raise RuntimeError(f"mdb-export failed: {result.stderr}")
+        if not result.stdout.strip():
+            return pd.DataFrame()
+
+        schema = self.schema(table)
+        if not schema:
+            self.logger.warning(f"⚠️ No schema for '{table}', inferring column types")
+            return pd.read_csv(io.StringIO(result.stdout), low_memory=False)
+
+        # Booleans are exported as 1/0 (-1 in older files) and dates in a
+        # locale/version dependent format, so both are read as text first
+        read_dtypes = {
+            name: 'Int64' if dtype == 'bool' else str if dtype in ('object', 'datetime64[ns]') else dtype
+            for name, dtype in schema.items()
+        }
+        df = pd.read_csv(io.StringIO(result.stdout), dtype=read_dtypes,
+                         keep_default_na=False, na_values=[''])
+
+        for name, dtype in schema.items():
+            if name not in df.columns:
+                continue
+            if dtype == 'bool':
+                df[name] = df[name].fillna(0).astype(bool)
+            elif dtype == 'datetime64[ns]':
+                df[name] = pd.to_datetime(df[name], errors='coerce')
+        return df
+
+
+@lru_cache(maxsize=2)
+def _open_cached(path: str, mtime_ns: int, backend: Optional[str]) -> AccessDatabase:
+    return AccessDatabase(path, backend)
+
+
+def open_database(path, backend: Optional[str] = None) -> AccessDatabase:
+    """
+    Open a database, reusing the parsed file for repeated calls
+
+    The cache is keyed on the file's modification time, so an updated file
+    is read again.
+    """
+    path = Path(path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Database file not found: {path}")
+    return _open_cached(str(path), path.stat().st_mtime_ns, backend)
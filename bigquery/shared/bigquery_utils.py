@@ -4,37 +4,442 @@ Shared BigQuery utilities for annual pipeline
 """
 
 from google.cloud import bigquery
+from google.cloud import exceptions as google_exceptions
+from typing import Dict, List
 import logging
+import re
 
-def create_or_update_unified_view(client: bigquery.Client, project_id: str, years: list):
-    """Create unified view across all years"""
+from .job_manager import get_job_manager
+from .view_sql import (
+    aggregate_cube_sql,
+    aligned_select_sql,
+    packed_flags_sql,
+    unified_view_sql,
+    unpacked_flags_view_sql,
+)
+
+MATERIALIZED_TABLE = "all_historical_bills_materialized"
+# Bill counts by data_year/state/policy_area/intent/status for dashboards
+AGGREGATE_CUBE_TABLE = "bill_aggregate_cube"
+# Optional bitmask encoding of the boolean flags (shared/policy_flags.py)
+PACKED_FLAGS_TABLE = "bill_flags_packed"
+
+# One integer-range partition per data_year
+YEAR_PARTITION_START = 2000
+YEAR_PARTITION_END = 2051
+
+# Year tables only, not __delta / __layout_migration leftovers
+YEAR_TABLE_PATTERN = re.compile(r"^historical_bills_(\d{4})$")
+
+# Layout for historical_bills_YYYY tables: dashboards filtering on data_year
+# prune every other year's table in the unified view
+YEAR_TABLE_LAYOUT = {
+    'partitioning': {'type': 'range', 'field': 'data_year'},
+    'clustering_fields': ['state'],
+}
+
+
+def list_year_tables(client: bigquery.Client, project_id: str, dataset_id: str) -> list:
+    """List the years that have a historical_bills_YYYY table in a dataset"""
+    years = []
+    for table in client.list_tables(f"{project_id}.{dataset_id}"):
+        match = YEAR_TABLE_PATTERN.match(table.table_id)
+        if match:
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def table_columns(client: bigquery.Client, table_id: str) -> Dict[str, str]:
+    """Column name -> type of a table, in schema order"""
+    return {field.name: field.field_type for field in client.get_table(table_id).schema}
+
+
+def union_columns(schemas: List[Dict[str, str]]) -> Dict[str, str]:
+    """Every column of several schemas in first-seen order (STRING where types differ)"""
+    columns = {}
+    for schema in schemas:
+        for name, column_type in schema.items():
+            if name not in columns:
+                columns[name] = column_type
+            elif columns[name] != column_type:
+                columns[name] = "STRING"
+    return columns
+
+
+def create_or_update_unified_view(client: bigquery.Client, project_id: str, years: list,
+                                  dataset_id: str = "legislative_tracker_historical"):
+    """Create unified view across all years
+
+    The view lives next to the historical_bills_YYYY tables it unions. Year
+    tables are matched by column name, so a year missing a column (or with
+    its columns in another order) contributes NULLs instead of shifting
+    values.
+    """
+    logger = logging.getLogger(__name__)
+
+    tables = [f"historical_bills_{year}" for year in sorted(years)]
+    schemas = [table_columns(client, f"{project_id}.{dataset_id}.{table}") for table in tables]
+    query = unified_view_sql(project_id, dataset_id, tables, union_columns(schemas), schemas)
+
+    get_job_manager(client).run_query(query, label="all_historical_bills_unified")
+
+    logger.info(f"✅ Updated unified view with all years in {dataset_id}")
+
+
+def is_year_partitioned(client: bigquery.Client, table_id: str) -> bool:
+    """Check whether a table exists and is range-partitioned on data_year"""
+    try:
+        table = client.get_table(table_id)
+    except google_exceptions.NotFound:
+        return False
+    return bool(table.range_partitioning and table.range_partitioning.field == "data_year")
+
+
+def refresh_materialized_table(client: bigquery.Client, project_id: str, years: list = None,
+                               dataset_id: str = "legislative_tracker_historical",
+                               source_dataset_id: str = "legislative_tracker_staging",
+                               timeout: int = 600):
+    """Refresh materialized table
+
+    The table is partitioned by data_year and clustered by state. When `years`
+    is given only those partitions are replaced, reading just the matching
+    historical_bills_YYYY tables (by column name, so year tables with other
+    column sets line up). Without `years`, or when the table is missing or
+    still has the old unpartitioned layout, the table is rebuilt from the
+    unified view.
+    """
     logger = logging.getLogger(__name__)
-    
-    # Generate UNION ALL query for all years
-    union_parts = []
-    for year in sorted(years):
-        union_parts.append(f"SELECT * FROM `{project_id}.legislative_tracker_staging.historical_bills_{year}`")
-    
-    query = f"""
-    CREATE OR REPLACE VIEW `{project_id}.legislative_tracker_historical.all_historical_bills_unified` AS
-    {' UNION ALL '.join(union_parts)}
-    """
-    
-    job = client.query(query)
-    job.result()
-    
-    logger.info("✅ Updated unified view with all years")
-
-def refresh_materialized_table(client: bigquery.Client, project_id: str):
-    """Refresh materialized table"""
+
+    table_id = f"{project_id}.{dataset_id}.{MATERIALIZED_TABLE}"
+    partitioned = is_year_partitioned(client, table_id)
+    jobs = get_job_manager(client)
+
+    if years and partitioned:
+        years = sorted(set(years))
+        year_list = ", ".join(str(year) for year in years)
+        columns = table_columns(client, table_id)
+        selects = []
+        for year in years:
+            source_id = f"{project_id}.{source_dataset_id}.historical_bills_{year}"
+            available = table_columns(client, source_id)
+            extra = [name for name in available if name not in columns]
+            if extra:
+                logger.warning(f"⚠️ {source_id} columns not in {MATERIALIZED_TABLE} are left out "
+                               f"until a full rebuild: {extra}")
+            selects.append(aligned_select_sql(source_id, columns, available))
+        column_list = ", ".join(f"`{name}`" for name in columns)
+        # Deleting whole partitions is a metadata-only operation
+        query = f"""
+        BEGIN TRANSACTION;
+        DELETE FROM `{table_id}` WHERE data_year IN ({year_list});
+        INSERT INTO `{table_id}` ({column_list}) {" UNION ALL ".join(selects)};
+        COMMIT TRANSACTION;
+        """
+        jobs.run_query(query, label=MATERIALIZED_TABLE, timeout=timeout)
+    else:
+        rebuild = f"""
+        PARTITION BY RANGE_BUCKET(data_year, GENERATE_ARRAY({YEAR_PARTITION_START}, {YEAR_PARTITION_END}, 1))
+        CLUSTER BY state AS
+        SELECT * FROM `{project_id}.{dataset_id}.all_historical_bills_unified`
+        """
+        if partitioned:
+            jobs.run_query(f"CREATE OR REPLACE TABLE `{table_id}` {rebuild}",
+                           label=MATERIALIZED_TABLE, timeout=timeout)
+        else:
+            # Partitioning can't be changed by CREATE OR REPLACE: build the
+            # new table aside so the old one stays until it can be swapped
+            temp_id = _migration_table_id(table_id)
+            client.delete_table(temp_id, not_found_ok=True)
+            jobs.run_query(f"CREATE OR REPLACE TABLE `{temp_id}` {rebuild}",
+                           label=MATERIALIZED_TABLE, timeout=timeout)
+            _swap_in_table(client, temp_id, table_id, YEAR_TABLE_LAYOUT)
+
+    if years and partitioned:
+        logger.info(f"✅ Refreshed materialized table partitions: {year_list}")
+    else:
+        logger.info("✅ Rebuilt materialized table")
+
+
+def refresh_derived_table(client: bigquery.Client, table_id: str, select_sql, years: list = None,
+                          cluster_by: str = "state", timeout: int = 600) -> bool:
+    """Refresh a data_year-partitioned table computed from the materialized table
+
+    Args:
+        table_id: Fully qualified table to refresh
+        select_sql: Function of years (None for all) returning the SELECT
+        years: Replace only these years' partitions; without them, or when
+            the table is missing, it is rebuilt
+        cluster_by: CLUSTER BY columns for a rebuild
+
+    Returns:
+        True if only the partitions for `years` were replaced
+    """
+    incremental = bool(years) and is_year_partitioned(client, table_id)
+
+    if incremental:
+        year_list = ", ".join(str(year) for year in sorted(set(years)))
+        query = f"""
+        BEGIN TRANSACTION;
+        DELETE FROM `{table_id}` WHERE data_year IN ({year_list});
+        INSERT INTO `{table_id}` {select_sql(years)};
+        COMMIT TRANSACTION;
+        """
+    else:
+        query = f"""
+        CREATE OR REPLACE TABLE `{table_id}`
+        PARTITION BY RANGE_BUCKET(data_year, GENERATE_ARRAY({YEAR_PARTITION_START}, {YEAR_PARTITION_END}, 1))
+        CLUSTER BY {cluster_by} AS
+        {select_sql(None)}
+        """
+
+    get_job_manager(client).run_query(query, label=table_id.rsplit(".", 1)[-1], timeout=timeout)
+    return incremental
+
+
+def refresh_aggregate_cube(client: bigquery.Client, project_id: str, years: list = None,
+                           dataset_id: str = "legislative_tracker_historical",
+                           timeout: int = 600):
+    """Refresh the aggregate cube from the materialized table
+
+    Like the materialized table the cube is partitioned by data_year, so a
+    reloaded year only replaces its own partitions, reading just that year of
+    the (partitioned) materialized table. Refresh the materialized table
+    first. Without `years`, or when the cube is missing, it is rebuilt.
+    """
     logger = logging.getLogger(__name__)
-    
-    query = f"""
-    CREATE OR REPLACE TABLE `{project_id}.legislative_tracker_historical.all_historical_bills_materialized` AS
-    SELECT * FROM `{project_id}.legislative_tracker_historical.all_historical_bills_unified`
-    """
-    
-    job = client.query(query)
-    job.result()
-    
-    logger.info("✅ Refreshed materialized table")
+
+    source_table = f"{project_id}.{dataset_id}.{MATERIALIZED_TABLE}"
+    incremental = refresh_derived_table(
+        client, f"{project_id}.{dataset_id}.{AGGREGATE_CUBE_TABLE}",
+        lambda selected: aggregate_cube_sql(source_table, selected),
+        years=years, cluster_by="state, policy_area", timeout=timeout
+    )
+
+    if incremental:
+        logger.info(f"✅ Refreshed aggregate cube partitions: {', '.join(str(year) for year in sorted(set(years)))}")
+    else:
+        logger.info("✅ Rebuilt aggregate cube")
+
+
+def refresh_packed_flags(client: bigquery.Client, project_id: str, years: list = None,
+                         dataset_id: str = "legislative_tracker_historical",
+                         timeout: int = 600):
+    """Refresh the bitmask-encoded flag table and its unpacking view
+
+    bill_flags_packed keeps each bill's key with its boolean flags packed
+    into policy_flags / policy_flags_null (see shared/policy_flags.py);
+    bill_flags_unpacked restores the columns. Refreshed per year from the
+    materialized table like the aggregate cube.
+    """
+    logger = logging.getLogger(__name__)
+
+    source_table = f"{project_id}.{dataset_id}.{MATERIALIZED_TABLE}"
+    incremental = refresh_derived_table(
+        client, f"{project_id}.{dataset_id}.{PACKED_FLAGS_TABLE}",
+        lambda selected: packed_flags_sql(source_table, selected),
+        years=years, timeout=timeout
+    )
+    if not incremental:
+        get_job_manager(client).run_query(unpacked_flags_view_sql(project_id, dataset_id),
+                                          label="bill_flags_unpacked")
+
+    logger.info(f"✅ {'Refreshed' if incremental else 'Rebuilt'} packed policy flags")
+
+
+def apply_table_layout(job_config, layout: dict):
+    """Set partitioning and clustering from a destination config on a job config
+
+    Layout keys (both optional):
+        - partitioning: {'type': 'time', 'field': ..., 'granularity': 'DAY'}
+          or {'type': 'range', 'field': ..., 'start': ..., 'end': ..., 'interval': ...}
+        - clustering_fields: list of up to four column names
+    """
+    partitioning = layout.get('partitioning')
+    if partitioning:
+        partition_type = partitioning.get('type', 'time')
+        if partition_type == 'time':
+            job_config.time_partitioning = bigquery.TimePartitioning(
+                type_=partitioning.get('granularity', 'DAY').upper(),
+                field=partitioning.get('field')
+            )
+        elif partition_type == 'range':
+            job_config.range_partitioning = bigquery.RangePartitioning(
+                field=partitioning['field'],
+                range_=bigquery.PartitionRange(
+                    start=partitioning.get('start', YEAR_PARTITION_START),
+                    end=partitioning.get('end', YEAR_PARTITION_END),
+                    interval=partitioning.get('interval', 1)
+                )
+            )
+        else:
+            raise ValueError(f"Unknown partitioning type: {partition_type}")
+
+    if layout.get('clustering_fields'):
+        job_config.clustering_fields = list(layout['clustering_fields'])
+
+    return job_config
+
+
+def table_layout_matches(table: bigquery.Table, layout: dict) -> bool:
+    """Check whether an existing table already has the requested layout"""
+    expected = apply_table_layout(bigquery.QueryJobConfig(), layout)
+
+    if expected.time_partitioning:
+        actual = table.time_partitioning
+        if not actual or (actual.type_, actual.field) != (
+            expected.time_partitioning.type_, expected.time_partitioning.field
+        ):
+            return False
+    elif table.time_partitioning:
+        return False
+
+    if expected.range_partitioning:
+        actual = table.range_partitioning
+        wanted = expected.range_partitioning
+        if not actual or (actual.field, actual.range_.start, actual.range_.end, actual.range_.interval) != (
+            wanted.field, wanted.range_.start, wanted.range_.end, wanted.range_.interval
+        ):
+            return False
+    elif table.range_partitioning:
+        return False
+
+    return list(table.clustering_fields or []) == list(expected.clustering_fields or [])
+
+
+def layout_ddl(layout: dict, schema=None) -> str:
+    """PARTITION BY / CLUSTER BY clauses matching a destination layout
+
+    Args:
+        layout: Same keys as apply_table_layout
+        schema: Table schema, used to pick the truncation function for a
+            time-partitioning column (DATE, DATETIME or TIMESTAMP)
+    """
+    clauses = []
+    partitioning = layout.get('partitioning')
+    if partitioning:
+        partition_type = partitioning.get('type', 'time')
+        field = partitioning.get('field')
+        if partition_type == 'range':
+            clauses.append(
+                f"PARTITION BY RANGE_BUCKET({field}, GENERATE_ARRAY("
+                f"{partitioning.get('start', YEAR_PARTITION_START)}, "
+                f"{partitioning.get('end', YEAR_PARTITION_END)}, "
+                f"{partitioning.get('interval', 1)}))"
+            )
+        elif partition_type == 'time':
+            if not field:
+                raise ValueError("Ingestion-time partitioning can't be set from a query")
+            granularity = partitioning.get('granularity', 'DAY').upper()
+            field_type = next((f.field_type for f in schema or [] if f.name == field), 'TIMESTAMP')
+            if field_type == 'DATE':
+                expression = field if granularity == 'DAY' else f"DATE_TRUNC({field}, {granularity})"
+            else:
+                expression = f"{field_type}_TRUNC({field}, {granularity})"
+            clauses.append(f"PARTITION BY {expression}")
+        else:
+            raise ValueError(f"Unknown partitioning type: {partition_type}")
+
+    if layout.get('clustering_fields'):
+        clauses.append(f"CLUSTER BY {', '.join(layout['clustering_fields'])}")
+    return "\n    ".join(clauses)
+
+
+def _swap_in_table(client: bigquery.Client, temp_id: str, table_id: str, layout: dict):
+    """Replace table_id with the contents of temp_id, then drop temp_id
+
+    The live table is only replaced once the new data exists in temp_id. If
+    BigQuery refuses to replace a table with a different partitioning spec,
+    the table is dropped and recreated from temp_id, which still holds the
+    data, so a failure leaves it there for a rerun.
+    """
+    jobs = get_job_manager(client)
+    name = table_id.split('.')[-1]
+    ddl = layout_ddl(layout, client.get_table(temp_id).schema)
+    select = f"AS SELECT * FROM `{temp_id}`"
+
+    try:
+        jobs.run_query(f"CREATE OR REPLACE TABLE `{table_id}`\n    {ddl}\n    {select}",
+                       label=f"swap {name}")
+    except google_exceptions.BadRequest:
+        jobs.run_query(f"""
+        DROP TABLE IF EXISTS `{table_id}`;
+        CREATE TABLE `{table_id}`
+        {ddl}
+        {select};
+        """, label=f"recreate {name}")
+
+    client.delete_table(temp_id, not_found_ok=True)
+
+
+def _migration_table_id(table_id: str) -> str:
+    return f"{table_id}__layout_migration"
+
+
+def _needs_layout_migration(client: bigquery.Client, table_id: str, layout: dict) -> bool:
+    if not layout:
+        return False
+    try:
+        table = client.get_table(table_id)
+    except google_exceptions.NotFound:
+        return False
+    return table.table_type == "TABLE" and not table_layout_matches(table, layout)
+
+
+def ensure_table_layout(client: bigquery.Client, table_id: str, layout: dict) -> bool:
+    """Migrate an existing table to the requested partitioning and clustering
+
+    Partitioning can't be altered in place, so the data is copied into a
+    temporary table with the right layout which then replaces the original.
+
+    Returns:
+        True if the table was migrated
+    """
+    logger = logging.getLogger(__name__)
+
+    if not _needs_layout_migration(client, table_id, layout):
+        return False
+
+    temp_id = _migration_table_id(table_id)
+    job_config = apply_table_layout(bigquery.QueryJobConfig(
+        destination=temp_id,
+        write_disposition="WRITE_TRUNCATE",
+        create_disposition="CREATE_IF_NEEDED"
+    ), layout)
+    client.delete_table(temp_id, not_found_ok=True)
+    get_job_manager(client).run_query(f"SELECT * FROM `{table_id}`", job_config=job_config,
+                                      label=f"copy {table_id.split('.')[-1]} to new layout")
+    _swap_in_table(client, temp_id, table_id, layout)
+
+    logger.info(f"♻️ Migrated {table_id} to partitioned/clustered layout")
+    return True
+
+
+def load_with_layout(client: bigquery.Client, df, table_id: str,
+                     job_config: bigquery.LoadJobConfig, layout: dict, timeout: float = None):
+    """Load a DataFrame into a table with the requested partitioning and clustering
+
+    Appends migrate an existing table first. A replacing load into a table
+    with another layout goes to a temporary table which then takes over,
+    so the existing table survives a failed load.
+
+    Returns:
+        The finished LoadJob
+    """
+    logger = logging.getLogger(__name__)
+    jobs = get_job_manager(client)
+    if layout:
+        apply_table_layout(job_config, layout)
+
+    if job_config.write_disposition != bigquery.WriteDisposition.WRITE_TRUNCATE:
+        ensure_table_layout(client, table_id, layout)
+        return jobs.run_load(df, table_id, job_config=job_config, timeout=timeout)
+
+    if not _needs_layout_migration(client, table_id, layout):
+        return jobs.run_load(df, table_id, job_config=job_config, timeout=timeout)
+
+    temp_id = _migration_table_id(table_id)
+    client.delete_table(temp_id, not_found_ok=True)
+    job = jobs.run_load(df, temp_id, job_config=job_config, timeout=timeout)
+    _swap_in_table(client, temp_id, table_id, layout)
+    logger.info(f"♻️ Reloaded {table_id} with the new layout")
+    return job
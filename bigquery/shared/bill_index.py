@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+In-memory index of harmonized bills by state, year and bill number
+A hash index on unique_bill_key (state-bill_number-year) answers exact and
+cross-year lookups and joins in O(1); a sorted index on state, year and bill
+number answers "all bills for a state (and year)" with a binary search. The
+indexed frame can be saved next to the query cache and reloaded while the
+source tables are unchanged.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent / ".query_cache" / "bill_index"
+KEY_COLUMN = "bill_key"
+METADATA_KEY = b"guttmacher.bill_index"
+
+
+def normalize_bill_number(values: pd.Series) -> pd.Series:
+    """Uppercase bill numbers without spaces or periods ('H.B. 12' -> 'HB12')"""
+    return values.astype("string").str.upper().str.replace(r"[\s.]+", "", regex=True)
+
+
+def bill_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Normalized unique_bill_key for every row
+
+    Returns:
+        'STATE-BILLNUMBER-YEAR' strings, <NA> where a part is missing
+    """
+    state = df["state"].astype("string").str.strip().str.upper()
+    year = pd.to_numeric(df["data_year"], errors="coerce").astype("Int64").astype("string")
+    return state + "-" + normalize_bill_number(df["bill_number"]) + "-" + year
+
+
+def index_dir(path: Optional[str] = None) -> Path:
+    """Where indexes are saved (env: BILL_INDEX_DIR, default .query_cache/bill_index)"""
+    return Path(path or os.getenv("BILL_INDEX_DIR") or DEFAULT_INDEX_DIR)
+
+
+class BillIndex:
+    """Hash and sorted indexes over a frame of harmonized bills"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Index a frame
+
+        Args:
+            df: Bills with state, bill_number and data_year columns (any
+                other columns are kept and returned by lookups)
+        """
+        keys = df[KEY_COLUMN] if KEY_COLUMN in df.columns else bill_keys(df)
+        # Missing states/years sort last so the sorted arrays stay ordered
+        states = df["state"].astype("string").str.strip().str.upper().fillna("\uffff")
+        years = (pd.to_numeric(df["data_year"], errors="coerce").astype("Int64")
+                 .fillna(np.iinfo(np.int64).max))
+
+        # Stored sorted by state, year, bill number so range lookups are slices
+        frame = df.assign(**{KEY_COLUMN: keys, "_state": states, "_year": years.astype(np.int64)})
+        frame = frame.sort_values(["_state", "_year", KEY_COLUMN], kind="stable", na_position="last")
+        self._states = frame["_state"].to_numpy(dtype=str)
+        self._years = frame["_year"].to_numpy()
+        self.df = frame.drop(columns=["_state", "_year"]).reset_index(drop=True)
+
+        self._keys = pd.Index(self.df[KEY_COLUMN])
+        # Cross-year lookups: same key without the year
+        self._bills = pd.Index(self.df[KEY_COLUMN].str.rsplit("-", n=1).str[0])
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    @staticmethod
+    def key(state: str, bill_number: str, year: Optional[int] = None) -> str:
+        """Normalized key for one bill (without the year for cross-year lookups)"""
+        bill = normalize_bill_number(pd.Series([bill_number])).iloc[0]
+        key = f"{state.strip().upper()}-{bill}"
+        return key if year is None else f"{key}-{int(year)}"
+
+    def lookup(self, state: str, bill_number: str, year: Optional[int] = None) -> pd.DataFrame:
+        """Rows for a bill in one year, or in every year when no year is given"""
+        index = self._bills if year is None else self._keys
+        key = self.key(state, bill_number, year)
+        if key not in index:
+            return self.df.iloc[0:0]
+        positions = index.get_loc(key)
+        if isinstance(positions, (int, np.integer)):
+            positions = [positions]
+        return self.df.iloc[positions]
+
+    def bills(self, state: str, year: Optional[int] = None) -> pd.DataFrame:
+        """Every bill for a state, optionally in one year (binary search)"""
+        state = state.strip().upper()
+        start = np.searchsorted(self._states, state, side="left")
+        end = np.searchsorted(self._states, state, side="right")
+        if year is not None:
+            years = self._years[start:end]
+            start, end = (start + np.searchsorted(years, int(year), side="left"),
+                          start + np.searchsorted(years, int(year), side="right"))
+        return self.df.iloc[start:end]
+
+    def duplicates(self) -> pd.DataFrame:
+        """Rows whose key appears more than once (missing keys excluded)"""
+        keys = self.df[KEY_COLUMN]
+        return self.df[keys.notna() & keys.duplicated(keep=False)]
+
+    def positions(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Row of this index matching each row of another frame (-1 if absent)
+
+        Duplicate keys match their first occurrence.
+        """
+        keys = df[KEY_COLUMN] if KEY_COLUMN in df.columns else bill_keys(df)
+        if self._keys.is_unique:
+            return self._keys.get_indexer(keys)
+        first = self.df[KEY_COLUMN].dropna().drop_duplicates()
+        matches = pd.Index(first).get_indexer(keys)
+        return np.where(matches >= 0, first.index.to_numpy()[matches], -1)
+
+    def join(self, df: pd.DataFrame, columns: Optional[list] = None,
+             suffix: str = "_indexed") -> pd.DataFrame:
+        """Add this index's columns to another frame by bill key (left join)"""
+        positions = self.positions(df)
+        columns = columns or [col for col in self.df.columns if col != KEY_COLUMN]
+        matched = self.df[columns].reindex(np.where(positions >= 0, positions, len(self.df)))
+        matched.index = df.index
+        return df.join(matched, rsuffix=suffix)
+
+    def save(self, name: str, version: Optional[str] = None, path: Optional[str] = None) -> Path:
+        """
+        Save the indexed frame as Parquet
+
+        Args:
+            name: File name (e.g. the table or query it was built from)
+            version: Identifies the source data; load() rejects other versions
+            path: Directory (see index_dir)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            METADATA_KEY: json.dumps({
+                'version': version,
+                'rows': len(self.df),
+                'built_at': datetime.now().isoformat(timespec='seconds'),
+            }).encode(),
+        })
+
+        directory = index_dir(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"{name}.parquet"
+        temp_path = directory / f".{name}.parquet.tmp"
+        pq.write_table(table, temp_path, compression="zstd")
+        temp_path.replace(target)
+        return target
+
+    @classmethod
+    def load(cls, name: str, version: Optional[str] = None,
+             path: Optional[str] = None) -> Optional["BillIndex"]:
+        """Saved index, or None if missing or built from another version"""
+        import pyarrow.parquet as pq
+
+        source = index_dir(path) / f"{name}.parquet"
+        if not source.exists():
+            return None
+        metadata = pq.read_schema(source).metadata or {}
+        saved = json.loads(metadata[METADATA_KEY]) if METADATA_KEY in metadata else {}
+        if version is not None and saved.get('version') != version:
+            return None
+        return cls(pq.read_table(source).to_pandas())
+
+
+def cached_bill_index(name: str, version: Optional[str], build_frame,
+                      path: Optional[str] = None) -> BillIndex:
+    """
+    Load a saved index, rebuilding and saving it when the source changed
+
+    Args:
+        name: Index file name
+        version: Source version (e.g. a QueryCache key); None always rebuilds
+        build_frame: Called without arguments to produce the frame to index
+    """
+    index = BillIndex.load(name, version, path) if version is not None else None
+    if index is None:
+        index = BillIndex(build_frame())
+        if version is not None:
+            index.save(name, version, path)
+    return index
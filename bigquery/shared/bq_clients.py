@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Process-wide BigQuery client pool
+Credentials are resolved once and every client shares one authorized HTTP
+session, so imports and utilities running in the same process don't repeat
+the auth handshake or open a connection pool per client
+"""
+
+from google.cloud import bigquery
+from typing import Optional
+import logging
+import os
+import threading
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+# requests defaults to 10 connections per host, fewer than the job
+# manager keeps in flight when several years load at once
+DEFAULT_HTTP_POOL_SIZE = 32
+
+_lock = threading.Lock()
+_clients = {}
+_credentials = None
+_default_project = None
+_session = None
+
+
+def _load_credentials():
+    """Resolve application default credentials once per process"""
+    global _credentials, _default_project
+    if _credentials is None:
+        _credentials, _default_project = google.auth.default(scopes=bigquery.Client.SCOPE)
+    return _credentials
+
+
+def _authorized_session() -> AuthorizedSession:
+    """Shared session with a connection pool sized for concurrent jobs"""
+    global _session
+    if _session is None:
+        pool_size = int(os.getenv("BQ_HTTP_POOL_SIZE", DEFAULT_HTTP_POOL_SIZE))
+        session = AuthorizedSession(_load_credentials())
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+        logging.getLogger(__name__).debug(f"🔌 BigQuery HTTP pool: {pool_size} connections")
+    return _session
+
+
+def get_client(project: Optional[str] = None) -> bigquery.Client:
+    """
+    Shared BigQuery client for a project
+
+    Args:
+        project: GCP project (defaults to GCP_PROJECT_ID, then the
+            credentials' project)
+
+    Returns:
+        The same client for every call with the same project
+    """
+    project = project or os.getenv("GCP_PROJECT_ID")
+    with _lock:
+        credentials = _load_credentials()
+        project = project or _default_project
+        client = _clients.get(project)
+        if client is None:
+            client = bigquery.Client(
+                project=project,
+                credentials=credentials,
+                _http=_authorized_session(),
+            )
+            _clients[project] = client
+        return client
+
+
+def clear_clients():
+    """Close the shared session and forget cached clients (e.g. after forking)"""
+    global _credentials, _default_project, _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _clients.clear()
+        _credentials = None
+        _default_project = None
+        _session = None
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware execution of DDL statements
+Runs independent CREATE statements concurrently, waiting only on the
+statements whose objects they reference
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional, Set
+import logging
+import re
+
+CREATE_PATTERN = re.compile(
+    r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:TEMP(?:ORARY)?\s+)?"
+    r"(?:MATERIALIZED\s+VIEW|VIEW|TABLE\s+FUNCTION|TABLE|FUNCTION|PROCEDURE)\s+"
+    r"(?:IF\s+NOT\s+EXISTS\s+)?`?([\w.-]+)`?",
+    re.IGNORECASE
+)
+
+# Backtick-quoted names plus unquoted dataset.table after FROM/JOIN
+QUOTED_REFERENCE_PATTERN = re.compile(r"`([\w-]+(?:\.[\w-]+){1,2})`")
+UNQUOTED_REFERENCE_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN)\s+([\w-]+\.[\w-]+(?:\.[\w-]+)?)\b", re.IGNORECASE
+)
+
+
+def normalize_object_name(name: str) -> str:
+    """Reduce project.dataset.table or dataset.table to dataset.table"""
+    parts = name.strip('`').lower().split('.')
+    return '.'.join(parts[-2:])
+
+
+def created_object(sql: str) -> Optional[str]:
+    """Name of the object a CREATE statement defines, or None"""
+    match = CREATE_PATTERN.match(strip_comments(sql))
+    return normalize_object_name(match.group(1)) if match else None
+
+
+def referenced_objects(sql: str) -> Set[str]:
+    """Names of every table or view a statement reads from"""
+    text = strip_comments(sql)
+    names = QUOTED_REFERENCE_PATTERN.findall(text) + UNQUOTED_REFERENCE_PATTERN.findall(text)
+    references = {normalize_object_name(name) for name in names}
+    references.discard(created_object(sql))
+    return references
+
+
+def strip_comments(sql: str) -> str:
+    """Remove -- line comments so they don't affect parsing"""
+    return re.sub(r"--[^\n]*", "", sql)
+
+
+def build_dependencies(statements: List[str]) -> Dict[int, Set[int]]:
+    """
+    Infer which earlier statements each statement must wait for
+
+    A CREATE statement depends on the most recent earlier statement that
+    created any object it references (or that redefines the same object).
+    Anything that isn't a CREATE is treated as a barrier that depends on
+    everything before it and that everything after it depends on.
+
+    Returns:
+        Mapping of statement index to the indexes it depends on
+    """
+    dependencies = {}
+    creators = {}
+    barrier = None
+
+    for index, sql in enumerate(statements):
+        name = created_object(sql)
+
+        if name is None:
+            dependencies[index] = set(range(index))
+            barrier = index
+            continue
+
+        needs = set()
+        if barrier is not None:
+            needs.add(barrier)
+        for reference in referenced_objects(sql) | {name}:
+            if reference in creators:
+                needs.add(creators[reference])
+
+        dependencies[index] = needs
+        creators[name] = index
+
+    return dependencies
+
+
+def run_statements(runner, statements: List[str], labels: List[str] = None,
+                   max_workers: int = 4, timeout: float = 300) -> Dict[int, Optional[Exception]]:
+    """
+    Run statements concurrently, respecting inferred dependencies
+
+    Args:
+        runner: Object with a run(sql, timeout=..., label=...) method,
+            e.g. QueryRunner
+        statements: SQL statements in their original (serial) order
+        labels: Optional display names, one per statement
+        max_workers: Maximum number of jobs in flight
+        timeout: Per-statement result timeout in seconds
+
+    Returns:
+        Mapping of statement index to None on success or the exception
+        raised; statements skipped because a dependency failed are included
+    """
+    logger = logging.getLogger(__name__)
+    labels = labels or [f"statement {i + 1}/{len(statements)}" for i in range(len(statements))]
+    dependencies = build_dependencies(statements)
+
+    results = {}
+    running = {}
+    remaining = dict(dependencies)
+
+    def ready():
+        return [i for i, needs in remaining.items() if needs <= set(results)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while remaining or running:
+            for index in sorted(ready()):
+                del remaining[index]
+                failed = [dep for dep in dependencies[index] if results[dep] is not None]
+                if failed:
+                    results[index] = RuntimeError(
+                        f"skipped: depends on failed {labels[failed[0]]}"
+                    )
+                    logger.error("✗ %s skipped (dependency failed)", labels[index])
+                    continue
+
+                logger.info("Executing %s", labels[index])
+                future = executor.submit(
+                    runner.run, statements[index], timeout=timeout, label=labels[index]
+                )
+                running[future] = index
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                error = future.exception()
+                results[index] = error
+                if error is None:
+                    logger.info("✓ %s completed", labels[index])
+                else:
+                    logger.error("✗ %s failed: %s", labels[index], error)
+
+    return results
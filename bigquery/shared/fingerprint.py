@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Content fingerprints for harmonized year tables
+A digest of the harmonized rows is stored as a table label so imports can
+skip reloading a year whose content hasn't changed
+"""
+
+from google.cloud import bigquery
+from google.cloud import exceptions as google_exceptions
+from typing import Iterable, Optional
+import hashlib
+import logging
+
+import pandas as pd
+
+DIGEST_LABEL = "content_digest"
+
+# Stamped at load time, so they differ on every run
+VOLATILE_COLUMNS = ('migration_date', 'import_date')
+
+
+def row_hashes(df: pd.DataFrame, exclude: Iterable[str] = VOLATILE_COLUMNS) -> pd.Series:
+    """64-bit hash of every row over the harmonized columns (column order ignored)"""
+    columns = sorted(col for col in df.columns if col not in set(exclude))
+    return pd.util.hash_pandas_object(df[columns], index=False)
+
+
+def table_digest(df: pd.DataFrame, exclude: Iterable[str] = VOLATILE_COLUMNS) -> str:
+    """
+    Digest of a whole table, independent of row and column order
+
+    Returns:
+        32 hex characters, short enough for a BigQuery label value
+    """
+    columns = sorted(col for col in df.columns if col not in set(exclude))
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(columns).encode())
+    digest.update(str(list(df[columns].dtypes.astype(str))).encode())
+    digest.update(row_hashes(df, exclude).sort_values().to_numpy().tobytes())
+    return digest.hexdigest()[:32]
+
+
+def stored_digest(client: bigquery.Client, table_id: str) -> Optional[str]:
+    """Digest recorded on an existing table, or None"""
+    try:
+        table = client.get_table(table_id)
+    except google_exceptions.NotFound:
+        return None
+    return (table.labels or {}).get(DIGEST_LABEL)
+
+
+def save_digest(client: bigquery.Client, table_id: str, digest: str):
+    """Record a digest on a table's labels"""
+    table = client.get_table(table_id)
+    table.labels = {**(table.labels or {}), DIGEST_LABEL: digest}
+    client.update_table(table, ["labels"])
+
+
+def content_unchanged(client: bigquery.Client, table_id: str, df: pd.DataFrame) -> bool:
+    """Check whether a table already holds exactly this content"""
+    logger = logging.getLogger(__name__)
+
+    digest = table_digest(df)
+    previous = stored_digest(client, table_id)
+    if previous == digest:
+        logger.info(f"⏭️ {table_id} unchanged (digest {digest[:12]})")
+        return True
+
+    if previous:
+        logger.info(f"🔁 {table_id} content changed ({previous[:12]} → {digest[:12]})")
+    return False
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Shared BigQuery job orchestration
+Submits query and load jobs from a bounded worker pool, polls them with
+backoff, and retries transient failures, so callers can overlap the wait on
+several jobs instead of blocking on each job.result() in turn
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from google.api_core import exceptions as api_exceptions
+from google.cloud import bigquery
+from typing import Callable
+import asyncio
+import logging
+import os
+import threading
+import time
+
+# Job error reasons worth resubmitting
+RETRYABLE_REASONS = {'backendError', 'internalError', 'rateLimitExceeded', 'jobBackendError'}
+RETRYABLE_EXCEPTIONS = (
+    api_exceptions.InternalServerError,
+    api_exceptions.BadGateway,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.TooManyRequests,
+)
+
+DEFAULT_MAX_CONCURRENT_JOBS = 8
+DEFAULT_JOB_RETRIES = 3
+
+
+class JobManager:
+    """Bounded, retrying executor for BigQuery jobs exposing futures and awaitables"""
+
+    def __init__(self, client: bigquery.Client, max_concurrent: int = None,
+                 timeout: float = None, retries: int = None,
+                 poll_interval: float = 0.5, max_poll_interval: float = 10.0):
+        """
+        Initialize the manager
+
+        Args:
+            client: BigQuery client used to submit jobs
+            max_concurrent: Jobs in flight at once (env: BQ_MAX_CONCURRENT_JOBS)
+            timeout: Default seconds before a job is cancelled (env: BQ_JOB_TIMEOUT;
+                unset waits for jobs however long they take)
+            retries: Resubmissions after a transient failure (env: BQ_JOB_RETRIES)
+            poll_interval: First wait between status checks, grown 1.5x per poll
+            max_poll_interval: Upper bound for the wait between status checks
+        """
+        self.client = client
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if max_concurrent is None:
+            max_concurrent = int(os.getenv("BQ_MAX_CONCURRENT_JOBS", DEFAULT_MAX_CONCURRENT_JOBS))
+        if timeout is None and os.getenv("BQ_JOB_TIMEOUT"):
+            timeout = float(os.getenv("BQ_JOB_TIMEOUT"))
+        if retries is None:
+            retries = int(os.getenv("BQ_JOB_RETRIES", DEFAULT_JOB_RETRIES))
+
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.retries = retries
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="bq-job")
+
+    def submit(self, start: Callable[[], object], label: str = "job",
+               timeout: float = None) -> Future:
+        """
+        Run a job-starting callable in the pool and track the job it returns
+
+        Args:
+            start: Callable that submits a job and returns it (QueryJob/LoadJob)
+            label: Name used in logs
+            timeout: Seconds to wait before cancelling (defaults to the
+                manager's; None waits until the job finishes)
+
+        Returns:
+            Future resolving to the finished job; raises the job's error
+        """
+        return self._executor.submit(self._run, start, label, timeout or self.timeout)
+
+    def submit_query(self, sql: str, job_config: bigquery.QueryJobConfig = None,
+                     label: str = None, timeout: float = None) -> Future:
+        """Submit a query; the future resolves to the finished QueryJob"""
+        return self.submit(
+            lambda: self.client.query(sql, job_config=job_config),
+            label=label or "query", timeout=timeout
+        )
+
+    def submit_load(self, df, table_id: str, job_config: bigquery.LoadJobConfig = None,
+                    label: str = None, timeout: float = None) -> Future:
+        """Submit a DataFrame load; the future resolves to the finished LoadJob"""
+        return self.submit(
+            lambda: self.client.load_table_from_dataframe(df, table_id, job_config=job_config),
+            label=label or f"load {table_id}", timeout=timeout
+        )
+
+    def run_query(self, sql: str, job_config: bigquery.QueryJobConfig = None,
+                  label: str = None, timeout: float = None):
+        """Submit a query and wait for it, returning the finished QueryJob"""
+        return self.submit_query(sql, job_config, label, timeout).result()
+
+    def run_load(self, df, table_id: str, job_config: bigquery.LoadJobConfig = None,
+                 label: str = None, timeout: float = None):
+        """Submit a DataFrame load and wait for it, returning the finished LoadJob"""
+        return self.submit_load(df, table_id, job_config, label, timeout).result()
+
+    async def query_async(self, sql: str, job_config: bigquery.QueryJobConfig = None,
+                          label: str = None, timeout: float = None):
+        """Awaitable variant of run_query"""
+        return await asyncio.wrap_future(self.submit_query(sql, job_config, label, timeout))
+
+    async def load_async(self, df, table_id: str, job_config: bigquery.LoadJobConfig = None,
+                         label: str = None, timeout: float = None):
+        """Awaitable variant of run_load"""
+        return await asyncio.wrap_future(self.submit_load(df, table_id, job_config, label, timeout))
+
+    def _run(self, start: Callable[[], object], label: str, timeout: float):
+        attempt = 0
+        while True:
+            try:
+                job = start()
+                self._wait(job, label, timeout)
+                # Raises the job's error, if any
+                job.result(timeout=timeout)
+                return job
+            except RETRYABLE_EXCEPTIONS as e:
+                error = e
+            except api_exceptions.GoogleAPICallError as e:
+                reasons = {err.get('reason') for err in (getattr(e, 'errors', None) or [])}
+                if not reasons & RETRYABLE_REASONS:
+                    raise
+                error = e
+
+            attempt += 1
+            if attempt > self.retries:
+                raise error
+            delay = min(2 ** attempt, 30)
+            self.logger.warning(f"🔁 {label} failed ({error}); retry {attempt}/{self.retries} in {delay}s")
+            time.sleep(delay)
+
+    def _wait(self, job, label: str, timeout: float):
+        """Poll a job with backoff until it is done, cancelling it if a timeout is set"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = self.poll_interval
+        while not job.done():
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    job.cancel()
+                    raise TimeoutError(f"{label} ({job.job_id}) did not finish within {timeout:.0f}s")
+                wait = min(interval, remaining)
+            time.sleep(wait)
+            interval = min(interval * 1.5, self.max_poll_interval)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and optionally wait for running ones"""
+        self._executor.shutdown(wait=wait)
+
+
+# Attribute holding a client's manager: the manager lives exactly as long
+# as its client, so discarded clients don't keep their pools alive
+MANAGER_ATTRIBUTE = "_job_manager"
+_managers_lock = threading.Lock()
+
+
+def get_job_manager(client: bigquery.Client) -> JobManager:
+    """Process-wide JobManager for a client, so the concurrency cap is shared"""
+    with _managers_lock:
+        manager = getattr(client, MANAGER_ATTRIBUTE, None)
+        if manager is None:
+            manager = JobManager(client)
+            setattr(client, MANAGER_ATTRIBUTE, manager)
+        return manager
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Compact bitmask encoding of the per-bill boolean flags
+The 30 status, policy, intent and bill type columns are packed into one
+integer (bit set = TRUE) plus a NULL mask (bit set = not tracked that year),
+so a multi-category filter is a single bitwise test. Helpers work on pandas
+frames and build the matching BigQuery expressions.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Bit positions are stored in packed tables: only ever append to this list
+FLAG_COLUMNS = [
+    # Status stages
+    'introduced', 'seriously_considered', 'passed_first_chamber', 'passed_second_chamber',
+    'enacted', 'vetoed', 'dead', 'pending',
+    # Policy categories
+    'abortion', 'appropriations', 'contraception', 'emergency_contraception', 'insurance',
+    'minors', 'pregnancy', 'refusal', 'sex_education', 'fetal_issues', 'fetal_tissue',
+    'incarceration', 'period_products', 'stis',
+    # Intent
+    'positive', 'neutral', 'restrictive',
+    # Bill types
+    'legislation', 'resolution', 'ballot_initiative', 'constitutional_amendment', 'court_case',
+]
+
+PACKED_COLUMN = 'policy_flags'
+NULL_MASK_COLUMN = 'policy_flags_null'
+
+# Text spellings of flags in CSV exports (as in migrate_2024_csv.py; Access uses -1)
+TRUE_VALUES = {'true', 't', '1', '-1', 'yes', 'y'}
+FALSE_VALUES = {'false', 'f', '0', 'no', 'n'}
+MISSING_VALUES = {'', 'nan', 'none', '<na>'}
+
+
+def flag_bit(name: str) -> int:
+    """Bit value of one flag"""
+    try:
+        return 1 << FLAG_COLUMNS.index(name)
+    except ValueError:
+        raise KeyError(f"Unknown flag '{name}'") from None
+
+
+def flag_mask(*names: str) -> int:
+    """Bits of several flags, e.g. flag_mask('abortion', 'minors')"""
+    mask = 0
+    for name in names:
+        mask |= flag_bit(name)
+    return mask
+
+
+def to_boolean(values: pd.Series) -> pd.Series:
+    """
+    Nullable boolean view of a flag column
+
+    Numeric values are TRUE when non-zero; text is matched against
+    TRUE_VALUES / FALSE_VALUES, so 'False', '0' or 'N' stay FALSE.
+
+    Raises:
+        ValueError: On text that is not a recognised flag value
+    """
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype('boolean')
+    if pd.api.types.is_numeric_dtype(values):
+        return (values != 0).astype('boolean').mask(values.isna())
+
+    text = values.astype('string').str.strip().str.lower()
+    result = pd.Series(pd.NA, index=values.index, dtype='boolean')
+    result[text.isin(TRUE_VALUES).fillna(False).to_numpy()] = True
+    result[text.isin(FALSE_VALUES).fillna(False).to_numpy()] = False
+
+    # Real booleans/numbers in an object column
+    native = values.map(lambda value: isinstance(value, (bool, np.bool_, int, float, np.number)))
+    native &= values.notna()
+    result[native.to_numpy()] = values[native].astype(float) != 0
+
+    unknown = result.isna() & values.notna() & ~text.isin(MISSING_VALUES).fillna(True)
+    if unknown.any():
+        raise ValueError(
+            f"Column {values.name!r} has non-boolean values: {sorted(values[unknown].astype(str).unique())[:5]}"
+        )
+    return result
+
+
+def encode_flags(df: pd.DataFrame, drop: bool = False) -> pd.DataFrame:
+    """
+    Add the packed flag and NULL mask columns to a frame
+
+    Args:
+        df: Bills with (some of) the FLAG_COLUMNS as booleans, numbers or
+            text (see to_boolean); missing columns are encoded as NULL
+        drop: Remove the boolean columns once packed
+
+    Returns:
+        Copy of the frame with policy_flags and policy_flags_null (int64)
+    """
+    flags = np.zeros(len(df), dtype=np.int64)
+    nulls = np.zeros(len(df), dtype=np.int64)
+
+    for bit, column in enumerate(FLAG_COLUMNS):
+        if column not in df.columns:
+            nulls |= np.int64(1 << bit)
+            continue
+        values = to_boolean(df[column])
+        missing = values.isna().to_numpy()
+        flags |= values.fillna(False).to_numpy(dtype=bool).astype(np.int64) << bit
+        nulls |= missing.astype(np.int64) << bit
+
+    encoded = df.drop(columns=[c for c in FLAG_COLUMNS if c in df.columns]) if drop else df.copy()
+    encoded[PACKED_COLUMN] = flags
+    encoded[NULL_MASK_COLUMN] = nulls
+    return encoded
+
+
+def decode_flags(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                 drop: bool = False) -> pd.DataFrame:
+    """
+    Unpack flag columns from policy_flags / policy_flags_null
+
+    Args:
+        df: Frame with the packed columns
+        columns: Flags to unpack (default: all)
+        drop: Remove the packed columns afterwards
+
+    Returns:
+        Copy of the frame with nullable boolean flag columns
+    """
+    flags = df[PACKED_COLUMN].to_numpy(dtype=np.int64)
+    nulls = (df[NULL_MASK_COLUMN].to_numpy(dtype=np.int64)
+             if NULL_MASK_COLUMN in df.columns else np.zeros(len(df), dtype=np.int64))
+
+    decoded = df.drop(columns=[PACKED_COLUMN, NULL_MASK_COLUMN], errors='ignore') if drop else df.copy()
+    for column in columns or FLAG_COLUMNS:
+        bit = flag_bit(column)
+        decoded[column] = pd.arrays.BooleanArray((flags & bit) != 0, (nulls & bit) != 0)
+    return decoded
+
+
+def has_any(df: pd.DataFrame, *names: str) -> pd.Series:
+    """Rows with at least one of the flags TRUE"""
+    return (df[PACKED_COLUMN] & flag_mask(*names)) != 0
+
+
+def has_all(df: pd.DataFrame, *names: str) -> pd.Series:
+    """Rows with every one of the flags TRUE"""
+    mask = flag_mask(*names)
+    return (df[PACKED_COLUMN] & mask) == mask
+
+
+def pack_flags_sql() -> str:
+    """BigQuery expressions computing policy_flags and policy_flags_null"""
+    flags = " | ".join(f"IF({column}, {1 << bit}, 0)" for bit, column in enumerate(FLAG_COLUMNS))
+    nulls = " | ".join(f"IF({column} IS NULL, {1 << bit}, 0)" for bit, column in enumerate(FLAG_COLUMNS))
+    return f"({flags}) AS {PACKED_COLUMN},\n      ({nulls}) AS {NULL_MASK_COLUMN}"
+
+
+def unpack_flags_sql(columns: Optional[List[str]] = None) -> str:
+    """BigQuery select list restoring the boolean columns (NULL when untracked)"""
+    return ",\n      ".join(
+        f"IF(({NULL_MASK_COLUMN} & {flag_bit(column)}) != 0, NULL, "
+        f"({PACKED_COLUMN} & {flag_bit(column)}) != 0) AS {column}"
+        for column in columns or FLAG_COLUMNS
+    )
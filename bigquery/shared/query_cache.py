@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Local result cache for repeated analysis queries
+Results are stored as Parquet, keyed by the normalized SQL plus the
+last-modified time of every table the query reads (resolving views), so a
+cached result is reused until the underlying data actually changes
+"""
+
+from google.cloud import exceptions as google_exceptions
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+import pandas as pd
+
+from .ddl_graph import QUOTED_REFERENCE_PATTERN, UNQUOTED_REFERENCE_PATTERN, strip_comments
+from .query_runner import format_bytes
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".query_cache"
+DEFAULT_TTL_HOURS = 24 * 7
+DEFAULT_MAX_SIZE_MB = 500
+
+
+def normalize_sql(sql: str) -> str:
+    """Strip comments and collapse whitespace so formatting doesn't change the key"""
+    return re.sub(r"\s+", " ", strip_comments(sql)).strip().rstrip(";")
+
+
+class QueryCache:
+    """Serve repeated queries from local Parquet files instead of BigQuery"""
+
+    def __init__(self, runner, cache_dir: str = None, ttl_hours: float = None,
+                 max_size_mb: float = None, enabled: bool = None):
+        """
+        Initialize the cache
+
+        Args:
+            runner: QueryRunner used for cache misses
+            cache_dir: Where results are stored (env: BQ_CACHE_DIR,
+                default bigquery/.query_cache)
+            ttl_hours: Maximum age of a cached result (env: BQ_CACHE_TTL_HOURS)
+            max_size_mb: Oldest results are evicted above this total size
+                (env: BQ_CACHE_MAX_MB)
+            enabled: Set false to always query BigQuery (env: BQ_QUERY_CACHE,
+                default true)
+        """
+        self.runner = runner
+        self.client = runner.client
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if enabled is None:
+            enabled = os.getenv("BQ_QUERY_CACHE", "true").lower() not in ("0", "false", "no")
+        if ttl_hours is None:
+            ttl_hours = float(os.getenv("BQ_CACHE_TTL_HOURS", DEFAULT_TTL_HOURS))
+        if max_size_mb is None:
+            max_size_mb = float(os.getenv("BQ_CACHE_MAX_MB", DEFAULT_MAX_SIZE_MB))
+
+        self.enabled = enabled
+        self.cache_dir = Path(cache_dir or os.getenv("BQ_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+
+        self.hits = 0
+        self.misses = 0
+
+    def _qualify(self, name: str) -> str:
+        """Add the client's project to dataset.table references"""
+        parts = name.strip('`').split('.')
+        if len(parts) == 2:
+            parts.insert(0, self.client.project)
+        return '.'.join(parts)
+
+    def table_versions(self, sql: str, _seen: set = None) -> dict:
+        """
+        Last-modified time of every base table a query depends on
+
+        Views are followed through their definitions. Returns None when a
+        reference can't be resolved (metadata tables, temp tables, ...), in
+        which case the query isn't cached.
+        """
+        seen = _seen if _seen is not None else set()
+        text = strip_comments(sql)
+        names = QUOTED_REFERENCE_PATTERN.findall(text) + UNQUOTED_REFERENCE_PATTERN.findall(text)
+        if not names:
+            return None
+
+        versions = {}
+        for name in names:
+            table_id = self._qualify(name)
+            if table_id in seen:
+                continue
+            seen.add(table_id)
+
+            try:
+                table = self.client.get_table(table_id)
+            except (google_exceptions.NotFound, ValueError):
+                return None
+
+            if table.table_type == "VIEW":
+                nested = self.table_versions(table.view_query, seen)
+                if nested is None:
+                    return None
+                versions.update(nested)
+            else:
+                versions[table_id] = table.modified.isoformat() if table.modified else None
+
+        return versions
+
+    def cache_key(self, sql: str, versions: dict, job_config=None) -> str:
+        """Hash of the normalized SQL, table versions and query parameters"""
+        payload = {
+            'sql': normalize_sql(sql),
+            'tables': versions,
+            'config': job_config.to_api_repr() if job_config is not None else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def query(self, sql: str, job_config=None, label: str = None) -> pd.DataFrame:
+        """
+        Run a query, reusing a cached result when no referenced table changed
+
+        Returns:
+            Query result as a DataFrame
+        """
+        versions = self.table_versions(sql) if self.enabled else None
+        if versions is None:
+            return self.runner.run(sql, job_config=job_config, label=label).to_dataframe()
+
+        path = self.cache_dir / f"{self.cache_key(sql, versions, job_config)}.parquet"
+        if path.exists() and time.time() - path.stat().st_mtime <= self.ttl_seconds:
+            try:
+                df = pd.read_parquet(path)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Ignoring unreadable cache file {path.name}: {e}")
+            else:
+                self.hits += 1
+                # Access time drives eviction order
+                os.utime(path, (time.time(), path.stat().st_mtime))
+                self.logger.info(f"⚡ Cache hit: {label or path.stem[:12]} ({len(df):,} rows)")
+                return df
+
+        self.misses += 1
+        df = self.runner.run(sql, job_config=job_config, label=label).to_dataframe()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            df.to_parquet(temp_path, index=False)
+            temp_path.replace(path)
+            self.evict()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not cache result: {e}")
+
+        return df
+
+    def evict(self):
+        """Remove expired results, then the least recently used until under the size limit"""
+        if not self.cache_dir.exists():
+            return
+
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            stat = path.stat()
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_atime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Delete every cached result"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.parquet"):
+                path.unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        """One-line hit/miss report"""
+        size = sum(p.stat().st_size for p in self.cache_dir.glob("*.parquet")) if self.cache_dir.exists() else 0
+        return f"{self.hits} cache hits, {self.misses} misses ({format_bytes(size)} cached)"
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Cost-aware query execution for BigQuery
+Dry-runs statements to estimate bytes scanned and records actual usage
+"""
+
+from google.cloud import bigquery
+import logging
+import os
+import re
+import threading
+
+from .job_manager import get_job_manager
+
+# On-demand analysis pricing (USD per TiB scanned)
+DEFAULT_PRICE_PER_TIB = 6.25
+TIB = 1024 ** 4
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a statement is estimated to scan more than the byte limit"""
+
+
+def describe_statement(sql: str, width: int = 80) -> str:
+    """Short one-line label for a SQL statement, used in logs"""
+    text = re.sub(r"\s+", " ", sql).strip()
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def format_bytes(num_bytes: int) -> str:
+    """Human readable byte count"""
+    size = float(num_bytes or 0)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class QueryRunner:
+    """Run queries with a dry-run cost check and per-statement usage tracking"""
+
+    def __init__(self, client: bigquery.Client, maximum_bytes_billed: int = None,
+                 dry_run_first: bool = None, price_per_tib: float = None):
+        """
+        Initialize the runner
+
+        Args:
+            client: BigQuery client used for every statement
+            maximum_bytes_billed: Per-statement byte limit, enforced on the dry
+                run and by BigQuery itself (env: BQ_MAXIMUM_BYTES_BILLED)
+            dry_run_first: Estimate each statement before running it
+                (env: BQ_DRY_RUN_FIRST, default true)
+            price_per_tib: Price used for cost estimates (env: BQ_PRICE_PER_TIB)
+        """
+        self.client = client
+        self.jobs = get_job_manager(client)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if maximum_bytes_billed is None and os.getenv("BQ_MAXIMUM_BYTES_BILLED"):
+            maximum_bytes_billed = int(os.getenv("BQ_MAXIMUM_BYTES_BILLED"))
+        if dry_run_first is None:
+            dry_run_first = os.getenv("BQ_DRY_RUN_FIRST", "true").lower() not in ("0", "false", "no")
+        if price_per_tib is None:
+            price_per_tib = float(os.getenv("BQ_PRICE_PER_TIB", DEFAULT_PRICE_PER_TIB))
+
+        self.maximum_bytes_billed = maximum_bytes_billed
+        self.dry_run_first = dry_run_first
+        self.price_per_tib = price_per_tib
+
+        # One entry per executed statement
+        self.history = []
+        self._lock = threading.Lock()
+
+    def estimate_cost(self, num_bytes: int) -> float:
+        """Estimated on-demand cost in USD for scanning num_bytes"""
+        return (num_bytes or 0) / TIB * self.price_per_tib
+
+    def _copy_config(self, job_config: bigquery.QueryJobConfig = None) -> bigquery.QueryJobConfig:
+        if job_config is None:
+            return bigquery.QueryJobConfig()
+        return bigquery.QueryJobConfig.from_api_repr(job_config.to_api_repr())
+
+    def dry_run(self, sql: str, job_config: bigquery.QueryJobConfig = None) -> int:
+        """
+        Validate a statement and estimate the bytes it would scan
+
+        Returns:
+            Estimated bytes processed
+        """
+        config = self._copy_config(job_config)
+        config.dry_run = True
+        config.use_query_cache = False
+
+        job = self.client.query(sql, job_config=config)
+        return job.total_bytes_processed or 0
+
+    def run(self, sql: str, job_config: bigquery.QueryJobConfig = None,
+            timeout: float = None, label: str = None):
+        """
+        Run a statement and wait for its result
+
+        Args:
+            sql: Statement or script to run
+            job_config: Optional query job config
+            timeout: Seconds to wait for the result
+            label: Name used in logs (defaults to the start of the statement)
+
+        Returns:
+            RowIterator from job.result()
+        """
+        label = label or describe_statement(sql)
+
+        estimated = None
+        if self.dry_run_first:
+            estimated = self.dry_run(sql, job_config)
+            self.logger.info(
+                f"💰 {label}: ~{format_bytes(estimated)} "
+                f"(${self.estimate_cost(estimated):.4f})"
+            )
+            if self.maximum_bytes_billed and estimated > self.maximum_bytes_billed:
+                raise QueryBudgetExceeded(
+                    f"{label} would scan {format_bytes(estimated)}, over the "
+                    f"{format_bytes(self.maximum_bytes_billed)} limit"
+                )
+
+        config = self._copy_config(job_config)
+        if self.maximum_bytes_billed:
+            config.maximum_bytes_billed = self.maximum_bytes_billed
+
+        job = self.jobs.run_query(sql, job_config=config, label=label, timeout=timeout)
+        self._record(label, job, estimated)
+        return job.result()
+
+    def _record(self, label: str, job, estimated: int = None):
+        entry = {
+            'label': label,
+            'job_id': job.job_id,
+            'estimated_bytes': estimated,
+            'bytes_processed': job.total_bytes_processed or 0,
+            'bytes_billed': job.total_bytes_billed or 0,
+            'slot_millis': job.slot_millis or 0,
+            'cache_hit': bool(job.cache_hit),
+        }
+        with self._lock:
+            self.history.append(entry)
+
+        self.logger.info(
+            f"📈 {label}: billed {format_bytes(entry['bytes_billed'])}, "
+            f"{entry['slot_millis']:,} slot-ms"
+        )
+
+    def summary(self) -> dict:
+        """Totals across every statement run so far"""
+        with self._lock:
+            history = list(self.history)
+
+        bytes_billed = sum(entry['bytes_billed'] for entry in history)
+        return {
+            'statements': len(history),
+            'bytes_processed': sum(entry['bytes_processed'] for entry in history),
+            'bytes_billed': bytes_billed,
+            'slot_millis': sum(entry['slot_millis'] for entry in history),
+            'estimated_cost': self.estimate_cost(bytes_billed),
+        }
+
+    def log_summary(self):
+        """Log totals across every statement run so far"""
+        totals = self.summary()
+        self.logger.info(
+            f"💰 {totals['statements']} statements: billed "
+            f"{format_bytes(totals['bytes_billed'])} (${totals['estimated_cost']:.4f}), "
+            f"{totals['slot_millis']:,} slot-ms"
+        )
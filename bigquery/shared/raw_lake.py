@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Local Parquet lake of raw source exports
+Each year's raw table is written to year=YYYY/ (ZSTD-compressed, hive
+partitioned) with its provenance stored in the Parquet schema metadata, so
+re-harmonization, local analysis and disaster recovery can run without
+BigQuery or mdbtools
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DEFAULT_LAKE_DIR = Path(__file__).parent.parent / "raw_lake"
+METADATA_KEY = b"guttmacher.raw_archive"
+PART_FILE = "part-0.parquet"
+
+
+def lake_dir(path: Optional[str] = None) -> Path:
+    """Lake root (env: RAW_LAKE_DIR, default bigquery/raw_lake)"""
+    return Path(path or os.getenv("RAW_LAKE_DIR") or DEFAULT_LAKE_DIR)
+
+
+def partition_path(year: int, root: Optional[str] = None) -> Path:
+    return lake_dir(root) / f"year={year}"
+
+
+def write_year(df: pd.DataFrame, year: int, metadata: Optional[Dict] = None,
+               root: Optional[str] = None) -> Path:
+    """
+    Replace a year's partition with a raw export
+
+    Args:
+        df: Raw source table, original column names and types
+        year: Partition to write
+        metadata: Provenance stored with the schema (source file, table, ...)
+        root: Lake root (see lake_dir)
+
+    Returns:
+        Path of the written Parquet file
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    provenance = {
+        'year': year,
+        'rows': len(df),
+        'column_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'archived_at': datetime.now().isoformat(timespec='seconds'),
+        **(metadata or {}),
+    }
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        METADATA_KEY: json.dumps(provenance, default=str).encode(),
+    })
+
+    partition = partition_path(year, root)
+    partition.mkdir(parents=True, exist_ok=True)
+    path = partition / PART_FILE
+    # Dot-prefixed so dataset scans skip a partially written file
+    temp_path = partition / f".{PART_FILE}.tmp"
+    pq.write_table(table, temp_path, compression="zstd")
+    temp_path.replace(path)
+    return path
+
+
+def lake_years(root: Optional[str] = None) -> List[int]:
+    """Years present in the lake"""
+    base = lake_dir(root)
+    if not base.exists():
+        return []
+    return sorted(
+        int(path.name.split("=", 1)[1]) for path in base.glob("year=*")
+        if path.name.split("=", 1)[1].isdigit() and (path / PART_FILE).exists()
+    )
+
+
+def year_metadata(year: int, root: Optional[str] = None) -> Dict:
+    """Provenance stored with a year's partition"""
+    path = partition_path(year, root) / PART_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No raw lake partition for {year}: {path}")
+    metadata = pq.read_schema(path).metadata or {}
+    return json.loads(metadata[METADATA_KEY]) if METADATA_KEY in metadata else {}
+
+
+def read_year(year: int, columns: Optional[List[str]] = None,
+              root: Optional[str] = None) -> pd.DataFrame:
+    """Read one year's raw table back with its original columns and types"""
+    path = partition_path(year, root) / PART_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No raw lake partition for {year}: {path}")
+    return pq.read_table(path, columns=columns).to_pandas()
+
+
+def read_years(years: Optional[List[int]] = None, columns: Optional[List[str]] = None,
+               root: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read several years as one frame with a year column (partition pruned)
+
+    Columns missing from a year's schema come back as nulls.
+    """
+    base = lake_dir(root)
+    if not lake_years(root):
+        raise FileNotFoundError(f"Raw lake is empty: {base}")
+
+    # Years archived from different databases have different columns
+    schemas = [pq.read_schema(partition_path(year, root) / PART_FILE) for year in lake_years(root)]
+    schema = pa.unify_schemas(schemas + [pa.schema([("year", pa.int32())])],
+                              promote_options="permissive")
+    dataset = ds.dataset(base, format="parquet", partitioning="hive", schema=schema)
+    filter_expression = ds.field("year").isin(years) if years else None
+    if columns is not None and "year" not in columns:
+        columns = list(columns) + ["year"]
+    return dataset.to_table(columns=columns, filter=filter_expression).to_pandas()
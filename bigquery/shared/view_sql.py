@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+View definitions shared by the migration and the local DuckDB mirror
+Written in BigQuery SQL; utilities/duckdb_mirror.py translates them to run
+locally
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .policy_flags import pack_flags_sql, unpack_flags_sql
+
+SQL_DIR = Path(__file__).parent.parent / "sql"
+ANALYTICS_SQL_FILE = SQL_DIR / "state_year_analytics.sql"
+
+
+# Legacy schema type names -> GoogleSQL types usable in CAST
+SQL_TYPES = {'INTEGER': 'INT64', 'FLOAT': 'FLOAT64', 'BOOLEAN': 'BOOL'}
+
+
+def aligned_select_sql(table_ref: str, columns: Dict[str, str], available: Dict[str, str]) -> str:
+    """
+    SELECT projecting one table onto a shared column list
+
+    Args:
+        table_ref: Fully qualified table
+        columns: Target column name -> type, in output order
+        available: Column name -> type of the table; missing columns are
+            selected as typed NULLs, differently typed ones are cast
+    """
+    parts = []
+    for name, column_type in columns.items():
+        sql_type = SQL_TYPES.get(column_type, column_type)
+        if name not in available:
+            parts.append(f"CAST(NULL AS {sql_type}) AS `{name}`")
+        elif available[name] != column_type:
+            parts.append(f"CAST(`{name}` AS {sql_type}) AS `{name}`")
+        else:
+            parts.append(f"`{name}`")
+    return f"SELECT {', '.join(parts)} FROM `{table_ref}`"
+
+
+def unified_view_sql(project_id: str, dataset_id: str, tables: List[str],
+                     columns: Optional[Dict[str, str]] = None,
+                     schemas: Optional[List[Dict[str, str]]] = None) -> str:
+    """
+    DDL for the view unioning every historical_bills_YYYY table
+
+    Args:
+        columns: Shared column list (name -> type); when given with each
+            table's schema the tables are unioned by name, otherwise with
+            SELECT * (tables must then share one column order)
+    """
+    if columns is not None:
+        union_parts = [aligned_select_sql(f"{project_id}.{dataset_id}.{table}", columns, schema)
+                       for table, schema in zip(tables, schemas)]
+    else:
+        union_parts = [f"SELECT * FROM `{project_id}.{dataset_id}.{table}`" for table in tables]
+    return f"""
+    CREATE OR REPLACE VIEW `{project_id}.{dataset_id}.all_historical_bills_unified` AS
+    {' UNION ALL '.join(union_parts)}
+    """
+
+
+def comprehensive_view_sql(project_id: str, dataset_id: str) -> str:
+    """DDL for the authentic comprehensive view (comprehensive_bills_authentic)"""
+    return f"""
+    CREATE OR REPLACE VIEW `{project_id}.{dataset_id}.comprehensive_bills_authentic` AS
+    WITH enhanced_bills AS (
+      SELECT 
+        id,
+        CONCAT(state, '-', bill_number, '-', data_year) as unique_bill_key,
+        data_year,
+        CAST(data_year AS STRING) as data_year_str,
+        state as state_code,
+        CASE state
+          WHEN 'AL' THEN 'Alabama' WHEN 'AK' THEN 'Alaska' WHEN 'AZ' THEN 'Arizona'
+          WHEN 'AR' THEN 'Arkansas' WHEN 'CA' THEN 'California' WHEN 'CO' THEN 'Colorado'
+          WHEN 'CT' THEN 'Connecticut' WHEN 'DE' THEN 'Delaware' WHEN 'FL' THEN 'Florida'
+          WHEN 'GA' THEN 'Georgia' WHEN 'HI' THEN 'Hawaii' WHEN 'ID' THEN 'Idaho'
+          WHEN 'IL' THEN 'Illinois' WHEN 'IN' THEN 'Indiana' WHEN 'IA' THEN 'Iowa'
+          WHEN 'KS' THEN 'Kansas' WHEN 'KY' THEN 'Kentucky' WHEN 'LA' THEN 'Louisiana'
+          WHEN 'ME' THEN 'Maine' WHEN 'MD' THEN 'Maryland' WHEN 'MA' THEN 'Massachusetts'
+          WHEN 'MI' THEN 'Michigan' WHEN 'MN' THEN 'Minnesota' WHEN 'MS' THEN 'Mississippi'
+          WHEN 'MO' THEN 'Missouri' WHEN 'MT' THEN 'Montana' WHEN 'NE' THEN 'Nebraska'
+          WHEN 'NV' THEN 'Nevada' WHEN 'NH' THEN 'New Hampshire' WHEN 'NJ' THEN 'New Jersey'
+          WHEN 'NM' THEN 'New Mexico' WHEN 'NY' THEN 'New York' WHEN 'NC' THEN 'North Carolina'
+          WHEN 'ND' THEN 'North Dakota' WHEN 'OH' THEN 'Ohio' WHEN 'OK' THEN 'Oklahoma'
+          WHEN 'OR' THEN 'Oregon' WHEN 'PA' THEN 'Pennsylvania' WHEN 'RI' THEN 'Rhode Island'
+          WHEN 'SC' THEN 'South Carolina' WHEN 'SD' THEN 'South Dakota' WHEN 'TN' THEN 'Tennessee'
+          WHEN 'TX' THEN 'Texas' WHEN 'UT' THEN 'Utah' WHEN 'VT' THEN 'Vermont'
+          WHEN 'VA' THEN 'Virginia' WHEN 'WA' THEN 'Washington' WHEN 'WV' THEN 'West Virginia'
+          WHEN 'WI' THEN 'Wisconsin' WHEN 'WY' THEN 'Wyoming'
+          ELSE state
+        END as state_name,
+
+        CASE state
+          WHEN 'CT' THEN 'Northeast' WHEN 'ME' THEN 'Northeast' WHEN 'MA' THEN 'Northeast'
+          WHEN 'NH' THEN 'Northeast' WHEN 'NJ' THEN 'Northeast' WHEN 'NY' THEN 'Northeast'
+          WHEN 'PA' THEN 'Northeast' WHEN 'RI' THEN 'Northeast' WHEN 'VT' THEN 'Northeast'
+          WHEN 'IL' THEN 'Midwest' WHEN 'IN' THEN 'Midwest' WHEN 'IA' THEN 'Midwest'
+          WHEN 'KS' THEN 'Midwest' WHEN 'MI' THEN 'Midwest' WHEN 'MN' THEN 'Midwest'
+          WHEN 'MO' THEN 'Midwest' WHEN 'NE' THEN 'Midwest' WHEN 'ND' THEN 'Midwest'
+          WHEN 'OH' THEN 'Midwest' WHEN 'SD' THEN 'Midwest' WHEN 'WI' THEN 'Midwest'
+          WHEN 'AL' THEN 'South' WHEN 'AR' THEN 'South' WHEN 'DE' THEN 'South'
+          WHEN 'FL' THEN 'South' WHEN 'GA' THEN 'South' WHEN 'KY' THEN 'South'
+          WHEN 'LA' THEN 'South' WHEN 'MD' THEN 'South' WHEN 'MS' THEN 'South'
+          WHEN 'NC' THEN 'South' WHEN 'OK' THEN 'South' WHEN 'SC' THEN 'South'
+          WHEN 'TN' THEN 'South' WHEN 'TX' THEN 'South' WHEN 'VA' THEN 'South'
+          WHEN 'WV' THEN 'South'
+          ELSE 'West'
+        END as region,
+
+        CASE 
+          WHEN data_year BETWEEN 2005 AND 2009 THEN '2005-2009'
+          WHEN data_year BETWEEN 2010 AND 2014 THEN '2010-2014'
+          WHEN data_year BETWEEN 2015 AND 2019 THEN '2015-2019'
+          WHEN data_year BETWEEN 2020 AND 2024 THEN '2020-2024'
+          ELSE 'Other'
+        END as time_period,
+
+        bill_type, bill_number, description, history, notes, website_blurb, internal_summary,
+        last_action_date, introduced_date, enacted_date, vetoed_date, date_last_updated, effective_date,
+
+        DATE_DIFF(enacted_date, introduced_date, DAY) as days_to_enactment,
+        DATE_DIFF(last_action_date, introduced_date, DAY) as days_since_introduction,
+
+        introduced, seriously_considered, passed_first_chamber, passed_second_chamber,
+        enacted, vetoed, dead, pending, positive, neutral, restrictive,
+
+        CASE 
+          WHEN enacted = TRUE THEN 'Enacted'
+          WHEN vetoed = TRUE THEN 'Vetoed'
+          WHEN dead = TRUE THEN 'Dead'
+          WHEN pending = TRUE THEN 'Pending'
+          WHEN passed_second_chamber = TRUE THEN 'Passed Both Chambers'
+          WHEN passed_first_chamber = TRUE THEN 'Passed One Chamber'
+          WHEN seriously_considered = TRUE THEN 'Seriously Considered'
+          WHEN introduced = TRUE THEN 'Introduced'
+          ELSE 'Unknown'
+        END AS status_category,
+
+        CASE
+          WHEN positive = TRUE THEN 'Positive'
+          WHEN neutral = TRUE THEN 'Neutral'
+          WHEN restrictive = TRUE THEN 'Restrictive'
+          ELSE 'Unclassified'
+        END AS intent,
+
+        -- intent_consolidated handles bills with multiple intent flags
+        CASE
+          WHEN (CAST(positive AS INT64) + CAST(neutral AS INT64) + CAST(restrictive AS INT64)) > 1 THEN 'Mixed'
+          WHEN positive = TRUE THEN 'Positive'
+          WHEN neutral = TRUE THEN 'Neutral'
+          WHEN restrictive = TRUE THEN 'Restrictive'
+          ELSE 'Unclassified'
+        END AS intent_consolidated,
+
+        abortion, contraception, emergency_contraception, minors, pregnancy, refusal, sex_education,
+        insurance, appropriations, fetal_issues, fetal_tissue, incarceration, period_products, stis,
+        legislation, resolution, ballot_initiative, constitutional_amendment, court_case,
+
+        (CAST(abortion AS INT64) + CAST(contraception AS INT64) + CAST(emergency_contraception AS INT64) +
+         CAST(minors AS INT64) + CAST(pregnancy AS INT64) + CAST(refusal AS INT64) + CAST(sex_education AS INT64) +
+         CAST(insurance AS INT64) + CAST(appropriations AS INT64) + CAST(fetal_issues AS INT64) +
+         CAST(fetal_tissue AS INT64) + CAST(incarceration AS INT64) + CAST(period_products AS INT64) +
+         CAST(stis AS INT64)) as policy_area_count,
+
+        CASE 
+          WHEN abortion = TRUE THEN 'Abortion'
+          WHEN contraception = TRUE THEN 'Contraception'
+          WHEN minors = TRUE THEN 'Minors'
+          WHEN sex_education = TRUE THEN 'Sex Education'
+          WHEN insurance = TRUE THEN 'Insurance'
+          WHEN pregnancy = TRUE THEN 'Pregnancy'
+          WHEN refusal = TRUE THEN 'Refusal'
+          WHEN appropriations = TRUE THEN 'Appropriations'
+          WHEN emergency_contraception = TRUE THEN 'Emergency Contraception'
+          WHEN fetal_issues = TRUE THEN 'Fetal Issues'
+          WHEN fetal_tissue = TRUE THEN 'Fetal Tissue'
+          WHEN incarceration = TRUE THEN 'Incarceration'
+          WHEN period_products = TRUE THEN 'Period Products'
+          WHEN stis = TRUE THEN 'STIs'
+          ELSE 'Other/Multiple'
+        END as primary_policy_area,
+
+        topic_1, topic_2, topic_3, topic_4, topic_5, topic_6, topic_7, topic_8, topic_9, topic_10,
+        COALESCE(topic_1, topic_2, topic_3, topic_4, topic_5, topic_6, topic_7, topic_8, topic_9, topic_10, 'No Topic') as primary_topic,
+
+        (CASE WHEN topic_1 IS NOT NULL AND topic_1 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_2 IS NOT NULL AND topic_2 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_3 IS NOT NULL AND topic_3 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_4 IS NOT NULL AND topic_4 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_5 IS NOT NULL AND topic_5 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_6 IS NOT NULL AND topic_6 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_7 IS NOT NULL AND topic_7 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_8 IS NOT NULL AND topic_8 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_9 IS NOT NULL AND topic_9 != '' THEN 1 ELSE 0 END +
+         CASE WHEN topic_10 IS NOT NULL AND topic_10 != '' THEN 1 ELSE 0 END) as topic_count,
+
+        migration_date, data_source,
+
+        CASE WHEN enacted = TRUE THEN TRUE ELSE FALSE END as is_successful,
+        CASE WHEN (dead = TRUE OR vetoed = TRUE) THEN TRUE ELSE FALSE END as is_failed,
+        CASE WHEN data_year >= 2020 THEN TRUE ELSE FALSE END as is_recent
+
+      FROM `{project_id}.{dataset_id}.all_historical_bills_unified`
+      WHERE state IS NOT NULL AND bill_number IS NOT NULL
+    )
+    SELECT 
+      *,
+      CASE 
+        WHEN policy_area_count >= 4 THEN 'Complex (4+ areas)'
+        WHEN policy_area_count = 3 THEN 'Medium (3 areas)'
+        WHEN policy_area_count = 2 THEN 'Simple (2 areas)'
+        WHEN policy_area_count = 1 THEN 'Single Focus'
+        ELSE 'No Focus Areas'
+      END as policy_complexity,
+
+      CASE WHEN (policy_area_count >= 3 AND topic_count >= 2) THEN TRUE ELSE FALSE END as is_high_activity_bill
+
+    FROM enhanced_bills
+    """
+
+
+def raw_data_tracking_view_sql(project_id: str, dataset_id: str) -> str:
+    """DDL for the view showing what fields were tracked each year"""
+    return f"""
+    CREATE OR REPLACE VIEW `{project_id}.{dataset_id}.raw_data_tracking_by_year` AS
+    SELECT 
+      data_year,
+      COUNT(*) as total_bills,
+
+      -- Basic data collection (should always be tracked)
+      SUM(CASE WHEN state IS NOT NULL THEN 1 ELSE 0 END) as has_state_data,
+      SUM(CASE WHEN bill_number IS NOT NULL THEN 1 ELSE 0 END) as has_bill_number_data,
+      SUM(CASE WHEN description IS NOT NULL THEN 1 ELSE 0 END) as has_description_data,
+      SUM(CASE WHEN history IS NOT NULL THEN 1 ELSE 0 END) as has_history_data,
+
+      -- Bill classification evolution
+      SUM(CASE WHEN bill_type IS NOT NULL THEN 1 ELSE 0 END) as has_bill_type_data,
+      SUM(CASE WHEN internal_summary IS NOT NULL THEN 1 ELSE 0 END) as has_internal_summary_data,
+      SUM(CASE WHEN notes IS NOT NULL THEN 1 ELSE 0 END) as has_notes_data,
+      SUM(CASE WHEN website_blurb IS NOT NULL THEN 1 ELSE 0 END) as has_website_blurb_data,
+
+      -- Date tracking evolution  
+      SUM(CASE WHEN introduced_date IS NOT NULL THEN 1 ELSE 0 END) as has_introduced_date_data,
+      SUM(CASE WHEN last_action_date IS NOT NULL THEN 1 ELSE 0 END) as has_last_action_date_data,
+      SUM(CASE WHEN effective_date IS NOT NULL THEN 1 ELSE 0 END) as has_effective_date_data,
+      SUM(CASE WHEN enacted_date IS NOT NULL THEN 1 ELSE 0 END) as has_enacted_date_data,
+
+      -- Policy category tracking (NULL = not tracked, TRUE/FALSE = tracked)
+      COUNTIF(abortion IS NOT NULL) as tracked_abortion_bills,
+      COUNTIF(abortion = TRUE) as marked_abortion_true,
+      COUNTIF(contraception IS NOT NULL) as tracked_contraception_bills,
+      COUNTIF(contraception = TRUE) as marked_contraception_true,
+      COUNTIF(minors IS NOT NULL) as tracked_minors_bills,
+      COUNTIF(minors = TRUE) as marked_minors_true,
+      COUNTIF(sex_education IS NOT NULL) as tracked_sex_education_bills,
+      COUNTIF(sex_education = TRUE) as marked_sex_education_true,
+      COUNTIF(insurance IS NOT NULL) as tracked_insurance_bills,
+      COUNTIF(insurance = TRUE) as marked_insurance_true,
+      COUNTIF(pregnancy IS NOT NULL) as tracked_pregnancy_bills,
+      COUNTIF(pregnancy = TRUE) as marked_pregnancy_true,
+      COUNTIF(emergency_contraception IS NOT NULL) as tracked_emergency_contraception_bills,
+      COUNTIF(emergency_contraception = TRUE) as marked_emergency_contraception_true,
+      COUNTIF(period_products IS NOT NULL) as tracked_period_products_bills,
+      COUNTIF(period_products = TRUE) as marked_period_products_true,
+      COUNTIF(incarceration IS NOT NULL) as tracked_incarceration_bills,
+      COUNTIF(incarceration = TRUE) as marked_incarceration_true,
+
+      -- Status field tracking (modern methodology post-2006)
+      COUNTIF(introduced IS NOT NULL) as tracked_introduced_status,
+      COUNTIF(introduced = TRUE) as marked_introduced_true,
+      COUNTIF(enacted IS NOT NULL) as tracked_enacted_status,
+      COUNTIF(enacted = TRUE) as marked_enacted_true,
+      COUNTIF(vetoed IS NOT NULL) as tracked_vetoed_status,
+      COUNTIF(vetoed = TRUE) as marked_vetoed_true,
+      COUNTIF(dead IS NOT NULL) as tracked_dead_status,
+      COUNTIF(dead = TRUE) as marked_dead_true,
+      COUNTIF(pending IS NOT NULL) as tracked_pending_status,
+      COUNTIF(pending = TRUE) as marked_pending_true,
+
+      -- Intent classification tracking
+      COUNTIF(positive IS NOT NULL) as tracked_positive_intent,
+      COUNTIF(positive = TRUE) as marked_positive_true,
+      COUNTIF(neutral IS NOT NULL) as tracked_neutral_intent,
+      COUNTIF(neutral = TRUE) as marked_neutral_true,
+      COUNTIF(restrictive IS NOT NULL) as tracked_restrictive_intent,
+      COUNTIF(restrictive = TRUE) as marked_restrictive_true,
+
+      -- Calculate tracking percentages for key fields
+      ROUND(SUM(CASE WHEN bill_type IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*) * 100, 1) as bill_type_tracking_pct,
+      ROUND(SUM(CASE WHEN introduced_date IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*) * 100, 1) as introduced_date_tracking_pct,
+      ROUND(COUNTIF(abortion IS NOT NULL) / COUNT(*) * 100, 1) as abortion_tracking_pct,
+      ROUND(COUNTIF(contraception IS NOT NULL) / COUNT(*) * 100, 1) as contraception_tracking_pct,
+      ROUND(COUNTIF(positive IS NOT NULL) / COUNT(*) * 100, 1) as intent_tracking_pct,
+
+      -- Calculate marking percentages (when tracked, what % was marked TRUE)
+      CASE 
+        WHEN COUNTIF(abortion IS NOT NULL) > 0 
+        THEN ROUND(COUNTIF(abortion = TRUE) / COUNTIF(abortion IS NOT NULL) * 100, 1)
+        ELSE NULL 
+      END as abortion_true_rate_when_tracked,
+
+      CASE 
+        WHEN COUNTIF(contraception IS NOT NULL) > 0 
+        THEN ROUND(COUNTIF(contraception = TRUE) / COUNTIF(contraception IS NOT NULL) * 100, 1)
+        ELSE NULL 
+      END as contraception_true_rate_when_tracked,
+
+      CASE 
+        WHEN COUNTIF(introduced IS NOT NULL) > 0 
+        THEN ROUND(COUNTIF(introduced = TRUE) / COUNTIF(introduced IS NOT NULL) * 100, 1)
+        ELSE NULL 
+      END as introduced_true_rate_when_tracked,
+
+      CASE 
+        WHEN COUNTIF(enacted IS NOT NULL) > 0 
+        THEN ROUND(COUNTIF(enacted = TRUE) / COUNTIF(enacted IS NOT NULL) * 100, 1)
+        ELSE NULL 
+      END as enacted_true_rate_when_tracked
+
+    FROM `{project_id}.{dataset_id}.all_historical_bills_unified`
+    GROUP BY data_year
+    ORDER BY data_year
+    """
+
+
+def analytics_statements(project_id: str, dataset_id: str,
+                         path: Path = ANALYTICS_SQL_FILE) -> Optional[List[str]]:
+    """Statements from sql/state_year_analytics.sql with placeholders filled, or None if missing"""
+    if not path.exists():
+        return None
+
+    with open(path) as f:
+        analytics_sql = f.read()
+
+    analytics_sql = analytics_sql.replace("{{ project_id }}", project_id)
+    analytics_sql = analytics_sql.replace("{{ dataset_id }}", dataset_id)
+
+    return [stmt.strip() for stmt in analytics_sql.split(';') if stmt.strip()]
+
+
+# (column, label) in the order of comprehensive_bills_authentic's primary_policy_area
+POLICY_AREAS = [
+    ('abortion', 'Abortion'),
+    ('contraception', 'Contraception'),
+    ('minors', 'Minors'),
+    ('sex_education', 'Sex Education'),
+    ('insurance', 'Insurance'),
+    ('pregnancy', 'Pregnancy'),
+    ('refusal', 'Refusal'),
+    ('appropriations', 'Appropriations'),
+    ('emergency_contraception', 'Emergency Contraception'),
+    ('fetal_issues', 'Fetal Issues'),
+    ('fetal_tissue', 'Fetal Tissue'),
+    ('incarceration', 'Incarceration'),
+    ('period_products', 'Period Products'),
+    ('stis', 'STIs'),
+]
+ALL_BILLS = 'All Bills'
+
+
+def aggregate_cube_sql(source_table: str, years: Optional[List[int]] = None) -> str:
+    """
+    SELECT rolling bills up by data_year, state, policy_area, intent and status
+
+    A bill is counted once under every policy area it is flagged for and once
+    under 'All Bills', so state/year totals must filter on policy_area =
+    'All Bills'. Intent and status use the comprehensive view's labels.
+
+    Args:
+        source_table: Fully qualified row-level table (the materialized table)
+        years: Only aggregate these data_years
+    """
+    area_flags = ",\n          ".join(
+        f"IF({column}, '{label}', NULL)" for column, label in POLICY_AREAS
+    )
+    where = f"WHERE data_year IN ({', '.join(str(year) for year in sorted(set(years)))})" if years else ""
+    return f"""
+    WITH bills AS (
+      SELECT
+        data_year,
+        state,
+        CASE
+          WHEN (CAST(positive AS INT64) + CAST(neutral AS INT64) + CAST(restrictive AS INT64)) > 1 THEN 'Mixed'
+          WHEN positive = TRUE THEN 'Positive'
+          WHEN neutral = TRUE THEN 'Neutral'
+          WHEN restrictive = TRUE THEN 'Restrictive'
+          ELSE 'Unclassified'
+        END AS intent,
+        CASE
+          WHEN enacted = TRUE THEN 'Enacted'
+          WHEN vetoed = TRUE THEN 'Vetoed'
+          WHEN dead = TRUE THEN 'Dead'
+          WHEN pending = TRUE THEN 'Pending'
+          WHEN passed_second_chamber = TRUE THEN 'Passed Both Chambers'
+          WHEN passed_first_chamber = TRUE THEN 'Passed One Chamber'
+          WHEN seriously_considered = TRUE THEN 'Seriously Considered'
+          WHEN introduced = TRUE THEN 'Introduced'
+          ELSE 'Unknown'
+        END AS status_category,
+        positive, neutral, restrictive, enacted,
+        ARRAY_CONCAT(['{ALL_BILLS}'], ARRAY(
+          SELECT area FROM UNNEST([
+          {area_flags}
+          ]) AS area
+          WHERE area IS NOT NULL
+        )) AS policy_areas
+      FROM `{source_table}`
+      {where}
+    )
+    SELECT
+      data_year,
+      state,
+      policy_area,
+      intent,
+      status_category,
+      COUNT(*) AS bill_count,
+      COUNTIF(positive) AS positive_count,
+      COUNTIF(neutral) AS neutral_count,
+      COUNTIF(restrictive) AS restrictive_count,
+      COUNTIF(enacted) AS enacted_count
+    FROM bills, UNNEST(policy_areas) AS policy_area
+    GROUP BY data_year, state, policy_area, intent, status_category
+    """
+
+
+def packed_flags_sql(source_table: str, years: Optional[List[int]] = None) -> str:
+    """SELECT of bill keys with the boolean flags packed into bitmasks (see policy_flags)"""
+    where = f"WHERE data_year IN ({', '.join(str(year) for year in sorted(set(years)))})" if years else ""
+    return f"""
+    SELECT
+      id, data_year, state, bill_number,
+      {pack_flags_sql()}
+    FROM `{source_table}`
+    {where}
+    """
+
+
+def unpacked_flags_view_sql(project_id: str, dataset_id: str) -> str:
+    """DDL for the view restoring the boolean columns from bill_flags_packed"""
+    return f"""
+    CREATE OR REPLACE VIEW `{project_id}.{dataset_id}.bill_flags_unpacked` AS
+    SELECT
+      id, data_year, state, bill_number, policy_flags, policy_flags_null,
+      {unpack_flags_sql()}
+    FROM `{project_id}.{dataset_id}.bill_flags_packed`
+    """
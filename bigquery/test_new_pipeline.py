@@ -14,6 +14,7 @@ Usage:
 """
 
 import sys
+import subprocess
 import pandas as pd
 from pathlib import Path
 import json
@@ -179,6 +180,54 @@ def test_full_pipeline_dry_run():
         Path(data_path).unlink()
 
 
+# Modules that must stay out of CSV runs and --help until actually needed
+HEAVY_MODULES = ('google.cloud', 'requests')
+
+
+def measure_import_time(code: str = None, args: list = None) -> dict:
+    """
+    Run code (or a script) under `python -X importtime`
+
+    Returns:
+        Module name -> (cumulative microseconds, nesting depth)
+    """
+    command = [sys.executable, '-X', 'importtime'] + (['-c', code] if code else []) + (args or [])
+    result = subprocess.run(
+        command, capture_output=True, text=True, cwd=Path(__file__).parent
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        depth = len(module) - len(module.lstrip())
+        timings[module.strip()] = (int(cumulative), depth)
+    return timings
+
+
+def test_import_time():
+    """Check lazy imports keep BigQuery/requests out of startup"""
+    print("\n=== Testing Import Time ===")
+    
+    cases = {
+        'import etl': ('import etl', None),
+        'CSV pipeline setup': ('from etl import Pipeline; '
+                               'from etl.extractors import ExtractorFactory; '
+                               'ExtractorFactory.get_class("csv")', None),
+        'run_pipeline.py --help': (None, ['run_pipeline.py', '--help']),
+    }
+    
+    for name, (code, args) in cases.items():
+        timings = measure_import_time(code, args)
+        assert timings, f"{name} failed to run"
+        heavy = sorted(m for m in timings if m.startswith(HEAVY_MODULES))
+        assert not heavy, f"{name} imported {heavy[:3]}"
+        # Top-level imports are the least indented entries
+        top = min(depth for _, depth in timings.values())
+        total_ms = sum(us for us, depth in timings.values() if depth == top) / 1000
+        print(f"✅ {name}: {total_ms:.0f} ms of imports, no BigQuery/requests")
+
+
 def validate_existing_setup():
     """Validate that existing migration still works"""
     print("\n=== Validating Existing Setup ===")
@@ -237,6 +286,9 @@ def main():
         # Test full pipeline
         test_full_pipeline_dry_run()
         
+        # Startup cost
+        test_import_time()
+        
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED - Pipeline ready for use!")
         print("=" * 60)
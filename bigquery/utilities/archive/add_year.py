@@ -9,6 +9,8 @@ Useful for adding new years (2025+) or updating existing years with new data.
 Usage:
     python add_year.py 2025                    # Add 2025 data
     python add_year.py 2024 --update           # Update existing 2024 data
+    python add_year.py 2024 --delta            # Apply only changed bills to 2024
+    python add_year.py 2025 --duplicates error # Fail on repeated bills
     python add_year.py 2025 --test             # Test before adding
 
 Prerequisites:
@@ -32,18 +34,23 @@ from google.cloud import exceptions as google_exceptions
 
 # Import the main migration class
 from migrate import GuttmacherMigration
+from etl.transformers.deduplicator import KEEP_OPTIONS
+from shared.bigquery_utils import refresh_aggregate_cube, refresh_materialized_table
 
 
 class YearlyDataPipeline(GuttmacherMigration):
     """Pipeline for adding single year's data to existing BigQuery dataset."""
     
-    def __init__(self, target_year: int):
+    def __init__(self, target_year: int, force: bool = False, duplicates: str = "latest"):
         """Initialize the yearly pipeline.
         
         Args:
             target_year: The year of data to add/update
+            force: Reload even if the harmonized content is unchanged
+            duplicates: How repeated state/bill_number/year rows are resolved
+                ('latest', 'first' or 'error' to fail the year)
         """
-        super().__init__()
+        super().__init__(force=force, duplicates=duplicates)
         self.target_year = target_year
         self.table_name = f"historical_bills_{target_year}"
         
@@ -103,12 +110,15 @@ class YearlyDataPipeline(GuttmacherMigration):
         except google_exceptions.NotFound:
             return False
             
-    def process_year(self, update_existing: bool = False, test_mode: bool = False) -> bool:
+    def process_year(self, update_existing: bool = False, test_mode: bool = False,
+                     delta: bool = False) -> bool:
         """Process a single year's data.
         
         Args:
             update_existing: If True, replace existing table data
             test_mode: If True, only test without uploading to BigQuery
+            delta: If True, apply only inserted/updated/deleted bills to the
+                existing table (implies update_existing)
             
         Returns:
             True if successful, False otherwise
@@ -120,7 +130,7 @@ class YearlyDataPipeline(GuttmacherMigration):
             
         # Check if table exists
         table_exists = self.check_table_exists()
-        if table_exists and not update_existing:
+        if table_exists and not (update_existing or delta):
             self.logger.error(f"Table {self.table_name} already exists. Use --update to replace.")
             return False
             
@@ -156,25 +166,55 @@ class YearlyDataPipeline(GuttmacherMigration):
             self.logger.info("Cleaning data for BigQuery")
             clean_df = self.clean_dataframe_for_bigquery(standardized_df)
             
+            # Duplicates would also make a delta load fall back to a full replace
+            clean_df, duplicates = self.deduplicator.deduplicate(clean_df)
+            self.stats["duplicates_removed"] += duplicates['removed']
+            if duplicates['removed']:
+                self.logger.info(f"Dropped {duplicates['removed']} duplicate rows "
+                                 f"for {duplicates['duplicate_keys']} bill keys")
+            
             if test_mode:
                 self.logger.info("TEST MODE - Data processing successful")
                 self.logger.info(f"Would upload {len(clean_df)} records to {self.table_name}")
                 self.logger.info(f"Sample columns: {list(clean_df.columns)[:10]}")
                 return True
                 
+            # Nothing to reload or refresh if the content is identical
+            if self.is_unchanged(clean_df, self.table_name):
+                self.logger.info(f"{self.target_year} data unchanged - skipping upload and view refresh")
+                return True
+                
+            if delta and table_exists:
+                self.logger.info(f"Computing delta against {self.table_name}")
+                report = self.delta_load_to_bigquery(clean_df, self.table_name)
+                if report is not None:
+                    if report['inserted'] or report['updated'] or report['deleted']:
+                        # Same tables and views, so only the materialized
+                        # partition for this year needs rewriting
+                        refresh_materialized_table(
+                            self.bq_client, self.project_id, years=[self.target_year],
+                            dataset_id=self.dataset_id, source_dataset_id=self.dataset_id
+                        )
+                        refresh_aggregate_cube(
+                            self.bq_client, self.project_id, years=[self.target_year],
+                            dataset_id=self.dataset_id
+                        )
+                    self.logger.info(f"Successfully applied {self.target_year} delta")
+                    return True
+                self.logger.info("Falling back to full table replace")
+                
             # Upload to BigQuery
             self.logger.info(f"Uploading to BigQuery table: {self.table_name}")
-            self.load_to_bigquery(clean_df, self.table_name)
+            if not self.load_to_bigquery(clean_df, self.table_name):
+                return False
             
             # Update unified views
             self.logger.info("Updating unified views and tracking")
-            self.create_unified_view()
-            self.create_looker_table()  # Creates comprehensive_bills_authentic
-            self.create_analytics_views()
+            self.create_unified_view(years=[self.target_year])
             
-            # Update raw data tracking view
-            self.logger.info("Updating raw data tracking view")
-            self.create_raw_data_tracking_view()
+            # comprehensive_bills_authentic, raw data tracking and analytics
+            # views, built concurrently where they don't depend on each other
+            self.create_post_migration_views()
             
             self.logger.info(f"Successfully processed {self.target_year} data")
             return True
@@ -234,6 +274,12 @@ def main():
                        help='Test mode - process data but do not upload')
     parser.add_argument('--validate', action='store_true',
                        help='Validate uploaded data')
+    parser.add_argument('--delta', action='store_true',
+                       help='Apply only changed bills to existing year data (MERGE)')
+    parser.add_argument('--force', action='store_true',
+                       help='Reload even if the data is unchanged')
+    parser.add_argument('--duplicates', choices=KEEP_OPTIONS, default='latest',
+                       help='Resolve repeated bills by keeping the latest or first row, or fail (default: latest)')
     
     args = parser.parse_args()
     
@@ -243,7 +289,7 @@ def main():
         sys.exit(1)
         
     # Initialize pipeline
-    pipeline = YearlyDataPipeline(args.year)
+    pipeline = YearlyDataPipeline(args.year, force=args.force, duplicates=args.duplicates)
     
     if args.validate:
         # Just validate existing data
@@ -253,7 +299,8 @@ def main():
     # Process the year
     success = pipeline.process_year(
         update_existing=args.update,
-        test_mode=args.test
+        test_mode=args.test,
+        delta=args.delta
     )
     
     if success and not args.test:
@@ -1,9 +1,16 @@
 from google.cloud import bigquery
 from dotenv import load_dotenv
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from shared.query_cache import QueryCache
+from shared.query_runner import QueryRunner
 
 load_dotenv()
 client = bigquery.Client(project=os.getenv('GCP_PROJECT_ID'))
+cache = QueryCache(QueryRunner(client))
 
 print("Analyzing RAW data availability by year - what was actually in each original database")
 print("=" * 90)
@@ -64,7 +71,7 @@ GROUP BY data_year
 ORDER BY data_year
 """.format(project=os.getenv('GCP_PROJECT_ID'))
 
-results = client.query(query).to_dataframe()
+results = cache.query(query, label="field availability by year")
 
 def analyze_field_availability(df, field_categories):
     for category_name, fields in field_categories.items():
@@ -1,9 +1,16 @@
 from google.cloud import bigquery
 from dotenv import load_dotenv
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from shared.query_cache import QueryCache
+from shared.query_runner import QueryRunner
 
 load_dotenv()
 client = bigquery.Client(project=os.getenv('GCP_PROJECT_ID'))
+cache = QueryCache(QueryRunner(client))
 
 print("📊 CHECKING COMPREHENSIVE BILLS TABLE FOR CSV EXPORT")
 print("=" * 70)
@@ -17,20 +24,19 @@ LIMIT 5
 
 print("🔍 Sample data from comprehensive_bills_authentic:")
 try:
-    results = client.query(query).result()
+    results = cache.query(query, label="comprehensive sample")
     
-    # Get column names from first row
-    first_row = next(iter(results), None)
-    if first_row:
-        columns = list(first_row.keys())
+    # Get column names from the sample
+    if not results.empty:
+        columns = list(results.columns)
         print(f"\n📋 Available columns ({len(columns)} total):")
         for i, col in enumerate(columns, 1):
             print(f"{i:2d}. {col}")
         
         # Get total count
         count_query = f"SELECT COUNT(*) as total FROM `{os.getenv('GCP_PROJECT_ID')}.legislative_tracker_historical.comprehensive_bills_authentic`"
-        count_result = client.query(count_query).result()
-        for row in count_result:
+        count_result = cache.query(count_query, label="comprehensive count")
+        for row in count_result.itertuples():
             print(f"\n📊 Total rows: {row.total:,}")
     
 except Exception as e:
@@ -45,18 +51,17 @@ except Exception as e:
     """
     
     try:
-        results2 = client.query(query2).result()
-        first_row2 = next(iter(results2), None)
-        if first_row2:
-            columns2 = list(first_row2.keys())
+        results2 = cache.query(query2, label="unified sample")
+        if not results2.empty:
+            columns2 = list(results2.columns)
             print(f"\n📋 all_historical_bills_unified columns ({len(columns2)} total):")
             for i, col in enumerate(columns2, 1):
                 print(f"{i:2d}. {col}")
             
             # Get total count
             count_query2 = f"SELECT COUNT(*) as total FROM `{os.getenv('GCP_PROJECT_ID')}.legislative_tracker_historical.all_historical_bills_unified`"
-            count_result2 = client.query(count_query2).result()
-            for row in count_result2:
+            count_result2 = cache.query(count_query2, label="unified count")
+            for row in count_result2.itertuples():
                 print(f"\n📊 Total rows: {row.total:,}")
     except Exception as e2:
         print(f"❌ Error accessing all_historical_bills_unified: {e2}")
@@ -1,17 +1,30 @@
 #!/usr/bin/env python3
 """
 Quick data checker for BigQuery tables
+
+Usage:
+    python utilities/check_data.py
+    python utilities/check_data.py --bill CA AB1234 [--year 2019]
 """
 
+import argparse
 import sys
-from google.cloud import bigquery
+from pathlib import Path
 from dotenv import load_dotenv
 import os
 
-def check_table(dataset_id, table_id):
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.bill_index import cached_bill_index
+from shared.bq_clients import get_client
+from shared.query_cache import QueryCache
+from shared.query_runner import QueryRunner, format_bytes
+
+def check_table(dataset_id, table_id, cache=None):
     """Check basic stats for a table"""
     load_dotenv()
-    client = bigquery.Client(project=os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))
+    if cache is None:
+        cache = QueryCache(QueryRunner(get_client(os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))))
+    client = cache.client
     
     try:
         # Get table info
@@ -33,8 +46,8 @@ def check_table(dataset_id, table_id):
         FROM `{table_ref}`
         """
         
-        result = client.query(query).result()
-        for row in result:
+        result = cache.query(query, label=f"{table_id} summary")
+        for row in result.itertuples():
             print(f"\n   Summary:")
             print(f"   - Total records: {row.total:,}")
             print(f"   - States: {row.states}")
@@ -44,17 +57,74 @@ def check_table(dataset_id, table_id):
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
+BILL_LOOKUP_COLUMNS = [
+    'id', 'data_year', 'state', 'bill_number', 'bill_type', 'description',
+    'introduced_date', 'last_action_date', 'enacted', 'vetoed', 'dead', 'pending',
+    'positive', 'neutral', 'restrictive',
+]
+
+
+def find_bill(state, bill_number, year=None, cache=None):
+    """Look a bill up in every year (or one) via the local bill index
+
+    The key columns of the unified view are fetched once through the query
+    cache; the index built over them is saved next to it and reused until a
+    year table changes.
+    """
+    load_dotenv()
+    if cache is None:
+        cache = QueryCache(QueryRunner(get_client(os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))))
+
+    query = f"""
+    SELECT {', '.join(BILL_LOOKUP_COLUMNS)}
+    FROM `{cache.client.project}.legislative_tracker_historical.all_historical_bills_unified`
+    """
+    versions = cache.table_versions(query) if cache.enabled else None
+    version = cache.cache_key(query, versions) if versions else None
+    index = cached_bill_index("all_historical_bills_unified", version,
+                              lambda: cache.query(query, label="bill index"))
+
+    matches = index.lookup(state, bill_number, year)
+    label = f"{state.upper()} {bill_number}" + (f" ({year})" if year else "")
+    if matches.empty:
+        print(f"❌ No bill {label} in {len(index):,} indexed bills")
+    else:
+        print(f"📄 {label}: {len(matches)} record(s)")
+        print(matches.drop(columns='bill_key').to_string(index=False))
+    return matches
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Quick data checker for BigQuery tables")
+    parser.add_argument("--bill", nargs=2, metavar=("STATE", "BILL_NUMBER"),
+                        help="Look up one bill across years instead of the table summary")
+    parser.add_argument("--year", type=int, help="Restrict --bill to one data year")
+    args = parser.parse_args()
+
+    if args.bill:
+        find_bill(*args.bill, year=args.year)
+        return
+
     print("🔍 BigQuery Data Checker")
     print("=" * 50)
     
+    load_dotenv()
+    client = get_client(os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))
+    runner = QueryRunner(client)
+    cache = QueryCache(runner)
+    
     # Check sandbox
     print("\n1️⃣ SANDBOX DATA:")
-    check_table('legislative_tracker_sandbox', 'bills_test')
+    check_table('legislative_tracker_sandbox', 'bills_test', cache)
     
     # Check production
     print("\n2️⃣ PRODUCTION DATA:")
-    check_table('legislative_tracker_historical', 'all_historical_bills_unified')
+    check_table('legislative_tracker_historical', 'all_historical_bills_unified', cache)
+    
+    usage = runner.summary()
+    print(f"\n💰 Query cost: {format_bytes(usage['bytes_billed'])} billed "
+          f"(~${usage['estimated_cost']:.4f})")
+    print(f"⚡ {cache.summary()}")
     
     print("\n" + "=" * 50)
     print("✅ Check complete")
@@ -4,14 +4,21 @@ Compare data between sandbox and production
 Useful for validating new pipeline results
 """
 
-from google.cloud import bigquery
 from dotenv import load_dotenv
 import os
+import sys
+from pathlib import Path
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.bq_clients import get_client
+from shared.query_cache import QueryCache
+from shared.query_runner import QueryRunner
+
 def compare_datasets():
     load_dotenv()
-    client = bigquery.Client(project=os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))
+    client = get_client(os.getenv('GCP_PROJECT_ID', 'guttmacher-legislative-tracker'))
+    cache = QueryCache(QueryRunner(client))
     
     print("📊 Dataset Comparison")
     print("=" * 60)
@@ -30,30 +37,32 @@ def compare_datasets():
     LIMIT 10
     """
     
+    # Precomputed rollups: reads one small partition instead of every bill
     prod_query = """
     SELECT 
         state,
-        COUNT(*) as bill_count,
-        SUM(CAST(intent_positive AS INT64)) as positive,
-        SUM(CAST(intent_restrictive AS INT64)) as restrictive  
-    FROM `legislative_tracker_historical.all_historical_bills_unified`
-    WHERE data_year = 2024 AND state IS NOT NULL
+        SUM(bill_count) as bill_count,
+        SUM(positive_count) as positive,
+        SUM(restrictive_count) as restrictive
+    FROM `legislative_tracker_historical.bill_aggregate_cube`
+    WHERE data_year = 2024 AND policy_area = 'All Bills' AND state IS NOT NULL
     GROUP BY state
     ORDER BY bill_count DESC
     LIMIT 10
     """
     
     print("\n🧪 SANDBOX (New Pipeline):")
-    sandbox_df = client.query(sandbox_query).to_dataframe()
+    sandbox_df = cache.query(sandbox_query, label="sandbox by state")
     print(sandbox_df.to_string())
     
     print("\n📦 PRODUCTION (2024 Data):")
     try:
-        prod_df = client.query(prod_query).to_dataframe()
+        prod_df = cache.query(prod_query, label="production by state")
         print(prod_df.to_string())
     except:
         print("   No 2024 data in production yet")
     
+    print(f"\n⚡ {cache.summary()}")
     print("\n" + "=" * 60)
     print("Use this to verify your new pipeline matches expected results")
 
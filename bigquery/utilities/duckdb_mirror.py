@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+LOCAL DUCKDB MIRROR
+===================
+
+Copies the harmonized year tables (or the local raw Parquet lake) into a
+DuckDB file and recreates the repo's views there, translated from
+BigQuery SQL, so one-off research questions run offline without paying
+BigQuery scan costs.
+
+Tables are copied with the tabledata API (no query, nothing billed) and
+only when BigQuery reports them modified since the last sync.
+
+Requires: pip install duckdb
+
+Usage:
+    python utilities/duckdb_mirror.py sync                  # harmonized tables + views
+    python utilities/duckdb_mirror.py sync --source lake    # raw lake, no BigQuery
+    python utilities/duckdb_mirror.py query "SELECT state, COUNT(*) FROM all_historical_bills_unified GROUP BY 1"
+    python utilities/duckdb_mirror.py query --file sql/2011_analysis_for_amy.sql
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.ddl_graph import created_object, strip_comments
+from shared.view_sql import (
+    analytics_statements,
+    comprehensive_view_sql,
+    raw_data_tracking_view_sql,
+    unified_view_sql,
+)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "legislative_mirror.duckdb"
+YEAR_TABLE_PATTERN = re.compile(r"^historical_bills_(\d{4})$")
+
+# BigQuery -> DuckDB rewrites for the constructs used in the repo's SQL
+TYPE_REWRITES = [
+    (re.compile(r"\bAS\s+INT64\b", re.IGNORECASE), "AS BIGINT"),
+    (re.compile(r"\bAS\s+FLOAT64\b", re.IGNORECASE), "AS DOUBLE"),
+    (re.compile(r"\bAS\s+STRING\b", re.IGNORECASE), "AS VARCHAR"),
+    (re.compile(r"\bAS\s+BOOL\b", re.IGNORECASE), "AS BOOLEAN"),
+    (re.compile(r"\bCOUNTIF\s*\(", re.IGNORECASE), "COUNT_IF("),
+    (re.compile(r"\bSAFE_CAST\s*\(", re.IGNORECASE), "TRY_CAST("),
+    (re.compile(r"\bREGEXP_CONTAINS\s*\(", re.IGNORECASE), "REGEXP_MATCHES("),
+    (re.compile(r"\bCURRENT_DATE\(\)", re.IGNORECASE), "CURRENT_DATE"),
+    (re.compile(r"\bCURRENT_TIMESTAMP\(\)", re.IGNORECASE), "CURRENT_TIMESTAMP"),
+    # r'...' raw strings
+    (re.compile(r"\br'"), "'"),
+]
+# DATE_DIFF(end, start, PART) -> DATE_DIFF('part', start, end)
+DATE_DIFF_PATTERN = re.compile(r"\bDATE_DIFF\s*\(\s*([^,()]+?)\s*,\s*([^,()]+?)\s*,\s*(\w+)\s*\)", re.IGNORECASE)
+# SAFE_DIVIDE(a, b) -> (a) / NULLIF(b, 0)
+SAFE_DIVIDE_PATTERN = re.compile(r"\bSAFE_DIVIDE\s*\(\s*([^,()]+?)\s*,\s*([^,()]+?)\s*\)", re.IGNORECASE)
+# FORMAT_DATE('%Y', d) -> STRFTIME(d, '%Y')
+FORMAT_DATE_PATTERN = re.compile(r"\bFORMAT_(?:DATE|TIMESTAMP)\s*\(\s*('[^']*')\s*,\s*([^,()]+?)\s*\)", re.IGNORECASE)
+# Table options DuckDB doesn't have, between CREATE TABLE name and AS
+CREATE_TABLE_HEADER_PATTERN = re.compile(r"^(\s*CREATE\s+(?:OR\s+REPLACE\s+)?TABLE\b.*?)(\bAS\b)",
+                                         re.IGNORECASE | re.DOTALL)
+LAYOUT_PATTERN = re.compile(r"\b(?:PARTITION\s+BY\s+.*?|CLUSTER\s+BY\s+.*?|OPTIONS\s*\(.*?\))(?=\s+(?:CLUSTER|OPTIONS|AS)\b|\s*$)",
+                            re.IGNORECASE | re.DOTALL)
+QUALIFIED_NAME_PATTERN = re.compile(r"`(?:[\w-]+\.)?[\w-]+\.([\w-]+)`")
+
+
+def translate_sql(sql: str) -> str:
+    """
+    Rewrite BigQuery SQL for DuckDB
+
+    Covers what the repo's views and analysis files use: backticked
+    project.dataset.table names become local table names, BigQuery types
+    and functions are mapped to their DuckDB equivalents and table layout
+    options are dropped.
+    """
+    sql = strip_comments(sql)
+    sql = QUALIFIED_NAME_PATTERN.sub(r"\1", sql)
+    for pattern, replacement in TYPE_REWRITES:
+        sql = pattern.sub(replacement, sql)
+    sql = DATE_DIFF_PATTERN.sub(lambda m: f"DATE_DIFF('{m.group(3).lower()}', {m.group(2)}, {m.group(1)})", sql)
+    sql = SAFE_DIVIDE_PATTERN.sub(r"((\1) / NULLIF(\2, 0))", sql)
+    sql = FORMAT_DATE_PATTERN.sub(r"STRFTIME(\2, \1)", sql)
+    sql = CREATE_TABLE_HEADER_PATTERN.sub(lambda m: LAYOUT_PATTERN.sub("", m.group(1)) + m.group(2), sql, count=1)
+    return sql.strip().rstrip(";")
+
+
+def split_statements(sql: str) -> list:
+    """Split a SQL file into statements (comments removed)"""
+    return [stmt.strip() for stmt in strip_comments(sql).split(";") if stmt.strip()]
+
+
+def connect(db_path: Path = None, read_only: bool = False):
+    """Open the mirror database"""
+    try:
+        import duckdb
+    except ImportError:
+        raise SystemExit("❌ duckdb is not installed. Install: pip install duckdb")
+
+    db_path = Path(db_path or os.getenv("DUCKDB_MIRROR_PATH") or DEFAULT_DB_PATH)
+    if read_only and not db_path.exists():
+        raise SystemExit(f"❌ No mirror at {db_path}. Run: python utilities/duckdb_mirror.py sync")
+    return duckdb.connect(str(db_path), read_only=read_only)
+
+
+def sync_tracking(con):
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS _mirror_sync (
+        table_name VARCHAR PRIMARY KEY,
+        source VARCHAR,
+        modified VARCHAR,
+        row_count BIGINT,
+        synced_at TIMESTAMP
+    )
+    """)
+    return {row[0]: row[1] for row in con.execute("SELECT table_name, modified FROM _mirror_sync").fetchall()}
+
+
+def record_sync(con, table_name: str, source: str, modified: str, rows: int):
+    con.execute("DELETE FROM _mirror_sync WHERE table_name = ?", [table_name])
+    con.execute("INSERT INTO _mirror_sync VALUES (?, ?, ?, ?, ?)",
+                [table_name, source, modified, rows, datetime.now()])
+
+
+def sync_from_bigquery(con, project_id: str, dataset_id: str, years: list = None,
+                       force: bool = False) -> list:
+    """Copy changed historical_bills_YYYY tables; returns the mirrored table names"""
+    from shared.bq_clients import get_client
+
+    client = get_client(project_id)
+    synced = sync_tracking(con)
+
+    tables = []
+    for item in client.list_tables(f"{project_id}.{dataset_id}"):
+        match = YEAR_TABLE_PATTERN.match(item.table_id)
+        if match and item.table_type == "TABLE" and (not years or int(match.group(1)) in years):
+            tables.append(item.table_id)
+
+    for table_id in sorted(tables):
+        table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
+        modified = table.modified.isoformat() if table.modified else ""
+        if not force and synced.get(table_id) == modified:
+            print(f"  ⏭️ {table_id}: unchanged")
+            continue
+
+        # tabledata.list is free; the Storage Read API would be billed
+        arrow_table = client.list_rows(table).to_arrow(create_bqstorage_client=False)
+        con.register("_incoming", arrow_table)
+        con.execute(f'CREATE OR REPLACE TABLE "{table_id}" AS SELECT * FROM _incoming')
+        con.unregister("_incoming")
+        record_sync(con, table_id, "bigquery", modified, arrow_table.num_rows)
+        print(f"  ✅ {table_id}: {arrow_table.num_rows:,} rows")
+
+    return [name for (name,) in con.execute(
+        "SELECT table_name FROM _mirror_sync WHERE source = 'bigquery' ORDER BY table_name"
+    ).fetchall()]
+
+
+def sync_from_lake(con, years: list = None, force: bool = False) -> list:
+    """Copy raw lake partitions as raw_historical_YYYY tables plus a raw_lake view"""
+    from shared.raw_lake import PART_FILE, lake_dir, lake_years, partition_path
+
+    synced = sync_tracking(con)
+    mirrored = []
+    for year in lake_years():
+        if years and year not in years:
+            continue
+        path = partition_path(year) / PART_FILE
+        modified = str(path.stat().st_mtime_ns)
+        table_id = f"raw_historical_{year}"
+        mirrored.append(table_id)
+        if not force and synced.get(table_id) == modified:
+            print(f"  ⏭️ {table_id}: unchanged")
+            continue
+
+        con.execute(f'CREATE OR REPLACE TABLE "{table_id}" AS SELECT * FROM read_parquet(?)', [str(path)])
+        rows = con.execute(f'SELECT COUNT(*) FROM "{table_id}"').fetchone()[0]
+        record_sync(con, table_id, "lake", modified, rows)
+        print(f"  ✅ {table_id}: {rows:,} rows")
+
+    # Every year at once, columns aligned by name
+    con.execute(f"""
+    CREATE OR REPLACE VIEW raw_lake AS
+    SELECT * FROM read_parquet('{lake_dir() / "year=*" / PART_FILE}', hive_partitioning = true, union_by_name = true)
+    """)
+    return mirrored
+
+
+def create_views(con, project_id: str, dataset_id: str, year_tables: list) -> list:
+    """Recreate the unified, comprehensive, tracking and analytics views locally"""
+    if not year_tables:
+        return []
+
+    # Year tables drift in columns; BY NAME lines them up like BigQuery's SELECT *
+    unified = translate_sql(unified_view_sql(project_id, dataset_id, year_tables))
+    unified = unified.replace(" UNION ALL ", " UNION ALL BY NAME ")
+    statements = [
+        ("all_historical_bills_unified", unified),
+        ("comprehensive_bills_authentic", translate_sql(comprehensive_view_sql(project_id, dataset_id))),
+        ("raw_data_tracking_by_year", translate_sql(raw_data_tracking_view_sql(project_id, dataset_id))),
+    ]
+    analytics = analytics_statements(project_id, dataset_id) or []
+    statements.extend((f"analytics statement {i + 1}/{len(analytics)}", translate_sql(stmt))
+                      for i, stmt in enumerate(analytics))
+
+    created = []
+    for label, sql in statements:
+        try:
+            con.execute(sql)
+            created.append(label)
+        except Exception as e:
+            print(f"  ⚠️ {label} not created locally: {e}")
+    return created
+
+
+def run_query(con, sql: str):
+    """Translate and run one or more statements, printing each result"""
+    for statement in split_statements(sql):
+        start = time.perf_counter()
+        result = con.execute(translate_sql(statement))
+        elapsed = (time.perf_counter() - start) * 1000
+        name = created_object(statement)
+        if name:
+            print(f"✅ Created {name.split('.')[-1]} ({elapsed:.0f} ms)")
+            continue
+        if result.description:
+            print(result.df().to_string(index=False))
+        print(f"⚡ {elapsed:.0f} ms")
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Local DuckDB mirror of the historical dataset")
+    parser.add_argument("--db", help="DuckDB file (env: DUCKDB_MIRROR_PATH, default bigquery/legislative_mirror.duckdb)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser("sync", help="Copy tables and recreate views")
+    sync.add_argument("--source", choices=["bigquery", "lake"], default="bigquery",
+                      help="Harmonized tables from BigQuery, or the local raw Parquet lake")
+    sync.add_argument("--years", type=int, nargs="*", help="Only these years")
+    sync.add_argument("--force", action="store_true", help="Copy tables even if unchanged")
+
+    query = commands.add_parser("query", help="Run BigQuery-style SQL against the mirror")
+    query.add_argument("sql", nargs="?", help="SQL to run")
+    query.add_argument("--file", help="SQL file to run (statements separated by ;)")
+
+    args = parser.parse_args()
+
+    project_id = os.getenv("GCP_PROJECT_ID", "guttmacher-legislative-tracker")
+    dataset_id = os.getenv("BQ_DATASET_ID", "legislative_tracker_historical")
+
+    if args.command == "sync":
+        con = connect(args.db)
+        print(f"🦆 Syncing {args.source} → DuckDB mirror")
+        if args.source == "bigquery":
+            year_tables = sync_from_bigquery(con, project_id, dataset_id, args.years, args.force)
+            created = create_views(con, project_id, dataset_id, year_tables)
+            print(f"✅ {len(year_tables)} year tables, {len(created)} views")
+        else:
+            mirrored = sync_from_lake(con, args.years, args.force)
+            print(f"✅ {len(mirrored)} raw year tables + raw_lake view")
+        con.close()
+        return 0
+
+    if not args.sql and not args.file:
+        parser.error("query needs SQL or --file")
+    sql = Path(args.file).read_text() if args.file else args.sql
+    con = connect(args.db, read_only=not args.file)
+    try:
+        run_query(con, sql)
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        con.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
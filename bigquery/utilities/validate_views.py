@@ -7,131 +7,221 @@ Validates that BigQuery views are up-to-date and functioning properly.
 Views in BigQuery automatically recalculate when underlying data changes,
 but this script helps verify they're working and current.
 
+The default check reads table metadata once (__TABLES__ and
+INFORMATION_SCHEMA.VIEWS) and dry-runs each view, so it scans no data.
+--detailed adds exact counts from one batched query per check, run in
+parallel.
+
 Usage:
     python validate_views.py                    # Check all views
     python validate_views.py --detailed         # Show detailed breakdown
 """
 
-from google.cloud import bigquery
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.bq_clients import get_client
+from shared.query_runner import QueryRunner, format_bytes
+
+# Essential views to check
+ESSENTIAL_VIEWS = [
+    'all_historical_bills_unified',
+    'comprehensive_bills_authentic',
+    'raw_data_tracking_by_year'
+]
+
+
+def load_dataset_metadata(runner: QueryRunner, project_id: str, dataset_id: str):
+    """Read table stats and view definitions for the whole dataset at once"""
+    tables_query = f"""
+    SELECT
+        table_id,
+        type,
+        row_count,
+        size_bytes,
+        TIMESTAMP_MILLIS(creation_time) AS created,
+        TIMESTAMP_MILLIS(last_modified_time) AS last_modified
+    FROM `{project_id}.{dataset_id}.__TABLES__`
+    """
+
+    views_query = f"""
+    SELECT table_name, view_definition
+    FROM `{project_id}.{dataset_id}.INFORMATION_SCHEMA.VIEWS`
+    """
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tables_future = executor.submit(runner.run, tables_query, label="__TABLES__")
+        views_future = executor.submit(runner.run, views_query, label="INFORMATION_SCHEMA.VIEWS")
+        tables = {row.table_id: row for row in tables_future.result()}
+        view_definitions = {row.table_name: row.view_definition for row in views_future.result()}
+
+    return tables, view_definitions
+
+
+def view_stats_query(project_id: str, dataset_id: str, view_names: list) -> str:
+    """One UNION ALL query computing exact stats for every view"""
+    parts = [f"""
+    SELECT
+        '{view_name}' AS view_name,
+        COUNT(*) as total_bills,
+        COUNT(DISTINCT data_year) as years_covered,
+        MIN(data_year) as earliest_year,
+        MAX(data_year) as latest_year
+    FROM `{project_id}.{dataset_id}.{view_name}`
+    """ for view_name in view_names]
+    return " UNION ALL ".join(parts)
 
-def validate_views():
+
+def validate_views(detailed: bool = False):
     load_dotenv()
-    client = bigquery.Client(project=os.getenv('GCP_PROJECT_ID'))
+    project_id = os.getenv('GCP_PROJECT_ID')
+    client = get_client(project_id)
+    runner = QueryRunner(client)
     dataset_id = "legislative_tracker_historical"
-    
+
     print("🔍 BIGQUERY VIEW VALIDATION")
     print("=" * 50)
     print(f"Dataset: {dataset_id}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
-    
-    # Essential views to check
-    essential_views = [
-        'all_historical_bills_unified',
-        'comprehensive_bills_authentic', 
-        'raw_data_tracking_by_year'
-    ]
-    
-    # Get all tables/views in dataset
-    dataset_ref = client.dataset(dataset_id)
-    all_objects = list(client.list_tables(dataset_ref))
-    
-    # Separate tables and views
-    data_tables = [obj for obj in all_objects if obj.table_type == "BASE TABLE" and obj.table_id.startswith('historical_bills_')]
-    views = [obj for obj in all_objects if obj.table_type == "VIEW"]
-    
+
+    # Get all tables/views in dataset (type 1 = table, 2 = view)
+    tables, view_definitions = load_dataset_metadata(runner, project_id, dataset_id)
+
+    year_tables = {
+        int(table_id.split('_')[-1]): row for table_id, row in tables.items()
+        if row.type == 1 and table_id.startswith('historical_bills_') and table_id.split('_')[-1].isdigit()
+    }
+    views = [table_id for table_id, row in tables.items() if row.type == 2]
+
     print(f"📊 DATASET OVERVIEW:")
-    print(f"  Data tables: {len(data_tables)} (historical_bills_YYYY)")
+    print(f"  Data tables: {len(year_tables)} (historical_bills_YYYY)")
     print(f"  Views: {len(views)}")
     print()
-    
+
     # Check if views automatically update
     print(f"🔄 VIEW AUTO-UPDATE STATUS:")
     print(f"  ✅ BigQuery views are LIVE - they automatically recalculate when data changes")
     print(f"  ✅ No manual refresh needed - views always show current data")
     print(f"  ✅ Views update in real-time when tables are modified")
     print()
-    
+
+    # Latest table by creation time, from the metadata already loaded
+    latest_table_year = None
+    if year_tables:
+        latest_table_year = max(year_tables, key=lambda year: year_tables[year].created)
+
+    existing_views = [name for name in ESSENTIAL_VIEWS if name in tables]
+
+    # Dry runs validate each view compiles without scanning any data
+    def check_view(view_name):
+        try:
+            runner.dry_run(f"SELECT * FROM `{project_id}.{dataset_id}.{view_name}`")
+            return None
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(ESSENTIAL_VIEWS)) as executor:
+        view_errors = dict(zip(existing_views, executor.map(check_view, existing_views)))
+
+        working_views = [name for name in existing_views if view_errors[name] is None]
+
+        stats_future = None
+        freshness_future = None
+        if detailed and working_views:
+            stats_future = executor.submit(
+                runner.run, view_stats_query(project_id, dataset_id, working_views),
+                label="essential view stats"
+            )
+            freshness_future = executor.submit(runner.run, f"""
+            SELECT
+                data_year,
+                COUNT(*) as bills,
+                MAX(migration_date) as last_migration
+            FROM `{project_id}.{dataset_id}.all_historical_bills_unified`
+            GROUP BY data_year
+            ORDER BY data_year DESC
+            LIMIT 5
+            """, label="freshness")
+
+    view_stats = {}
+    if stats_future:
+        try:
+            view_stats = {row.view_name: row for row in stats_future.result()}
+        except Exception as e:
+            print(f"❌ Error computing view stats: {e}")
+
+    # Cached counts from table metadata
+    cached_total = sum(row.row_count for row in year_tables.values())
+
     # Validate essential views exist and work
     print(f"🎯 ESSENTIAL VIEW VALIDATION:")
-    
-    for view_name in essential_views:
+
+    for view_name in ESSENTIAL_VIEWS:
         print(f"\n📋 {view_name}:")
-        
-        try:
-            # Check if view exists
-            view_ref = client.dataset(dataset_id).table(view_name)
-            view = client.get_table(view_ref)
-            print(f"  ✅ Exists: {view.table_type}")
-            
-            # Test the view with a simple query
-            test_query = f"""
-            SELECT 
-                COUNT(*) as total_bills,
-                COUNT(DISTINCT data_year) as years_covered,
-                MIN(data_year) as earliest_year,
-                MAX(data_year) as latest_year
-            FROM `{os.getenv('GCP_PROJECT_ID')}.{dataset_id}.{view_name}`
-            """
-            
-            result = client.query(test_query).result()
-            row = next(result)
-            
+
+        if view_name not in tables:
+            print(f"  ❌ Error: view not found")
+            continue
+
+        print(f"  ✅ Exists: {'VIEW' if tables[view_name].type == 2 else 'TABLE'}")
+
+        if view_errors.get(view_name) is not None:
+            print(f"  ❌ Error: {view_errors[view_name]}")
+            continue
+
+        if view_name in view_stats:
+            row = view_stats[view_name]
             print(f"  ✅ Functional: {row.total_bills:,} bills across {row.years_covered} years")
             print(f"  📅 Range: {row.earliest_year} - {row.latest_year}")
-            
-            # Check if view includes latest data
-            latest_table_query = f"""
-            SELECT table_name, EXTRACT(YEAR FROM creation_time) as created_year
-            FROM `{os.getenv('GCP_PROJECT_ID')}.{dataset_id}.INFORMATION_SCHEMA.TABLES`
-            WHERE table_name LIKE 'historical_bills_%'
-            ORDER BY creation_time DESC
-            LIMIT 1
-            """
-            
-            latest_result = client.query(latest_table_query).result()
-            latest_row = next(latest_result)
-            latest_table_year = int(latest_row.table_name.split('_')[-1])
-            
-            if row.latest_year >= latest_table_year:
-                print(f"  ✅ Current: Includes latest table data ({latest_table_year})")
-            else:
-                print(f"  ⚠️ Outdated: Missing data from {latest_table_year}")
-                
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-    
+            includes_latest = latest_table_year is None or row.latest_year >= latest_table_year
+        else:
+            print(f"  ✅ Functional: query validates (~{cached_total:,} bills in {len(year_tables)} year tables)")
+            if year_tables:
+                print(f"  📅 Range: {min(year_tables)} - {max(year_tables)}")
+            # Views built on the unified view inherit its year coverage
+            definition = view_definitions.get('all_historical_bills_unified', '')
+            includes_latest = latest_table_year is None or f"historical_bills_{latest_table_year}" in definition
+
+        # Check if view includes latest data
+        if includes_latest:
+            print(f"  ✅ Current: Includes latest table data ({latest_table_year})")
+        else:
+            print(f"  ⚠️ Outdated: Missing data from {latest_table_year}")
+
     # Check for any orphaned views
     print(f"\n🧹 ORPHANED VIEW CHECK:")
     for view in views:
-        if view.table_id not in essential_views:
-            print(f"  ⚠️ Extra view: {view.table_id} (may be outdated)")
-    
+        if view not in ESSENTIAL_VIEWS:
+            print(f"  ⚠️ Extra view: {view} (may be outdated)")
+
     # Data freshness check
     print(f"\n📅 DATA FRESHNESS:")
-    
-    freshness_query = f"""
-    SELECT 
-        data_year,
-        COUNT(*) as bills,
-        MAX(migration_date) as last_migration
-    FROM `{os.getenv('GCP_PROJECT_ID')}.{dataset_id}.all_historical_bills_unified`
-    GROUP BY data_year
-    ORDER BY data_year DESC
-    LIMIT 5
-    """
-    
-    try:
-        result = client.query(freshness_query).result()
+
+    if freshness_future:
+        try:
+            result = freshness_future.result()
+            print(f"  Most recent years:")
+            for row in result:
+                print(f"    {row.data_year}: {row.bills:,} bills (migrated: {row.last_migration})")
+        except Exception as e:
+            print(f"  ❌ Error checking freshness: {e}")
+    else:
         print(f"  Most recent years:")
-        for row in result:
-            print(f"    {row.data_year}: {row.bills:,} bills (migrated: {row.last_migration})")
-    except Exception as e:
-        print(f"  ❌ Error checking freshness: {e}")
-    
+        for year in sorted(year_tables, reverse=True)[:5]:
+            row = year_tables[year]
+            print(f"    {year}: {row.row_count:,} bills (loaded: {row.last_modified:%Y-%m-%d})")
+
+    usage = runner.summary()
+    print(f"\n💰 QUERY COST: {usage['statements']} queries, "
+          f"{format_bytes(usage['bytes_billed'])} billed (~${usage['estimated_cost']:.4f})")
+
     print(f"\n✅ VALIDATION COMPLETE")
     print("=" * 50)
     print(f"💡 REMEMBER: Views automatically update when data changes!")
@@ -139,4 +229,8 @@ def validate_views():
     print(f"💡 Views will instantly include new data once tables are updated")
 
 if __name__ == "__main__":
-    validate_views()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Validate BigQuery views")
+    parser.add_argument("--detailed", action="store_true",
+                        help="Exact counts per view (scans the views)")
+    args = parser.parse_args()
+    validate_views(detailed=args.detailed)